@@ -0,0 +1,518 @@
+import argparse
+import json
+import random
+import resource
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from wordleiscious import entropy, minimax, model
+from wordleiscious.kernels import available_kernels, kernel
+from wordleiscious.opening_book import OpeningBook
+from wordleiscious.outcome import scalar_outcome_after_guess
+from wordleiscious.pattern_table import pattern_table
+from wordleiscious.score_cache import SCORE_CACHE
+from wordleiscious.simulate import simulate
+from wordleiscious.worst_case import worst_case
+from wordleiscious.words import all_words, answers, word_weights
+
+MAX_GUESSES = 6
+SOLVED = "🟩🟩🟩🟩🟩"
+
+# From starting a fresh interpreter to the solver's second guess, with the
+# pattern table and vocabulary bundle already built on disk.
+COLD_START_TARGET_SECONDS = 1.0
+
+COLD_START_SCRIPT = """
+import json, sys
+from wordleiscious.benchmark import STRATEGIES
+from wordleiscious.outcome import scalar_outcome_after_guess
+strategy, first_guess, solution = sys.argv[1:]
+solver = STRATEGIES[strategy]()
+outcome = scalar_outcome_after_guess(candidate=solution, guess=first_guess)
+guess = solver.with_guess(guess=first_guess, outcome=outcome).guess()
+heavy = [m for m in ("pandas", "pyarrow", "tqdm", "colorama") if m in sys.modules]
+json.dump({"guess": guess, "heavy_imports": heavy}, sys.stdout)
+"""
+
+
+def entropy_solver():
+    return entropy.Solver.from_candidates_and_guesses(
+        candidates=all_words(), allowed_guesses=all_words()
+    )
+
+
+def model_solver():
+    return model.Solver.from_word_weights(
+        weight=word_weights(), allowed_guesses=all_words()
+    )
+
+
+def minimax_solver():
+    return minimax.Solver.from_candidates_and_guesses(
+        candidates=all_words(), allowed_guesses=all_words()
+    )
+
+
+STRATEGIES: Dict[str, Callable] = {
+    "entropy": entropy_solver,
+    "model": model_solver,
+    "minimax": minimax_solver,
+}
+
+
+def make_solver(
+    strategy: str, hard_mode: bool = False, lookahead_depth: int = 1, top_k: int = 10
+):
+    solver = STRATEGIES[strategy]()
+    if lookahead_depth > 1:
+        if not isinstance(solver, entropy.Solver):
+            raise ValueError(f"The {strategy} strategy has no lookahead")
+        solver.lookahead = entropy.Lookahead(
+            depth=lookahead_depth, top_k=top_k, hard_mode=hard_mode
+        )
+    return solver
+
+
+def _lookahead_report(solver) -> Optional[dict]:
+    lookahead = getattr(solver, "lookahead", None)
+    if lookahead is None:
+        return None
+    return {
+        "depth": lookahead.depth,
+        "top_k": lookahead.top_k,
+        "states": lookahead.states,
+        "pruned": lookahead.pruned,
+        "seconds": lookahead.seconds,
+    }
+
+
+def _score_cache_report() -> dict:
+    return {
+        "hits": SCORE_CACHE.hits,
+        "misses": SCORE_CACHE.misses,
+        "entries": len(SCORE_CACHE),
+        "mb": SCORE_CACHE.nbytes / 2**20,
+    }
+
+
+class StageTimer:
+    def __init__(self):
+        self.seconds: Dict[str, float] = defaultdict(float)
+        self.calls: Dict[str, int] = defaultdict(int)
+
+    def time(self, stage: str, f: Callable, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return f(*args, **kwargs)
+        finally:
+            self.seconds[stage] += time.perf_counter() - start
+            self.calls[stage] += 1
+
+
+def play(
+    solver,
+    solution: str,
+    first_guess: str,
+    hard_mode: bool,
+    timer: StageTimer,
+    turn_seconds: List[float],
+    book: Optional[OpeningBook] = None,
+) -> int:
+    history = []
+    guess = first_guess
+    for n_guesses in range(1, len(solver.table) + 1):
+        outcome = timer.time(
+            "scalar_outcome_after_guess",
+            scalar_outcome_after_guess,
+            candidate=solution,
+            guess=guess,
+        )
+        if outcome == SOLVED:
+            return n_guesses
+        solver = timer.time(
+            "with_guess",
+            solver.with_guess,
+            guess=guess,
+            outcome=outcome,
+            hard_mode=hard_mode,
+        )
+        history.append((guess, outcome))
+        start = time.perf_counter()
+        if book is None:
+            guess = timer.time("guess", solver.guess)
+        else:
+            guess = timer.time(
+                "guess",
+                book.guess,
+                solver=solver,
+                history=history,
+                hard_mode=hard_mode,
+            )
+        turn_seconds.append(time.perf_counter() - start)
+    raise RuntimeError(f"{solution} was never solved")
+
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {}
+    return {
+        "mean": float(np.mean(values)),
+        "p50": float(np.percentile(values, 50)),
+        "p99": float(np.percentile(values, 99)),
+        "max": float(np.max(values)),
+    }
+
+
+def cold_start(
+    strategy: str = "entropy", first_guess: str = "tares", solution: str = "pupal"
+) -> dict:
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", COLD_START_SCRIPT, strategy, first_guess, solution],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    seconds = time.perf_counter() - start
+    return {
+        **json.loads(result.stdout),
+        "seconds": seconds,
+        "target_seconds": COLD_START_TARGET_SECONDS,
+        "within_target": seconds <= COLD_START_TARGET_SECONDS,
+    }
+
+
+def compare_kernels(
+    sizes: Sequence[int] = (12972, 2315, 300), repeat: int = 3, seed: int = 0
+) -> dict:
+    # Every available scoring kernel on every guess against candidate sets of
+    # each size: best of repeat seconds, after one untimed call to compile,
+    # and the largest difference from the numpy scores.
+    table = pattern_table()
+    guess_ids = table.ids(table.words)
+    weight = np.random.default_rng(seed).random(len(table.words))
+    report = {}
+    for size in sizes:
+        candidate_ids = np.sort(
+            np.random.default_rng(seed).choice(
+                len(table.words), size=min(size, len(table.words)), replace=False
+            )
+        ).astype(np.int32)
+        results = {}
+        for name in available_kernels():
+            for metric, evaluate, kwargs in (
+                ("entropy", kernel(name).entropy_scores, {}),
+                (
+                    "eliminated_weight",
+                    kernel(name).eliminated_weight_scores,
+                    {"weight": weight},
+                ),
+            ):
+
+                def call():
+                    return evaluate(
+                        table=table,
+                        guess_ids=guess_ids,
+                        candidate_ids=candidate_ids,
+                        **kwargs,
+                    )
+
+                scores = call()
+                seconds = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    call()
+                    seconds.append(time.perf_counter() - start)
+                results.setdefault(metric, {})[name] = {
+                    "seconds": min(seconds),
+                    "scores": scores,
+                }
+        for metric in results.values():
+            reference = metric["numpy"]["scores"]
+            for result in metric.values():
+                scale = max(float(np.abs(reference).max()), 1.0)
+                result["max_relative_diff"] = float(
+                    np.abs(result.pop("scores") - reference).max() / scale
+                )
+        report[size] = results
+    return {"guesses": int(guess_ids.size), "candidates": report}
+
+
+def _guess_stats(guesses: List[int]) -> dict:
+    return {
+        "mean": float(np.mean(guesses)),
+        "max": max(guesses),
+        "distribution": dict(sorted(Counter(guesses).items())),
+        "failure_rate": sum(g > MAX_GUESSES for g in guesses) / len(guesses),
+    }
+
+
+def _solutions(sample: Optional[int], seed: int) -> List[str]:
+    solutions = list(answers())
+    if sample is not None:
+        solutions = random.Random(seed).sample(solutions, k=sample)
+    return solutions
+
+
+def run_batch(
+    strategy: str = "entropy",
+    sample: Optional[int] = None,
+    seed: int = 0,
+    hard_mode: bool = False,
+    first_guess: str = "tares",
+    lookahead_depth: int = 1,
+    top_k: int = 10,
+) -> dict:
+    # Plays all the answers together in lockstep, see simulate.
+    np.random.seed(seed)
+    solutions = _solutions(sample=sample, seed=seed)
+
+    SCORE_CACHE.clear()
+    start = time.perf_counter()
+    solver = make_solver(
+        strategy=strategy,
+        hard_mode=hard_mode,
+        lookahead_depth=lookahead_depth,
+        top_k=top_k,
+    )
+    setup_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    guesses = simulate(
+        solver=solver,
+        solutions=solutions,
+        first_guess=first_guess,
+        hard_mode=hard_mode,
+    ).tolist()
+    total_seconds = time.perf_counter() - start
+
+    return {
+        "strategy": strategy,
+        "hard_mode": hard_mode,
+        "first_guess": first_guess,
+        "seed": seed if sample is not None else None,
+        "answers": len(solutions),
+        "guesses": _guess_stats(guesses),
+        "seconds": {
+            "setup": setup_seconds,
+            "total": total_seconds,
+            "per_answer": {"mean": total_seconds / len(solutions)},
+        },
+        "lookahead": _lookahead_report(solver),
+        "score_cache": _score_cache_report(),
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "per_answer": [
+            {"answer": solution, "guesses": n_guesses}
+            for solution, n_guesses in zip(solutions, guesses)
+        ],
+    }
+
+
+def run_worst_case(
+    strategy: str = "entropy",
+    sample: Optional[int] = None,
+    seed: int = 0,
+    hard_mode: bool = False,
+    first_guess: str = "tares",
+    lookahead_depth: int = 1,
+    top_k: int = 10,
+) -> dict:
+    # The answers that take the most guesses, see worst_case.
+    np.random.seed(seed)
+    solutions = _solutions(sample=sample, seed=seed)
+
+    SCORE_CACHE.clear()
+    solver = make_solver(
+        strategy=strategy,
+        hard_mode=hard_mode,
+        lookahead_depth=lookahead_depth,
+        top_k=top_k,
+    )
+    return {
+        "strategy": strategy,
+        "hard_mode": hard_mode,
+        "first_guess": first_guess,
+        "seed": seed if sample is not None else None,
+        "answers": len(solutions),
+        "worst_case": worst_case(
+            solver=solver,
+            solutions=solutions,
+            first_guess=first_guess,
+            hard_mode=hard_mode,
+        ),
+        "score_cache": _score_cache_report(),
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def run(
+    strategy: str = "entropy",
+    sample: Optional[int] = None,
+    seed: int = 0,
+    hard_mode: bool = False,
+    first_guess: str = "tares",
+    book: bool = False,
+    book_path: Optional[str] = None,
+    warm_depth: int = 0,
+    lookahead_depth: int = 1,
+    top_k: int = 10,
+) -> dict:
+    # Solvers break ties between equally good guesses at random.
+    np.random.seed(seed)
+
+    solutions = _solutions(sample=sample, seed=seed)
+
+    SCORE_CACHE.clear()
+    start = time.perf_counter()
+    solver = make_solver(
+        strategy=strategy,
+        hard_mode=hard_mode,
+        lookahead_depth=lookahead_depth,
+        top_k=top_k,
+    )
+    opening_book = None
+    if book or book_path is not None or warm_depth > 0:
+        opening_book = OpeningBook(solver=solver, path=book_path)
+        if warm_depth > 0:
+            opening_book.warm(
+                first_guess=first_guess, depth=warm_depth, hard_mode=hard_mode
+            )
+    setup_seconds = time.perf_counter() - start
+
+    timer = StageTimer()
+    turn_seconds: List[float] = []
+    per_answer = []
+    for solution in solutions:
+        start = time.perf_counter()
+        n_guesses = play(
+            solver=solver,
+            solution=solution,
+            first_guess=first_guess,
+            hard_mode=hard_mode,
+            timer=timer,
+            turn_seconds=turn_seconds,
+            book=opening_book,
+        )
+        per_answer.append(
+            {
+                "answer": solution,
+                "guesses": n_guesses,
+                "seconds": time.perf_counter() - start,
+            }
+        )
+
+    if opening_book is not None and opening_book.path is not None:
+        opening_book.save()
+
+    guesses = [a["guesses"] for a in per_answer]
+    answer_seconds = [a["seconds"] for a in per_answer]
+    return {
+        "strategy": strategy,
+        "hard_mode": hard_mode,
+        "first_guess": first_guess,
+        "seed": seed if sample is not None else None,
+        "answers": len(per_answer),
+        "guesses": _guess_stats(guesses),
+        "seconds": {
+            "setup": setup_seconds,
+            "total": sum(answer_seconds),
+            "per_answer": _percentiles(answer_seconds),
+            "per_turn": _percentiles(turn_seconds),
+            "stages": {
+                stage: {"seconds": seconds, "calls": timer.calls[stage]}
+                for stage, seconds in timer.seconds.items()
+            },
+        },
+        "book": (
+            None
+            if opening_book is None
+            else {
+                "hits": opening_book.hits,
+                "misses": opening_book.misses,
+                "entries": len(opening_book.entries),
+            }
+        ),
+        "lookahead": _lookahead_report(solver),
+        "score_cache": _score_cache_report(),
+        # ru_maxrss is in kilobytes on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "per_answer": per_answer,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Play every answer with a solver strategy and report timings."
+    )
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="entropy")
+    parser.add_argument("--sample", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--hard-mode", action="store_true")
+    parser.add_argument("--first-guess", default="tares")
+    parser.add_argument("--book", action="store_true")
+    parser.add_argument("--book-path", default=None)
+    parser.add_argument("--warm-depth", type=int, default=0)
+    parser.add_argument("--lookahead-depth", type=int, default=1)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--batch", action="store_true")
+    parser.add_argument("--cold-start", action="store_true")
+    parser.add_argument("--kernels", action="store_true")
+    parser.add_argument("--worst-case", action="store_true")
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    if args.cold_start:
+        # Built once up front so the measurement doesn't include it.
+        STRATEGIES[args.strategy]()
+        report = cold_start(strategy=args.strategy, first_guess=args.first_guess)
+    elif args.kernels:
+        report = compare_kernels(seed=args.seed)
+    elif args.worst_case:
+        report = run_worst_case(
+            strategy=args.strategy,
+            sample=args.sample,
+            seed=args.seed,
+            hard_mode=args.hard_mode,
+            first_guess=args.first_guess,
+            lookahead_depth=args.lookahead_depth,
+            top_k=args.top_k,
+        )
+    elif args.batch:
+        report = run_batch(
+            strategy=args.strategy,
+            sample=args.sample,
+            seed=args.seed,
+            hard_mode=args.hard_mode,
+            first_guess=args.first_guess,
+            lookahead_depth=args.lookahead_depth,
+            top_k=args.top_k,
+        )
+    else:
+        report = run(
+            strategy=args.strategy,
+            sample=args.sample,
+            seed=args.seed,
+            hard_mode=args.hard_mode,
+            first_guess=args.first_guess,
+            book=args.book,
+            book_path=args.book_path,
+            warm_depth=args.warm_depth,
+            lookahead_depth=args.lookahead_depth,
+            top_k=args.top_k,
+        )
+
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, "w") as fp:
+            json.dump(report, fp, indent=2)
+
+
+if __name__ == "__main__":
+    main()
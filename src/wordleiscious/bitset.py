@@ -0,0 +1,70 @@
+from typing import Iterable
+
+import numpy as np
+
+POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+class Bitset:
+    # A fixed width set of word ids, one bit per word of the vocabulary. The
+    # bits are never mutated in place, so sets can be shared between solver
+    # states and used as dict keys.
+    __slots__ = ("bits", "size", "_hash")
+
+    def __init__(self, bits: np.ndarray, size: int):
+        bits.flags.writeable = False
+        self.bits = bits
+        self.size = size
+        self._hash = None
+
+    @classmethod
+    def from_mask(cls, mask: np.ndarray) -> "Bitset":
+        return cls(bits=np.packbits(mask, bitorder="little"), size=mask.size)
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[int], size: int) -> "Bitset":
+        mask = np.zeros(size, dtype=bool)
+        mask[np.fromiter(ids, dtype=np.int64)] = True
+        return cls.from_mask(mask=mask)
+
+    @classmethod
+    def full(cls, size: int) -> "Bitset":
+        return cls.from_mask(mask=np.ones(size, dtype=bool))
+
+    def mask(self) -> np.ndarray:
+        return np.unpackbits(self.bits, count=self.size, bitorder="little").view(bool)
+
+    def ids(self) -> np.ndarray:
+        return np.flatnonzero(self.mask()).astype(np.int32)
+
+    def without(self, id: int) -> "Bitset":
+        bits = self.bits.copy()
+        bits[id >> 3] &= ~np.uint8(1 << (id & 7))
+        return Bitset(bits=bits, size=self.size)
+
+    def __and__(self, other: "Bitset") -> "Bitset":
+        return Bitset(bits=self.bits & other.bits, size=self.size)
+
+    def __or__(self, other: "Bitset") -> "Bitset":
+        return Bitset(bits=self.bits | other.bits, size=self.size)
+
+    def __contains__(self, id: int) -> bool:
+        return bool(self.bits[id >> 3] >> (id & 7) & 1)
+
+    def __len__(self) -> int:
+        return int(POPCOUNT[self.bits].sum(dtype=np.int64))
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, Bitset)
+            and self.size == other.size
+            and np.array_equal(self.bits, other.bits)
+        )
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash((self.size, self.bits.tobytes()))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"Bitset({len(self)}/{self.size})"
@@ -0,0 +1,55 @@
+import os
+from functools import lru_cache
+from importlib import resources
+from pathlib import Path
+
+import numpy as np
+
+from wordleiscious.pattern import WORD_LENGTH, pack
+from wordleiscious.words import (
+    DATA_PACKAGE,
+    all_words,
+    data_fingerprint,
+    frequency_weights,
+)
+
+# Bump whenever the fields below change.
+BUNDLE_VERSION = 2
+
+# One row per word of all_words(), so a word's id is its row number. Aligned,
+# as gathering from a view of unaligned weights is twice as slow.
+BUNDLE_DTYPE = np.dtype(
+    [
+        ("letters", np.uint8, (WORD_LENGTH,)),
+        ("weight", np.float32),
+    ],
+    align=True,
+)
+
+
+def bundle_path() -> Path:
+    return Path(
+        resources.files(DATA_PACKAGE)
+        / f"vocabulary.v{BUNDLE_VERSION}.{data_fingerprint()[:12]}.npy"
+    )
+
+
+def build_bundle() -> np.ndarray:
+    words = list(all_words())
+    bundle = np.empty(len(words), dtype=BUNDLE_DTYPE)
+    bundle["letters"] = pack(words)
+    bundle["weight"] = frequency_weights()
+    return bundle
+
+
+@lru_cache(maxsize=None)
+def vocabulary_bundle() -> np.ndarray:
+    # Built from the json, feather and pandas the first time, afterwards just
+    # mapped into memory.
+    path = bundle_path()
+    if not path.exists():
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as fp:
+            np.save(fp, build_bundle())
+        os.replace(tmp_path, path)
+    return np.load(path, mmap_mode="r")
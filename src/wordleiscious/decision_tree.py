@@ -0,0 +1,91 @@
+import argparse
+from collections import Counter
+from typing import Dict, Hashable, Optional
+
+import numpy as np
+
+from wordleiscious.benchmark import STRATEGIES
+from wordleiscious.strategy import Strategy
+from wordleiscious.words import answers
+
+
+def build_tree(solver, first_guess: Optional[str] = None, hard_mode: bool = False):
+    # Records solver.guess() for every state reachable from solver. States with
+    # the same candidates share a subtree: in normal mode a guess already made
+    # can't split those candidates, so it is never the solver's choice again.
+    from tqdm import tqdm
+
+    table = solver.table
+    guesses = []
+    children = []
+    nodes: Dict[Hashable, int] = {}
+
+    progress = tqdm(leave=False, desc="nodes")
+
+    def expand(s, guess_id: Optional[int] = None) -> int:
+        key = (s.candidate, s.allowed_guess if hard_mode else None)
+        if key in nodes:
+            return nodes[key]
+
+        guess_id = s.guess_id() if guess_id is None else guess_id
+        node = nodes[key] = len(guesses)
+        guesses.append(table.words[guess_id])
+        children.append({})
+        progress.update()
+
+        codes = table.codes[guess_id, s.candidate.ids()]
+        for code in np.unique(codes).tolist():
+            if code == table.all_green:
+                continue
+            child = s.with_guess_id(guess_id=guess_id, code=code, hard_mode=hard_mode)
+            children[node][code] = expand(child)
+        return node
+
+    expand(solver, guess_id=None if first_guess is None else table.index[first_guess])
+    progress.close()
+    return Strategy(guesses=guesses, children=children, hard_mode=hard_mode)
+
+
+def guesses_needed(strategy: Strategy, table, solution: str) -> int:
+    solution_id = table.index[solution]
+    node = 0
+    for n_guesses in range(1, len(strategy.guesses) + 1):
+        code = int(table.codes[table.index[strategy.guesses[node]], solution_id])
+        if code == table.all_green:
+            return n_guesses
+        node = strategy.children[node][code]
+    raise RuntimeError(f"{solution} is never solved by this strategy")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build the complete decision tree of a solver strategy."
+    )
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="entropy")
+    parser.add_argument("--first-guess", default="tares")
+    parser.add_argument("--hard-mode", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="strategy.json")
+    args = parser.parse_args()
+
+    # Solvers break ties between equally good guesses at random.
+    np.random.seed(args.seed)
+
+    solver = STRATEGIES[args.strategy]()
+    strategy = build_tree(
+        solver=solver, first_guess=args.first_guess, hard_mode=args.hard_mode
+    )
+    strategy.save(path=args.output)
+
+    guesses = [
+        guesses_needed(strategy=strategy, table=solver.table, solution=solution)
+        for solution in answers()
+    ]
+    print(f"nodes: {len(strategy.guesses)}")
+    print(f"total guesses: {sum(guesses)}")
+    print(f"average guesses: {sum(guesses) / len(guesses):.4f}")
+    print(f"distribution: {dict(sorted(Counter(guesses).items()))}")
+
+
+if __name__ == "__main__":
+    main()
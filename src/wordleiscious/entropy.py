@@ -1,99 +1,193 @@
-from typing import Iterable
+import time
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
 
 import numpy as np
-import pandas as pd
-from tqdm import tqdm
-from wordleiscious.outcome import (
-    outcome_after_guess,
-    scalar_outcome_after_guess,
-    remaining,
-    display,
-)
-from wordleiscious.words import all_words, answers
-
-
-class Solver:
-    def __init__(self, candidate: pd.Series, allowed_guess: pd.Series):
-        self.candidate = candidate
-        self.allowed_guess = allowed_guess
 
-    @classmethod
-    def from_candidates_and_guesses(
-        cls,
-        candidates: Iterable[str],
-        allowed_guesses: Iterable[str],
-    ):
-        return cls(
-            candidate=pd.Series(name="candidate", data=candidates),
-            allowed_guess=pd.Series(name="guess", data=allowed_guesses),
-        )
+from wordleiscious.bitset import Bitset
+from wordleiscious.instrument import stage
+from wordleiscious.kernels import kernel
+from wordleiscious.opening_book import OpeningBook, opening_book_path
+from wordleiscious.openers import best_opener
+from wordleiscious.outcome import scalar_outcome_after_guess, display
+from wordleiscious.pattern_table import PatternTable, pattern_table, table_covering
+from wordleiscious.solver import BaseSolver
+from wordleiscious.words import all_words, answers
 
-    def with_guess(
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Guesses whose expected information is this close to the best are ties.
+TOLERANCE = 1e-9
+
+
+class Lookahead:
+    def __init__(self, depth: int = 2, top_k: int = 10, hard_mode: bool = False):
+        # Ranks the top_k guesses by entropy by the bits expected from the
+        # guess and then the best depth - 1 replies. Shared by every state
+        # descending from the solver it is given to, and counts its own cost.
+        self.depth = depth
+        self.top_k = top_k
+        self.hard_mode = hard_mode
+        self.states = 0
+        self.pruned = 0
+        self.seconds = 0.0
+
+    def best_guess_ids(self, solver: "Solver") -> np.ndarray:
+        start = time.perf_counter()
+        try:
+            guess_ids, information = self.rank(solver=solver, depth=self.depth)
+            return guess_ids[information >= information.max() - TOLERANCE]
+        finally:
+            self.seconds += time.perf_counter() - start
+
+    def rank(self, solver: "Solver", depth: int) -> Tuple[np.ndarray, np.ndarray]:
+        with stage("lookahead", solver=solver, depth=depth):
+            self.states += 1
+            guess_ids = solver.allowed_guess.ids()
+            scores = solver.scores()
+            if depth == 1:
+                return guess_ids, scores
+
+            top = np.argsort(-scores, kind="stable")[: self.top_k]
+            information = np.empty(top.size)
+            best = -np.inf
+            for i, j in enumerate(top):
+                information[i] = self.information(
+                    solver=solver,
+                    guess_id=guess_ids[j],
+                    entropy=scores[j],
+                    depth=depth,
+                    best=best,
+                )
+                best = max(best, information[i])
+            return guess_ids[top], information
+
+    def information(
         self,
-        guess: str,
-        outcome: str,
-        hard_mode: bool = False,
-    ) -> "Solver":
-        _remaining = remaining(
-            candidate=self.candidate,
-            guess=pd.Series(index=self.candidate.index, data=guess, name="guess"),
-            outcome=pd.Series(index=self.candidate.index, data=outcome, name="outcome"),
-        )
-        candidate = self.candidate[_remaining].copy()
-        if hard_mode:
-            allowed_guess = self.allowed_guess[
-                (self.allowed_guess != guess)
-                & np.isin(self.allowed_guess, candidate.values)
-            ]
+        solver: "Solver",
+        guess_id: int,
+        entropy: float,
+        depth: int,
+        best: float,
+    ) -> float:
+        # A reply can't learn more than log2(n) bits about a bucket of n
+        # candidates, so until every bucket has had its best reply scored
+        # this is an upper bound. Largest buckets go first to tighten it
+        # soonest, and the guess is given up once it can't beat best.
+        table = solver.table
+        candidate_ids = solver.candidate.ids()
+        codes = table.codes[guess_id, candidate_ids]
+        counts = np.bincount(codes, minlength=table.n_patterns)
+        if solver.weight is None:
+            p = counts / counts.sum()
         else:
-            allowed_guess = self.allowed_guess[(self.allowed_guess != guess)]
-
-        return Solver(candidate=candidate, allowed_guess=allowed_guess)
-
-    @staticmethod
-    def _ensemble_entropy(outcome: pd.Series) -> float:
+            weight_sums = np.bincount(
+                codes, weights=solver.weight[candidate_ids], minlength=table.n_patterns
+            )
+            p = weight_sums / weight_sums.sum()
+        bounds = p * np.log2(np.maximum(counts, 1))
+        total = entropy + bounds.sum()
+        for code in np.argsort(-counts)[: np.count_nonzero(counts > 1)]:
+            if total < best - TOLERANCE:
+                self.pruned += 1
+                return total
+            child = solver.with_guess_id(
+                guess_id=guess_id, code=code, hard_mode=self.hard_mode
+            )
+            _, child_information = self.rank(solver=child, depth=depth - 1)
+            total += p[code] * child_information.max() - bounds[code]
+        return total
 
-        outcome_prob = outcome.value_counts()
-        outcome_prob /= outcome_prob.sum()
 
-        return (-outcome_prob * np.log2(outcome_prob)).sum()
+class Solver(BaseSolver):
+    kernel_scores = "entropy_scores"
+    index_scores = "entropy_scores"
+    cache_tag = "entropy"
+    score_name = "entropy"
 
-    @staticmethod
-    def evaluate(candidate: pd.Series, guess: pd.Series):
-        outcome_df = outcome_after_guess(
+    def __init__(
+        self,
+        candidate: Bitset,
+        allowed_guess: Bitset,
+        table: PatternTable,
+        lookahead: Optional[Lookahead] = None,
+        weight: Optional[np.ndarray] = None,
+        weight_digest: Optional[str] = None,
+    ):
+        super().__init__(
             candidate=candidate,
-            guess=guess,
+            allowed_guess=allowed_guess,
+            table=table,
+            weight=weight,
+            weight_digest=weight_digest,
         )
+        self.lookahead = lookahead
 
-        return (
-            outcome_df.groupby("guess")
-            .outcome.apply(Solver._ensemble_entropy)
-            .rename("entropy")
+    @classmethod
+    def from_word_weights(
+        cls,
+        weight: np.ndarray,
+        allowed_guesses: Iterable[str],
+        table: Optional[PatternTable] = None,
+        lookahead: Optional[Lookahead] = None,
+    ):
+        # As model.Solver.from_word_weights: the candidates are the words
+        # weighing more than 0, each as likely as its weight.
+        if table is None:
+            table = pattern_table()
+        if weight.shape != (len(table),):
+            raise ValueError(
+                f"Expected a weight for each of the {len(table)} words, "
+                f"got shape {weight.shape}"
+            )
+        return cls(
+            candidate=Bitset.from_mask(mask=weight > 0),
+            allowed_guess=Bitset.from_ids(
+                ids=table.ids(allowed_guesses), size=len(table)
+            ),
+            table=table,
+            lookahead=lookahead,
+            weight=weight,
         )
 
-    def evaluate_guesses(self) -> pd.Series:
-
-        chunk_size = 100
-        guess_chunks = [
-            self.allowed_guess[i : i + chunk_size]
-            for i in range(0, self.allowed_guess.size, chunk_size)
-        ]
-
-        return pd.concat(
-            Solver.evaluate(candidate=self.candidate, guess=guess_chunk)
-            for guess_chunk in tqdm(guess_chunks, leave=False)
-            if not guess_chunk.empty
+    @staticmethod
+    def evaluate(
+        candidate: "pd.Series",
+        guess: "pd.Series",
+        table: Optional[PatternTable] = None,
+    ) -> "pd.Series":
+        # The entropy of each guess over the candidates, by guess, scored on
+        # the given table or else on one covering every word.
+        import pandas as pd
+
+        if table is None:
+            table = table_covering(words=[*candidate, *guess])
+        guesses = sorted(set(guess))
+        return pd.Series(
+            name="entropy",
+            index=pd.Index(name="guess", data=guesses),
+            data=kernel().entropy_scores(
+                table=table,
+                guess_ids=table.ids(guesses),
+                candidate_ids=table.ids(candidate),
+            ),
         )
 
-    def best_guesses(self) -> pd.DataFrame:
-        guess_scores_df = self.evaluate_guesses().reset_index()
-        best_entropy = guess_scores_df.entropy.max()
-        return guess_scores_df[guess_scores_df.entropy == best_entropy]
-
-    def guess(self) -> str:
-        if self.candidate.size == 1:
-            return self.candidate.values[0]
-        return self.best_guesses().sample().guess.values[0]
+    def guess_id(self) -> int:
+        if len(self.candidate) == 1:
+            return int(self.candidate.ids()[0])
+        if len(self.candidate) == 2:
+            # Guessing either splits them, the most any guess can, and may win.
+            best_ids = (self.candidate & self.allowed_guess).ids()
+            if best_ids.size:
+                return int(np.random.choice(best_ids))
+        if self.lookahead is not None and self.lookahead.depth > 1:
+            best_ids = self.lookahead.best_guess_ids(solver=self)
+        else:
+            # Same choice as best_guesses().sample(), without building a frame.
+            scores = self.scores()
+            best_ids = self.allowed_guess.ids()[scores == scores.max()]
+        return int(np.random.choice(best_ids))
 
 
 def main():
@@ -105,37 +199,45 @@ def main():
         print(display(guess=guess, outcome=outcome), end="")
 
     def _post_display(s: Solver):
-        print(f", remaining candidates:{s.candidate.size}")
+        print(f", remaining candidates:{len(s.candidate)}")
 
-    first_guess = "tares"
+    hard_mode = True
 
     original_solver = Solver.from_candidates_and_guesses(
-        candidates=candidates, allowed_guesses=allowed_guesses
+        candidates=candidates,
+        allowed_guesses=allowed_guesses,
+        table=pattern_table(),
+    )
+    first_guess = best_opener(
+        solver=original_solver, strategy="entropy", hard_mode=hard_mode
     )
 
-    for solution in answers():
+    book = OpeningBook(solver=original_solver, path=opening_book_path("entropy"))
 
-        first_outcome = scalar_outcome_after_guess(
-            candidate=solution, guess=first_guess
-        )
+    for solution in answers():
 
-        _pre_display(guess=first_guess, outcome=first_outcome)
-        s = original_solver.with_guess(guess=first_guess, outcome=first_outcome)
-        _post_display(s=s)
+        s = original_solver
+        history = []
+        best_guess = first_guess
 
         while True:
-            best_guess = s.guess()
             best_outcome = scalar_outcome_after_guess(
                 candidate=solution, guess=best_guess
             )
             _pre_display(guess=best_guess, outcome=best_outcome)
             if best_outcome == "🟩🟩🟩🟩🟩":
                 break
-            s = s.with_guess(guess=best_guess, outcome=best_outcome, hard_mode=True)
+            s = s.with_guess(
+                guess=best_guess, outcome=best_outcome, hard_mode=hard_mode
+            )
+            history.append((best_guess, best_outcome))
             _post_display(s=s)
+            best_guess = book.guess(solver=s, history=history, hard_mode=hard_mode)
 
         print("\n" * 2)
 
+    book.save()
+
 
 if __name__ == "__main__":
     main()
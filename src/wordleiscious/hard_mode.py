@@ -0,0 +1,42 @@
+from typing import Dict, Tuple
+
+import numpy as np
+
+from wordleiscious.pattern import GREEN, YELLOW
+from wordleiscious.vocabulary import Vocabulary
+
+
+def revealed_hints(
+    letters: np.ndarray, code: int
+) -> Tuple[Dict[int, int], Dict[int, int]]:
+    # The green letters by position, and how many of each letter any later
+    # guess must hold. A yellow letter occurs at a non-green position of the
+    # answer, so on top of its greens the answer has at least one more.
+    n = letters.size
+    digits = code // 3 ** np.arange(n - 1, -1, -1) % 3
+    greens = {
+        position: int(letter)
+        for position, (letter, digit) in enumerate(zip(letters, digits))
+        if digit == GREEN
+    }
+    min_counts: Dict[int, int] = {}
+    for letter in set(letters[digits != 0].tolist()):
+        is_letter = letters == letter
+        min_counts[letter] = int(np.count_nonzero(is_letter & (digits == GREEN))) + int(
+            np.any(is_letter & (digits == YELLOW))
+        )
+    return greens, min_counts
+
+
+def legal_guess_mask(vocabulary: Vocabulary, guess_id: int, code: int) -> np.ndarray:
+    # Words that reuse every hint the outcome of this guess revealed: greens
+    # in place and at least as many of each green or yellow letter.
+    greens, min_counts = revealed_hints(
+        letters=np.asarray(vocabulary.letters[guess_id]), code=code
+    )
+    mask = np.ones(len(vocabulary), dtype=bool)
+    for position, letter in greens.items():
+        mask &= vocabulary.position_masks[position, letter]
+    for letter, count in min_counts.items():
+        mask &= vocabulary.letter_counts[:, letter] >= count
+    return mask
@@ -0,0 +1,173 @@
+import argparse
+import cProfile
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from typing import Callable, ContextManager, Dict, Iterable, Iterator, List, Optional
+
+Event = Dict[str, object]
+
+# The recorder stages report to, None when instrumentation is off. Checking
+# it is all a stage costs then.
+_recorder: Optional["Recorder"] = None
+_disabled = nullcontext()
+
+
+class Recorder:
+    def __init__(
+        self,
+        track_memory: bool = False,
+        callbacks: Iterable[Callable[[Event], None]] = (),
+    ):
+        self.track_memory = track_memory
+        self.callbacks = list(callbacks)
+        self.events: List[Event] = []
+        self.origin = time.perf_counter()
+        # Peak traced memory seen so far inside each open stage.
+        self._peaks: List[int] = []
+
+    @contextmanager
+    def stage(self, name: str, solver=None, **fields) -> Iterator[None]:
+        if solver is not None:
+            fields["candidates"] = len(solver.candidate)
+            fields["guesses"] = len(solver.allowed_guess)
+        if self.track_memory:
+            start_memory, peak = tracemalloc.get_traced_memory()
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            tracemalloc.reset_peak()
+            self._peaks.append(start_memory)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            event: Event = {
+                "name": name,
+                "start": start - self.origin,
+                "seconds": end - start,
+                "thread": threading.get_ident(),
+                **fields,
+            }
+            if self.track_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, self._peaks.pop())
+                event["allocated_bytes"] = peak - start_memory
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+                tracemalloc.reset_peak()
+            self.events.append(event)
+            for callback in self.callbacks:
+                callback(event)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        # Calls, and totals of seconds and every other number, per stage.
+        stages: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        for event in self.events:
+            totals = stages[event["name"]]
+            totals["calls"] += 1
+            for key, value in event.items():
+                if key not in ("name", "start", "thread") and isinstance(
+                    value, (int, float)
+                ):
+                    totals[key] += value
+        return {name: dict(totals) for name, totals in stages.items()}
+
+    def chrome_trace(self) -> dict:
+        # Complete ("X") events, viewable in chrome://tracing or Perfetto.
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": event["name"],
+                    "ph": "X",
+                    "ts": event["start"] * 1e6,
+                    "dur": event["seconds"] * 1e6,
+                    "pid": pid,
+                    "tid": event["thread"],
+                    "args": {
+                        key: value
+                        for key, value in event.items()
+                        if key not in ("name", "start", "seconds", "thread")
+                    },
+                }
+                for event in self.events
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def save_chrome_trace(self, path: os.PathLike):
+        with open(path, "w") as fp:
+            json.dump(self.chrome_trace(), fp)
+
+
+def stage(name: str, solver=None, **fields) -> ContextManager[None]:
+    # Times the block as one call of the named stage. solver, if given, adds
+    # its candidate and allowed guess counts.
+    if _recorder is None:
+        return _disabled
+    return _recorder.stage(name, solver=solver, **fields)
+
+
+@contextmanager
+def instrument(
+    recorder: Optional[Recorder] = None,
+    trace_path: Optional[os.PathLike] = None,
+    profile_path: Optional[os.PathLike] = None,
+) -> Iterator[Recorder]:
+    # Records every stage run inside the block, optionally also under
+    # cProfile. The trace and the pstats snapshot are written on the way out.
+    global _recorder
+    recorder = recorder or Recorder()
+    previous, _recorder = _recorder, recorder
+    started_tracemalloc = recorder.track_memory and not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start()
+    profiler = cProfile.Profile() if profile_path is not None else None
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield recorder
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+        if started_tracemalloc:
+            tracemalloc.stop()
+        _recorder = previous
+        if trace_path is not None:
+            recorder.save_chrome_trace(trace_path)
+
+
+def main():
+    # Run as python -m, this module is __main__; the solvers report to the
+    # copy imported under its own name.
+    from wordleiscious.instrument import Recorder, instrument
+
+    parser = argparse.ArgumentParser(
+        description="Run a module's main() with its solver stages instrumented."
+    )
+    parser.add_argument("module", help="e.g. wordleiscious.entropy")
+    parser.add_argument("--trace", default=None, help="chrome trace JSON to write")
+    parser.add_argument("--profile", default=None, help="pstats file to write")
+    parser.add_argument("--track-memory", action="store_true")
+    args, rest = parser.parse_known_args()
+
+    sys.argv = [args.module, *rest]
+    recorder = Recorder(track_memory=args.track_memory)
+    with instrument(
+        recorder=recorder, trace_path=args.trace, profile_path=args.profile
+    ):
+        importlib.import_module(args.module).main()
+    json.dump(recorder.summary(), sys.stderr, indent=2)
+    print(file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
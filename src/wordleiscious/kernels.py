@@ -0,0 +1,33 @@
+import importlib
+import os
+from functools import lru_cache
+from importlib.util import find_spec
+from types import ModuleType
+from typing import Optional
+
+# A kernel is a module with entropy_scores (optionally weighted),
+# eliminated_weight_scores and largest_bucket_scores, as in
+# wordleiscious.scoring, the reference one.
+KERNELS = {
+    "numpy": "wordleiscious.scoring",
+    "numba": "wordleiscious.numba_kernel",
+}
+
+# Picks the kernel by name instead of the default.
+KERNEL_ENV = "WORDLEISCIOUS_KERNEL"
+
+
+def available_kernels():
+    return [
+        name for name in KERNELS if name != "numba" or find_spec("numba") is not None
+    ]
+
+
+@lru_cache(maxsize=None)
+def kernel(name: Optional[str] = None) -> ModuleType:
+    # numba when it is installed, otherwise numpy.
+    if name is None:
+        name = os.environ.get(KERNEL_ENV) or available_kernels()[-1]
+    if name not in KERNELS:
+        raise ValueError(f"Unknown kernel {name}, expected one of {sorted(KERNELS)}")
+    return importlib.import_module(KERNELS[name])
@@ -0,0 +1,29 @@
+import numpy as np
+
+from wordleiscious.bitset import Bitset
+from wordleiscious.pattern_table import PatternTable
+from wordleiscious.solver import BaseSolver
+
+
+class Solver(BaseSolver):
+    # Plays the guess that leaves the fewest candidates at worst.
+    kernel_scores = "largest_bucket_scores"
+    index_scores = "largest_bucket_scores"
+    cache_tag = "minimax"
+    score_name = "largest_bucket"
+    lower_is_better = True
+
+    def __init__(self, candidate: Bitset, allowed_guess: Bitset, table: PatternTable):
+        super().__init__(candidate=candidate, allowed_guess=allowed_guess, table=table)
+
+    def guess_id(self) -> int:
+        if len(self.candidate) == 1:
+            return int(self.candidate.ids()[0])
+        scores = self.scores()
+        guess_ids = self.allowed_guess.ids()
+        best_ids = guess_ids[scores == scores.min()]
+        # Of guesses equally good at worst, a candidate may also win.
+        best_candidate_ids = best_ids[np.isin(best_ids, self.candidate.ids())]
+        if best_candidate_ids.size:
+            best_ids = best_candidate_ids
+        return int(np.random.choice(best_ids))
@@ -1,124 +1,160 @@
-from typing import Dict, Iterable
-
-import pandas as pd
-from tqdm import tqdm
-
-from wordleiscious.outcome import (
-    outcome_after_guess,
-    scalar_outcome_after_guess,
-    remaining,
-    display,
-)
-from wordleiscious.words import candidate_weights, answers, all_words
-
-
-class Solver:
-    def __init__(self, candidate_weight: pd.Series, allowed_guess: pd.Series):
-        self.candidate_weight = candidate_weight
-        self.allowed_guess = allowed_guess
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
+
+import numpy as np
+
+from wordleiscious.bitset import Bitset
+from wordleiscious.kernels import kernel
+from wordleiscious.openers import best_opener
+from wordleiscious.outcome import scalar_outcome_after_guess, display
+from wordleiscious.pattern_table import PatternTable, pattern_table, table_covering
+from wordleiscious.solver import BaseSolver
+from wordleiscious.words import word_weights, answers, all_words
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class Solver(BaseSolver):
+    kernel_scores = "eliminated_weight_scores"
+    index_scores = "eliminated_weight_scores"
+    weighted_index = True
+    cache_tag = "model"
+    score_name = "score"
+
+    def __init__(
+        self,
+        candidate: Bitset,
+        allowed_guess: Bitset,
+        weight: np.ndarray,
+        table: PatternTable,
+        weight_digest: Optional[str] = None,
+    ):
+        super().__init__(
+            candidate=candidate,
+            allowed_guess=allowed_guess,
+            table=table,
+            weight=weight,
+            weight_digest=weight_digest,
+        )
 
     @classmethod
     def from_weights_and_guesses(
-        cls, candidate_weights: Dict[str, float], allowed_guesses: Iterable[str]
+        cls,
+        candidate_weights: Dict[str, float],
+        allowed_guesses: Iterable[str],
+        table: Optional[PatternTable] = None,
     ):
+        allowed_guesses = list(allowed_guesses)
+        if table is None:
+            table = table_covering(words=list(candidate_weights) + allowed_guesses)
 
-        return cls(
-            candidate_weight=pd.Series(name="weight", data=candidate_weights),
-            allowed_guess=pd.Series(name="guess", data=allowed_guesses),
-        )
+        candidate_ids = table.ids(candidate_weights)
+        weight = np.zeros(len(table), dtype=np.float32)
+        weight[candidate_ids] = list(candidate_weights.values())
 
-    def with_guess(self, guess: str, outcome: str) -> "Solver":
-        _remaining = remaining(
-            candidate=self.candidate_weight.index.to_series(),
-            guess=pd.Series(
-                index=self.candidate_weight.index, data=guess, name="guess"
-            ),
-            outcome=pd.Series(
-                index=self.candidate_weight.index, data=outcome, name="outcome"
+        return cls(
+            candidate=Bitset.from_ids(ids=candidate_ids, size=len(table)),
+            allowed_guess=Bitset.from_ids(
+                ids=table.ids(allowed_guesses), size=len(table)
             ),
-        )
-        candidate_weight = self.candidate_weight[_remaining].copy()
-        allowed_guess = self.allowed_guess[self.allowed_guess != guess].copy()
-        return Solver(candidate_weight=candidate_weight, allowed_guess=allowed_guess)
-
-    @staticmethod
-    def evaluate(candidate_weight: pd.Series, guess: pd.Series):
-        outcome_df = outcome_after_guess(
-            candidate=candidate_weight.index.to_series().rename("candidate"),
-            guess=guess,
-        )
-
-        unique_candidate_and_outcome_counts_df = (
-            outcome_df.groupby(["guess", "outcome"])
-            .size()
-            .rename("count")
-            .reset_index()
+            weight=weight,
+            table=table,
         )
 
-        c_df = candidate_weight.reset_index().rename(columns={"index": "candidate"})
-
-        weighted_outcome_df = unique_candidate_and_outcome_counts_df.merge(
-            c_df, how="cross"
+    @classmethod
+    def from_word_weights(
+        cls,
+        weight: np.ndarray,
+        allowed_guesses: Iterable[str],
+        table: Optional[PatternTable] = None,
+    ):
+        # weight is indexed by the table's word ids, e.g. words.word_weights()
+        # for pattern_table(), and used as is. Words weighing 0 can't be the
+        # answer.
+        if table is None:
+            table = pattern_table()
+        if weight.shape != (len(table),):
+            raise ValueError(
+                f"Expected a weight for each of the {len(table)} words, "
+                f"got shape {weight.shape}"
+            )
+        return cls(
+            candidate=Bitset.from_mask(mask=weight > 0),
+            allowed_guess=Bitset.from_ids(
+                ids=table.ids(allowed_guesses), size=len(table)
+            ),
+            weight=weight,
+            table=table,
         )
 
-        weighted_outcome_df["remaining"] = remaining(
-            candidate=weighted_outcome_df.candidate,
-            outcome=weighted_outcome_df.outcome,
-            guess=weighted_outcome_df.guess,
-        )
+    @property
+    def candidate_weight(self) -> "pd.Series":
+        import pandas as pd
 
-        weighted_outcome_df["guess_score_contribution"] = (
-            weighted_outcome_df["count"]
-            * weighted_outcome_df.weight
-            * (1 - weighted_outcome_df.remaining.astype(float))
+        candidate_ids = self.candidate.ids()
+        return pd.Series(
+            name="weight",
+            index=self.table.words[candidate_ids],
+            data=self.weight[candidate_ids],
         )
 
-        return (
-            weighted_outcome_df.groupby("guess")
-            .guess_score_contribution.sum()
-            .rename("score")
-        )
-
-    def evaluate_guesses(self) -> pd.Series:
-
-        n = 50
-        guess_chunks = [
-            self.allowed_guess[i : i + n] for i in range(0, self.allowed_guess.size, n)
-        ]
-
-        return pd.concat(
-            Solver.evaluate(candidate_weight=self.candidate_weight, guess=guess_chunk)
-            for guess_chunk in tqdm(guess_chunks, leave=False)
-            if not guess_chunk.empty
+    @staticmethod
+    def evaluate(
+        candidate_weight: "pd.Series",
+        guess: "pd.Series",
+        table: Optional[PatternTable] = None,
+    ) -> "pd.Series":
+        # The eliminated weight of each guess, by guess, candidate_weight
+        # being indexed by word. Scored on the given table or else on one
+        # covering every word.
+        import pandas as pd
+
+        if table is None:
+            table = table_covering(words=[*candidate_weight.index, *guess])
+        weight = np.zeros(len(table))
+        weight[table.ids(candidate_weight.index)] = candidate_weight.values
+        guesses = sorted(set(guess))
+        return pd.Series(
+            name="score",
+            index=pd.Index(name="guess", data=guesses),
+            data=kernel().eliminated_weight_scores(
+                table=table,
+                guess_ids=table.ids(guesses),
+                candidate_ids=table.ids(candidate_weight.index),
+                weight=weight,
+            ),
         )
 
-    def best_guesses(self) -> pd.DataFrame:
-        guess_scores_df = self.evaluate_guesses().reset_index()
-        best_guess_score = guess_scores_df.score.max()
-        return guess_scores_df[guess_scores_df.score == best_guess_score]
-
-    def guess(self) -> str:
-        if self.candidate_weight.index.size == 1:
-            return self.candidate_weight.index.values[0]
-        return self.best_guesses().sample().guess.values[0]
+    def guess_id(self) -> int:
+        if len(self.candidate) == 1:
+            return int(self.candidate.ids()[0])
+        if len(self.candidate) == 2:
+            # Guessing either splits them, the most any guess can, and may win.
+            best_ids = (self.candidate & self.allowed_guess).ids()
+            if best_ids.size:
+                return int(np.random.choice(best_ids))
+        # Same choice as best_guesses().sample(), without building a frame.
+        scores = self.scores()
+        best_ids = self.allowed_guess.ids()[np.flatnonzero(scores == scores.max())]
+        return int(np.random.choice(best_ids))
 
 
 def main():
 
-    c_weights = candidate_weights()
     allowed_guesses = list(all_words())
 
     def _pre_display(guess: str, outcome: str):
         print(display(guess=guess, outcome=outcome), end="")
 
     def _post_display(s: Solver):
-        print(f", remaining candidates:{s.candidate_weight.index.size}")
-
-    first_guess = "tares"
+        print(f", remaining candidates:{len(s.candidate)}")
 
-    original_s = Solver.from_weights_and_guesses(
-        candidate_weights=c_weights, allowed_guesses=allowed_guesses
+    original_s = Solver.from_word_weights(
+        weight=word_weights(),
+        allowed_guesses=allowed_guesses,
+        table=pattern_table(),
     )
+    first_guess = best_opener(solver=original_s, strategy="model")
 
     for solution in ["zills"]:
 
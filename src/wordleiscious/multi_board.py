@@ -0,0 +1,91 @@
+from typing import Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from wordleiscious.entropy import Solver
+from wordleiscious.pattern import encode
+from wordleiscious.pattern_table import PatternTable, table_covering
+
+
+class MultiBoardSolver:
+    def __init__(self, boards: Sequence[Optional[Solver]], table: PatternTable):
+        # One entropy solver per board, None once the board is solved. Every
+        # guess is played on all the boards, so they share the table and the
+        # allowed guesses.
+        self.boards: Tuple[Optional[Solver], ...] = tuple(boards)
+        self.table = table
+
+    @classmethod
+    def from_candidates_and_guesses(
+        cls,
+        candidates: Iterable[str],
+        allowed_guesses: Iterable[str],
+        n_boards: int = 4,
+        table: Optional[PatternTable] = None,
+    ) -> "MultiBoardSolver":
+        candidates = list(candidates)
+        allowed_guesses = list(allowed_guesses)
+        if table is None:
+            table = table_covering(words=candidates + allowed_guesses)
+        board = Solver.from_candidates_and_guesses(
+            candidates=candidates, allowed_guesses=allowed_guesses, table=table
+        )
+        return cls(boards=[board] * n_boards, table=table)
+
+    @property
+    def unsolved(self) -> Tuple[Solver, ...]:
+        return tuple(board for board in self.boards if board is not None)
+
+    @property
+    def solved(self) -> bool:
+        return not self.unsolved
+
+    def with_guess(
+        self, guess: str, outcomes: Sequence[Optional[str]]
+    ) -> "MultiBoardSolver":
+        # An outcome per board, None for the boards already solved.
+        return self.with_guess_id(
+            guess_id=self.table.index[guess],
+            codes=[
+                None if outcome is None else encode(outcome) for outcome in outcomes
+            ],
+        )
+
+    def with_guess_id(
+        self, guess_id: int, codes: Sequence[Optional[int]]
+    ) -> "MultiBoardSolver":
+        if len(codes) != len(self.boards):
+            raise ValueError(f"Expected {len(self.boards)} outcomes, got {len(codes)}")
+        for i, (board, code) in enumerate(zip(self.boards, codes)):
+            if board is not None and code is None:
+                raise ValueError(f"Board {i} is unsolved but got no outcome")
+        return MultiBoardSolver(
+            boards=[
+                (
+                    None
+                    if board is None or code == self.table.all_green
+                    else board.with_guess_id(guess_id=guess_id, code=code)
+                )
+                for board, code in zip(self.boards, codes)
+            ],
+            table=self.table,
+        )
+
+    def scores(self) -> np.ndarray:
+        # Joint entropy of the outcomes on every unsolved board, in
+        # allowed_guess.ids() order. The answers are drawn independently, so
+        # this is the sum of each board's entropy, and each of those is
+        # scored and cached like a single board's.
+        return np.sum([board.scores() for board in self.unsolved], axis=0)
+
+    def guess(self) -> str:
+        return self.table.words[self.guess_id()]
+
+    def guess_id(self) -> int:
+        # A board down to one candidate is won by guessing it.
+        for board in self.unsolved:
+            if len(board.candidate) == 1:
+                return int(board.candidate.ids()[0])
+        scores = self.scores()
+        best_ids = self.unsolved[0].allowed_guess.ids()[scores == scores.max()]
+        return int(np.random.choice(best_ids))
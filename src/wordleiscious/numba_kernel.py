@@ -0,0 +1,128 @@
+from typing import Optional
+
+import numpy as np
+from numba import njit, prange
+
+from wordleiscious.pattern_table import PatternTable
+from wordleiscious.scoring import DEFAULT_TILE_SIZE
+
+# The same scores as wordleiscious.scoring, but each guess's outcomes are
+# read, counted into buckets and scored in one compiled loop, guesses spread
+# over threads, instead of going through tiles of codes and histograms.
+
+
+@njit(parallel=True, cache=True)
+def _entropy(codes, n_patterns, guess_ids, candidate_ids, out):
+    n = candidate_ids.size
+    for i in prange(guess_ids.size):
+        row = codes[guess_ids[i]]
+        counts = np.zeros(n_patterns, dtype=np.int64)
+        for j in range(n):
+            counts[row[candidate_ids[j]]] += 1
+        x_log2_x = 0.0
+        for count in counts:
+            if count > 1:
+                x_log2_x += count * np.log2(count)
+        out[i] = np.log2(n) - x_log2_x / n if n > 0 else 0.0
+
+
+@njit(parallel=True, cache=True)
+def _weighted_entropy(
+    codes, n_patterns, guess_ids, candidate_ids, candidate_weight, out
+):
+    total_weight = candidate_weight.sum()
+    for i in prange(guess_ids.size):
+        row = codes[guess_ids[i]]
+        weight_sums = np.zeros(n_patterns)
+        for j in range(candidate_ids.size):
+            weight_sums[row[candidate_ids[j]]] += candidate_weight[j]
+        x_log2_x = 0.0
+        for weight_sum in weight_sums:
+            if weight_sum > 0:
+                x_log2_x += weight_sum * np.log2(weight_sum)
+        if total_weight > 0:
+            out[i] = np.log2(total_weight) - x_log2_x / total_weight
+        else:
+            out[i] = 0.0
+
+
+@njit(parallel=True, cache=True)
+def _eliminated_weight(
+    codes, n_patterns, guess_ids, candidate_ids, candidate_weight, out
+):
+    n = candidate_ids.size
+    total_weight = candidate_weight.sum()
+    for i in prange(guess_ids.size):
+        row = codes[guess_ids[i]]
+        counts = np.zeros(n_patterns, dtype=np.int64)
+        weight_sums = np.zeros(n_patterns)
+        for j in range(n):
+            code = row[candidate_ids[j]]
+            counts[code] += 1
+            weight_sums[code] += candidate_weight[j]
+        kept = 0.0
+        for code in range(n_patterns):
+            kept += counts[code] * weight_sums[code]
+        out[i] = n * total_weight - kept
+
+
+@njit(parallel=True, cache=True)
+def _largest_bucket(codes, n_patterns, guess_ids, candidate_ids, out):
+    for i in prange(guess_ids.size):
+        row = codes[guess_ids[i]]
+        counts = np.zeros(n_patterns, dtype=np.int64)
+        for j in range(candidate_ids.size):
+            counts[row[candidate_ids[j]]] += 1
+        out[i] = counts.max()
+
+
+def entropy_scores(
+    table: PatternTable,
+    guess_ids: np.ndarray,
+    candidate_ids: np.ndarray,
+    tile_size: int = DEFAULT_TILE_SIZE,
+    weight: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    scores = np.empty(guess_ids.size)
+    if weight is None:
+        _entropy(table.codes, table.n_patterns, guess_ids, candidate_ids, scores)
+    else:
+        _weighted_entropy(
+            table.codes,
+            table.n_patterns,
+            guess_ids,
+            candidate_ids,
+            np.ascontiguousarray(weight[candidate_ids], dtype=np.float64),
+            scores,
+        )
+    return scores
+
+
+def eliminated_weight_scores(
+    table: PatternTable,
+    guess_ids: np.ndarray,
+    candidate_ids: np.ndarray,
+    weight: np.ndarray,
+    tile_size: int = DEFAULT_TILE_SIZE,
+) -> np.ndarray:
+    scores = np.empty(guess_ids.size)
+    _eliminated_weight(
+        table.codes,
+        table.n_patterns,
+        guess_ids,
+        candidate_ids,
+        np.ascontiguousarray(weight[candidate_ids], dtype=np.float64),
+        scores,
+    )
+    return scores
+
+
+def largest_bucket_scores(
+    table: PatternTable,
+    guess_ids: np.ndarray,
+    candidate_ids: np.ndarray,
+    tile_size: int = DEFAULT_TILE_SIZE,
+) -> np.ndarray:
+    scores = np.empty(guess_ids.size, dtype=np.int64)
+    _largest_bucket(table.codes, table.n_patterns, guess_ids, candidate_ids, scores)
+    return scores
@@ -0,0 +1,312 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import as_completed
+from functools import lru_cache
+from importlib import resources
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from wordleiscious.opening_book import solver_fingerprint
+from wordleiscious.parallel import default_workers, executor
+from wordleiscious.scoring import entropy_scores
+from wordleiscious.words import DATA_PACKAGE, answers
+
+# Bump whenever the records below or how openings are played change.
+OPENERS_VERSION = 1
+
+Opening = Tuple[str, ...]
+
+
+def openers_path(strategy: str, hard_mode: bool = False) -> Path:
+    mode = "hard" if hard_mode else "normal"
+    return Path(resources.files(DATA_PACKAGE) / f"openers.{strategy}.{mode}.jsonl")
+
+
+@lru_cache(maxsize=None)
+def _solver(strategy: str, hard_mode: bool):
+    from wordleiscious.benchmark import make_solver
+
+    return make_solver(strategy=strategy, hard_mode=hard_mode)
+
+
+def evaluate_opening(
+    strategy: str, hard_mode: bool, opening: Opening, solutions: Sequence[str]
+) -> dict:
+    # Plays every solution with the solver after the opening (one guess, or
+    # a first and second guess) and counts the guesses actually needed.
+    from wordleiscious.benchmark import MAX_GUESSES
+    from wordleiscious.simulate import simulate
+
+    start = time.perf_counter()
+    guesses = simulate(
+        solver=_solver(strategy=strategy, hard_mode=hard_mode),
+        solutions=solutions,
+        first_guess=opening[0],
+        hard_mode=hard_mode,
+        second_guess=opening[1] if len(opening) > 1 else None,
+    )
+    return {
+        "opening": list(opening),
+        "mean": float(guesses.mean()),
+        "max": int(guesses.max()),
+        "failures": int(np.count_nonzero(guesses > MAX_GUESSES)),
+        "distribution": {
+            str(n): int(count)
+            for n, count in zip(*np.unique(guesses, return_counts=True))
+        },
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def first_guesses(
+    solver, solutions: Sequence[str], limit: Optional[int] = None
+) -> List[str]:
+    # Every allowed first guess, most informative about the solutions first,
+    # so a search cut short has covered the likeliest ones.
+    table = solver.table
+    guess_ids = solver.allowed_guess.ids()
+    scores = entropy_scores(
+        table=table, guess_ids=guess_ids, candidate_ids=table.ids(solutions)
+    )
+    order = guess_ids[np.argsort(-scores, kind="stable")][:limit]
+    return [table.words[guess_id] for guess_id in order.tolist()]
+
+
+def second_guesses(
+    solver, solutions: Sequence[str], first: str, top_k: int
+) -> List[str]:
+    # The top_k second guesses that split the solutions first leaves the most.
+    # Entropy of the pair is that of the first guess plus the expected
+    # entropy of the second in the bucket the first leaves.
+    table = solver.table
+    guess_ids = solver.allowed_guess.ids()
+    solution_ids = table.ids(solutions)
+    first_id = table.ids([first])[0]
+    codes = table.codes[first_id, solution_ids]
+    scores = np.zeros(guess_ids.size)
+    for code in np.unique(codes):
+        bucket = solution_ids[codes == code]
+        scores += bucket.size * entropy_scores(
+            table=table, guess_ids=guess_ids, candidate_ids=bucket
+        )
+    scores[guess_ids == first_id] = -np.inf
+    order = guess_ids[np.argsort(-scores, kind="stable")][:top_k]
+    return [table.words[guess_id] for guess_id in order.tolist()]
+
+
+def evaluate_first_guess(
+    strategy: str,
+    hard_mode: bool,
+    first: str,
+    solutions: Sequence[str],
+    top_k: int = 0,
+    done: Sequence[Opening] = (),
+) -> List[dict]:
+    # One task of the search: the opening with first alone and with each of
+    # its top_k second guesses, leaving out those already done. Pairing is
+    # as costly as playing the openings, so it is done in the workers too.
+    openings: List[Opening] = [(first,)]
+    if top_k > 0:
+        solver = _solver(strategy=strategy, hard_mode=hard_mode)
+        openings += [
+            (first, second)
+            for second in second_guesses(
+                solver=solver, solutions=solutions, first=first, top_k=top_k
+            )
+        ]
+    return [
+        evaluate_opening(
+            strategy=strategy,
+            hard_mode=hard_mode,
+            opening=opening,
+            solutions=solutions,
+        )
+        for opening in openings
+        if opening not in done
+    ]
+
+
+def search_fingerprint(solver, hard_mode: bool, solutions: Sequence[str]) -> str:
+    digest = hashlib.sha1()
+    digest.update(
+        f"{OPENERS_VERSION}:{hard_mode}:{solver_fingerprint(solver)}".encode()
+    )
+    digest.update("\n".join(solutions).encode())
+    return digest.hexdigest()
+
+
+def load_results(path: os.PathLike, fingerprint: str) -> Dict[Opening, dict]:
+    # The records of a checkpoint written for the same search, by opening.
+    # A file from another search, or a record cut off mid-line, is ignored.
+    results: Dict[Opening, dict] = {}
+    try:
+        with open(path) as fp:
+            if json.loads(fp.readline() or "{}").get("fingerprint") != fingerprint:
+                return {}
+            for line in fp:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                results[tuple(record["opening"])] = record
+    except FileNotFoundError:
+        pass
+    return results
+
+
+def drop_partial_line(path: os.PathLike):
+    # A run killed mid-write leaves the last record cut off; it is dropped so
+    # the next one starts on a line of its own.
+    with open(path, "rb+") as fp:
+        data = fp.read()
+        if data and not data.endswith(b"\n"):
+            fp.truncate(data.rfind(b"\n") + 1)
+
+
+def rank(results: Sequence[dict]) -> List[dict]:
+    return sorted(
+        results,
+        key=lambda record: (record["failures"], record["mean"], record["max"]),
+    )
+
+
+def search(
+    strategy: str = "entropy",
+    hard_mode: bool = False,
+    path: Optional[os.PathLike] = None,
+    solutions: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+    top_k: int = 0,
+    workers: Optional[int] = None,
+) -> List[dict]:
+    # Evaluates openings in worker processes, appending each result to path
+    # as it comes in, and picks up where an earlier run with the same
+    # settings left off. Returns every result, best first.
+    solutions = list(answers() if solutions is None else solutions)
+    path = Path(openers_path(strategy, hard_mode) if path is None else path)
+    solver = _solver(strategy=strategy, hard_mode=hard_mode)
+    fingerprint = search_fingerprint(
+        solver=solver, hard_mode=hard_mode, solutions=solutions
+    )
+
+    results = load_results(path=path, fingerprint=fingerprint)
+    if results:
+        drop_partial_line(path)
+    else:
+        with open(path, "w") as fp:
+            fp.write(json.dumps({"fingerprint": fingerprint}) + "\n")
+    # A first guess is done once it has a record alone and with every one
+    # of its second guesses.
+    n_pairs = min(top_k, solver.allowed_guess.ids().size - 1)
+    done: Dict[str, List[Opening]] = {}
+    for opening in results:
+        done.setdefault(opening[0], []).append(opening)
+    pending = [
+        first
+        for first in first_guesses(solver=solver, solutions=solutions, limit=limit)
+        if (first,) not in results or len(done[first]) < 1 + n_pairs
+    ]
+
+    def task(first: str) -> dict:
+        return dict(
+            strategy=strategy,
+            hard_mode=hard_mode,
+            first=first,
+            solutions=solutions,
+            top_k=top_k,
+            done=done.get(first, []),
+        )
+
+    workers = workers or default_workers()
+    if workers == 1:
+        batches = (evaluate_first_guess(**task(first)) for first in pending)
+    else:
+        pool = executor(workers=workers, processes=True)
+        batches = (
+            future.result()
+            for future in as_completed(
+                [pool.submit(evaluate_first_guess, **task(first)) for first in pending]
+            )
+        )
+    with open(path, "a") as fp:
+        for records in batches:
+            for record in records:
+                results[tuple(record["opening"])] = record
+                fp.write(json.dumps(record) + "\n")
+            fp.flush()
+    return rank(list(results.values()))
+
+
+def ranked_openers(
+    solver,
+    strategy: str,
+    hard_mode: bool = False,
+    solutions: Optional[Sequence[str]] = None,
+    path: Optional[os.PathLike] = None,
+) -> List[dict]:
+    # The results of the last search, best first, if it was run for this
+    # solver, mode and solutions, and none otherwise.
+    solutions = list(answers() if solutions is None else solutions)
+    path = Path(openers_path(strategy, hard_mode) if path is None else path)
+    fingerprint = search_fingerprint(
+        solver=solver, hard_mode=hard_mode, solutions=solutions
+    )
+    return rank(list(load_results(path=path, fingerprint=fingerprint).values()))
+
+
+def best_opener(
+    solver,
+    strategy: str,
+    hard_mode: bool = False,
+    solutions: Optional[Sequence[str]] = None,
+    path: Optional[os.PathLike] = None,
+    default: str = "tares",
+) -> str:
+    # The best single first guess found so far, for the solvers to start with.
+    for record in ranked_openers(
+        solver=solver,
+        strategy=strategy,
+        hard_mode=hard_mode,
+        solutions=solutions,
+        path=path,
+    ):
+        if len(record["opening"]) == 1:
+            return record["opening"][0]
+    return default
+
+
+def main():
+    from wordleiscious.benchmark import STRATEGIES
+
+    parser = argparse.ArgumentParser(
+        description="Rank first guesses by the guesses a solver needs after them."
+    )
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="entropy")
+    parser.add_argument("--hard-mode", action="store_true")
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--top-k", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--path", default=None)
+    parser.add_argument("--show", type=int, default=10)
+    args = parser.parse_args()
+
+    ranked = search(
+        strategy=args.strategy,
+        hard_mode=args.hard_mode,
+        path=args.path,
+        limit=args.limit,
+        top_k=args.top_k,
+        workers=args.workers,
+    )
+    json.dump(ranked[: args.show], sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
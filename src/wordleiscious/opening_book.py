@@ -0,0 +1,132 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from importlib import resources
+from pathlib import Path
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from wordleiscious.pattern import decode, encode
+from wordleiscious.words import DATA_PACKAGE, data_fingerprint
+
+# Bump whenever the key format or the solvers' choice of guess changes.
+BOOK_VERSION = 1
+
+History = Sequence[Tuple[str, str]]
+
+
+def solver_fingerprint(solver) -> str:
+    # Which guesses the book holds depends on the data files, the solver
+    # class, its lookahead and the candidates and guesses it started from.
+    digest = hashlib.sha1()
+    digest.update(f"{BOOK_VERSION}:{data_fingerprint()}".encode())
+    digest.update(f"{type(solver).__module__}.{type(solver).__qualname__}".encode())
+    digest.update(solver.candidate.bits.tobytes())
+    digest.update(solver.allowed_guess.bits.tobytes())
+    weight = getattr(solver, "weight", None)
+    if weight is not None:
+        digest.update(np.ascontiguousarray(weight).tobytes())
+    lookahead = getattr(solver, "lookahead", None)
+    if lookahead is not None:
+        digest.update(
+            f"{lookahead.depth}:{lookahead.top_k}:{lookahead.hard_mode}".encode()
+        )
+    return digest.hexdigest()
+
+
+def opening_book_path(name: str) -> Path:
+    return Path(resources.files(DATA_PACKAGE) / f"opening_book.{name}.json")
+
+
+class OpeningBook:
+    def __init__(
+        self,
+        solver,
+        path: Optional[os.PathLike] = None,
+        maxsize: int = 2**16,
+    ):
+        # solver is the state before the first guess; every history is taken
+        # to start from it.
+        self.solver = solver
+        self.path = None if path is None else Path(path)
+        self.maxsize = maxsize
+        self.fingerprint = solver_fingerprint(solver)
+        self.entries: "OrderedDict[str, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if self.path is not None and self.path.exists():
+            self.load()
+
+    @staticmethod
+    def key(history: History, hard_mode: bool) -> str:
+        return ("h" if hard_mode else "n") + "".join(
+            f"|{guess}:{encode(outcome)}" for guess, outcome in history
+        )
+
+    def get(self, history: History, hard_mode: bool) -> Optional[str]:
+        key = self.key(history=history, hard_mode=hard_mode)
+        guess = self.entries.get(key)
+        if guess is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return guess
+
+    def put(self, history: History, hard_mode: bool, guess: str):
+        self.entries[self.key(history=history, hard_mode=hard_mode)] = guess
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def guess(self, solver, history: History, hard_mode: bool) -> str:
+        # solver must be self.solver after playing history.
+        guess = self.get(history=history, hard_mode=hard_mode)
+        if guess is None:
+            guess = solver.guess()
+            self.put(history=history, hard_mode=hard_mode, guess=guess)
+        return guess
+
+    def warm(self, first_guess: str, depth: int, hard_mode: bool = False):
+        # Expands every outcome of the first guess and then of the book's own
+        # choices, down to depth more guesses.
+        table = self.solver.table
+
+        def expand(solver, history: History, guess: str, depth: int):
+            codes = table.codes[table.index[guess], solver.candidate.ids()]
+            for code in np.unique(codes):
+                if code == table.all_green:
+                    continue
+                outcome = decode(int(code), n=table.word_length)
+                child = solver.with_guess(
+                    guess=guess, outcome=outcome, hard_mode=hard_mode
+                )
+                child_history = (*history, (guess, outcome))
+                child_guess = self.guess(
+                    solver=child, history=child_history, hard_mode=hard_mode
+                )
+                if depth > 1:
+                    expand(child, child_history, child_guess, depth - 1)
+
+        self.put(history=(), hard_mode=hard_mode, guess=first_guess)
+        expand(self.solver, (), first_guess, depth)
+
+    def load(self):
+        with open(self.path) as fp:
+            stored = json.load(fp)
+        # A book for other word lists, weights or solver is silently dropped.
+        if stored.get("fingerprint") == self.fingerprint:
+            self.entries.update(stored["entries"])
+
+    def save(self):
+        if self.path is None:
+            raise ValueError("This opening book has no path to save to")
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as fp:
+            json.dump(
+                {"fingerprint": self.fingerprint, "entries": self.entries},
+                fp,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, self.path)
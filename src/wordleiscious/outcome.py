@@ -1,115 +1,136 @@
-import pandas as pd
-from colorama import Back, Fore, Style
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
+import numpy as np
 
-def outcome_after_guess(candidate: pd.Series, guess: pd.Series) -> pd.DataFrame:
-    candidate_and_guess_df = pd.merge(candidate, guess, how="cross")
-    return outcome(candidate_and_guess_df=candidate_and_guess_df)
-
+from wordleiscious.pattern import (
+    decode,
+    decode_all,
+    encode_all,
+    outcomes,
+    pack,
+    pattern_codes,
+    remaining_mask,
+)
+from wordleiscious.pattern_table import PatternTable
 
-def outcome(candidate_and_guess_df: pd.DataFrame) -> pd.DataFrame:
-    n = candidate_and_guess_df.candidate.str.len().max()
+if TYPE_CHECKING:
+    import pandas as pd
 
-    outcome_df = candidate_and_guess_df.copy()
 
-    outcome_df["outcome"] = ""
+def outcome_after_guess(
+    candidate: "pd.Series",
+    guess: "pd.Series",
+    table: Optional[PatternTable] = None,
+) -> "pd.DataFrame":
+    import pandas as pd
 
-    guess_chars_df = pd.DataFrame.from_dict(
-        {i: candidate_and_guess_df.guess.str[i] for i in range(n)}
-    )
-
-    candidate_chars_df = pd.DataFrame.from_dict(
-        {i: candidate_and_guess_df.candidate.str[i] for i in range(n)}
-    )
+    candidate_and_guess_df = pd.merge(candidate, guess, how="cross")
+    if (
+        table is not None
+        and table.covers(candidate.values)
+        and table.covers(guess.values)
+    ):
+        # Rows of a cross merge are candidate-major, i.e. the transpose of the
+        # guess x candidate table.
+        codes = table.lookup(
+            guess_ids=table.ids(guess.values),
+            candidate_ids=table.ids(candidate.values),
+        ).T
+        n = table.word_length
+    else:
+        # Each word is packed once rather than once for every row it is on.
+        guess_letters = pack(guess.values)
+        codes = pattern_codes(
+            guess=guess_letters[None, :, :],
+            candidate=pack(candidate.values)[:, None, :],
+        )
+        n = guess_letters.shape[-1]
+    candidate_and_guess_df["outcome"] = _outcome_column(codes=codes.ravel(), n=n)
+    return candidate_and_guess_df
 
-    same_char_count_df = pd.DataFrame(
-        index=candidate_and_guess_df.index, columns=range(n), data=0
-    )
 
-    same_char_green_count_df = pd.DataFrame(
-        index=candidate_and_guess_df.index, columns=range(n), data=0
+def outcome(candidate_and_guess_df: "pd.DataFrame") -> "pd.DataFrame":
+    # A conversion layer over pattern_codes for callers of the string API;
+    # the solvers only ever read integer codes from the pattern table.
+    outcome_df = candidate_and_guess_df.copy()
+    guess = pack(candidate_and_guess_df.guess.values)
+    outcome_df["outcome"] = _outcome_column(
+        codes=pattern_codes(
+            guess=guess,
+            candidate=pack(candidate_and_guess_df.candidate.values),
+        ),
+        n=guess.shape[-1],
     )
-
-    for i in range(n):
-        for ii in range(n):
-            if i == ii:
-                continue
-            same_char = guess_chars_df[i] == candidate_chars_df[ii]
-            same_char_count_df[i] += same_char
-            same_char_green_count_df[i] += same_char & (
-                guess_chars_df[ii] == candidate_chars_df[ii]
-            )
-
-    same_char_not_known_counts_df = same_char_count_df - same_char_green_count_df
-
-    for i in range(n):
-
-        green_mask = guess_chars_df[i] == candidate_chars_df[i]
-        yellow_mask = ~green_mask & (same_char_not_known_counts_df[i] > 0)
-        black_mask = ~green_mask & ~yellow_mask
-
-        outcome_df.loc[green_mask, "outcome"] += "🟩"
-        outcome_df.loc[yellow_mask, "outcome"] += "🟨"
-        outcome_df.loc[black_mask, "outcome"] += "⬛"
-
     return outcome_df
 
 
-def scalar_outcome_after_guess(candidate: str, guess: str) -> str:
-    single_candidate = pd.Series(data=[candidate], name="candidate")
-    single_guess = pd.Series(data=[guess], name="guess")
-    outcome_df = outcome_after_guess(candidate=single_candidate, guess=single_guess)
-    return outcome_df.outcome.values[0]
-
+@lru_cache(maxsize=None)
+def _arrow_outcomes(word_length: int):
+    import pyarrow as pa
 
-def remaining(candidate: pd.Series, guess: pd.Series, outcome: pd.Series) -> pd.Series:
-    n = candidate.str.len().max()
+    return pa.array(outcomes(word_length).tolist())
 
-    remaining = pd.Series(index=candidate.index, name="remaining", data=True)
 
-    # remaining &= remaining[candidate != guess]
+def _outcome_column(codes: np.ndarray, n: int):
+    # The outcome strings, in the dtype pandas gives a new column of strings.
+    # When that is backed by Arrow they are taken from every outcome inside
+    # Arrow, rather than converted there from Python strings.
+    import pandas as pd
 
-    cs = [candidate.str[i] for i in range(n)]
-    os = [outcome.str[i] for i in range(n)]
-    gs = [guess.str[i] for i in range(n)]
+    dtype = pd.Series([""]).dtype
+    if n <= 8 and getattr(dtype, "storage", None) == "pyarrow":
+        return pd.array(_arrow_outcomes(n).take(codes), dtype=dtype)
+    return decode_all(codes, n=n)
 
-    for i in range(n):
-        c = cs[i]
-        o = os[i]
-        g = gs[i]
 
-        green_mask = o == "🟩"
-        yellow_mask = o == "🟨"
-        black_mask = o == "⬛"
-
-        same_g_count = pd.Series(  # The number of times g occurs in the candidate
-            index=candidate.index, data=0
-        )
-        same_g_accounted_for = pd.Series(  # The number of times g occurs and is 🟩 or 🟨
-            index=candidate.index, data=0
-        )
+def _encode_outcomes(outcome: "pd.Series") -> np.ndarray:
+    # Only the distinct outcomes are encoded, at most 3**n of them.
+    import pandas as pd
 
-        for ii in range(n):
-            same_g_count += cs[ii] == g
-            same_g_accounted_for += (cs[ii] == g) & (os[ii] == "🟩")
+    indices, distinct = pd.factorize(outcome.values)
+    return encode_all(list(distinct))[indices]
 
-        remaining[green_mask] &= (c == g)[green_mask]
 
-        remaining[yellow_mask] &= (same_g_count > same_g_accounted_for)[yellow_mask]
-
-        remaining[black_mask] &= (same_g_count == same_g_accounted_for)[black_mask]
-
-    return remaining.astype(bool)
+def scalar_outcome_after_guess(candidate: str, guess: str) -> str:
+    code = pattern_codes(guess=pack([guess])[0], candidate=pack([candidate])[0])
+    return decode(int(code), n=len(guess))
+
+
+def remaining(
+    candidate: "pd.Series",
+    guess: "pd.Series",
+    outcome: "pd.Series",
+    table: Optional[PatternTable] = None,
+) -> "pd.Series":
+    import pandas as pd
+
+    expected = _encode_outcomes(outcome)
+    if (
+        table is not None
+        and table.covers(candidate.values)
+        and table.covers(guess.values)
+    ):
+        codes = table.codes[table.ids(guess.values), table.ids(candidate.values)]
+        _remaining = codes == expected
+    else:
+        _remaining = remaining_mask(
+            candidate=pack(candidate.values),
+            guess=pack(guess.values),
+            code=expected,
+        )
+    return pd.Series(index=candidate.index, name="remaining", data=_remaining)
 
 
-background_lookup = {
-    "🟩": Back.GREEN,
-    "🟨": Back.YELLOW,
-    "⬛": Back.BLACK,
-}
+def display(guess: str, outcome: str) -> str:
+    from colorama import Back, Fore, Style
 
+    background_lookup = {
+        "🟩": Back.GREEN,
+        "🟨": Back.YELLOW,
+        "⬛": Back.BLACK,
+    }
 
-def display(guess: str, outcome: str) -> str:
     return "".join(
         f"{background_lookup[o]}{Fore.LIGHTWHITE_EX}{Style.BRIGHT} {g.upper()} {Style.RESET_ALL}"
         for g, o in zip(guess, outcome)
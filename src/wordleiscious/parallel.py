@@ -0,0 +1,74 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, List, Optional, TypeVar
+
+import numpy as np
+
+from wordleiscious.pattern_table import PatternTable
+
+T = TypeVar("T")
+
+# Below this many (guess, candidate) cells it is cheaper to score in this
+# process than to hand the work to a pool.
+PARALLEL_THRESHOLD = 2**25
+
+# Set in the workers of a process pool: the pool already keeps every core
+# busy, so whatever they score is scored in-process.
+_in_pool_worker = False
+
+
+def _mark_pool_worker():
+    global _in_pool_worker
+    _in_pool_worker = True
+
+
+def default_workers() -> int:
+    return len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else 1
+
+
+def resolve_workers(workers: Optional[int], cells: int) -> int:
+    if workers is None:
+        if _in_pool_worker or cells < PARALLEL_THRESHOLD:
+            workers = 1
+        else:
+            workers = default_workers()
+    return max(1, workers)
+
+
+def executor(workers: int, processes: bool) -> Executor:
+    # Pools are per process: a forked child can't use its parent's.
+    return _executor(workers=workers, processes=processes, pid=os.getpid())
+
+
+@lru_cache(maxsize=None)
+def _executor(workers: int, processes: bool, pid: int) -> Executor:
+    if processes:
+        return ProcessPoolExecutor(max_workers=workers, initializer=_mark_pool_worker)
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def map_guess_chunks(
+    evaluate: Callable[..., T],
+    table: PatternTable,
+    guess_ids: np.ndarray,
+    n_candidates: int,
+    workers: Optional[int] = None,
+    **kwargs,
+) -> List[T]:
+    # Splits the guesses into one contiguous chunk per worker and returns the
+    # results in guess order, whichever worker finishes first.
+    workers = resolve_workers(workers=workers, cells=guess_ids.size * n_candidates)
+    if workers == 1 or guess_ids.size < 2:
+        return [evaluate(table=table, guess_ids=guess_ids, **kwargs)]
+
+    # A table on disk is cheap to reopen in another process, an in-memory one
+    # would have to be copied, so that is scored on threads instead.
+    processes = isinstance(table.codes, np.memmap)
+    futures = [
+        executor(workers=workers, processes=processes).submit(
+            evaluate, table=table, guess_ids=chunk, **kwargs
+        )
+        for chunk in np.array_split(guess_ids, min(workers, guess_ids.size))
+    ]
+    return [future.result() for future in futures]
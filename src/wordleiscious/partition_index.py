@@ -0,0 +1,193 @@
+import os
+from importlib import resources
+from pathlib import Path
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from wordleiscious.bitset import Bitset
+from wordleiscious.words import DATA_PACKAGE
+
+# Bump whenever the layout below changes. The index is derived from a pattern
+# table, so its files are also named after the table's version.
+INDEX_VERSION = 1
+
+
+class PartitionIndex:
+    def __init__(
+        self,
+        ids: np.ndarray,
+        bucket_rows: np.ndarray,
+        bucket_codes: np.ndarray,
+        bucket_starts: np.ndarray,
+    ):
+        # ids[guess_id] is every candidate id grouped by the outcome guess_id
+        # gets on it, in code order and ascending within a bucket. Only
+        # non-empty buckets are listed: those of guess_id are
+        # bucket_rows[guess_id]:bucket_rows[guess_id + 1], each with its code
+        # and where it starts in ids[guess_id].
+        # A plain view, as indexing an np.memmap costs more than the lookups.
+        self.ids = np.asarray(ids)
+        self.bucket_rows = bucket_rows
+        self.bucket_codes = bucket_codes
+        self.bucket_starts = bucket_starts
+
+    def buckets(self, guess_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        # The codes of guess_id's buckets, and their offsets into ids[guess_id]
+        # with the end of the last one appended.
+        rows = slice(self.bucket_rows[guess_id], self.bucket_rows[guess_id + 1])
+        offsets = np.append(self.bucket_starts[rows], self.ids.shape[1])
+        return self.bucket_codes[rows], offsets
+
+    def bucket(self, guess_id: int, code: int) -> np.ndarray:
+        # The candidates that give code for guess_id.
+        first, last = self.bucket_rows[guess_id : guess_id + 2].tolist()
+        i = first + int(np.searchsorted(self.bucket_codes[first:last], code))
+        if i == last or self.bucket_codes[i] != code:
+            return self.ids[guess_id, :0]
+        end = self.bucket_starts[i + 1] if i + 1 < last else self.ids.shape[1]
+        return self.ids[guess_id, self.bucket_starts[i] : end]
+
+    def surviving(self, guess_id: int, code: int, candidate: Bitset) -> Bitset:
+        # candidate & the bucket, looking only at the bucket.
+        bucket = self.bucket(guess_id, code).astype(np.intp)
+        mask = np.zeros(candidate.size, dtype=bool)
+        mask[bucket] = candidate.bits[bucket >> 3] >> (bucket & 7) & 1
+        return Bitset.from_mask(mask=mask)
+
+    def bucket_sizes(
+        self, guess_id: int, candidate: Optional[Bitset] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        # The codes of guess_id's buckets and how many candidates are in each.
+        # A candidate set only masks the ids, nothing is looked up again.
+        codes, offsets = self.buckets(guess_id)
+        if candidate is None:
+            return codes, np.diff(offsets)
+        in_candidate = candidate.mask()[self.ids[guess_id]]
+        return codes, np.add.reduceat(in_candidate, offsets[:-1], dtype=np.int64)
+
+    def bucket_sums(
+        self, guess_id: int, weight: np.ndarray, candidate: Optional[Bitset] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        # Same with the weight of the candidates in each bucket, weight being
+        # indexed by word id.
+        codes, offsets = self.buckets(guess_id)
+        ids = self.ids[guess_id]
+        values = weight[ids]
+        if candidate is not None:
+            values = values * candidate.mask()[ids]
+        return codes, np.add.reduceat(values, offsets[:-1])
+
+    def _bucket_sizes(self, guess_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # The sizes of every bucket of guess_ids, one guess after the other,
+        # and where each guess's run of them starts.
+        first = self.bucket_rows[guess_ids]
+        n_buckets = self.bucket_rows[guess_ids + 1] - first
+        rows = np.zeros(guess_ids.size + 1, dtype=np.int64)
+        np.cumsum(n_buckets, out=rows[1:])
+        buckets = np.repeat(first - rows[:-1], n_buckets) + np.arange(rows[-1])
+        starts = self.bucket_starts[buckets].astype(np.int64)
+        ends = np.empty_like(starts)
+        ends[:-1] = starts[1:]
+        ends[rows[1:] - 1] = self.ids.shape[1]
+        return ends - starts, rows
+
+    def entropy_scores(self, guess_ids: np.ndarray) -> np.ndarray:
+        # As scoring.entropy_scores with every word a candidate, from the
+        # bucket offsets alone.
+        sizes, rows = self._bucket_sizes(guess_ids)
+        n = self.ids.shape[1]
+        x_log2_x = np.add.reduceat(sizes * np.log2(sizes), rows[:-1])
+        return np.log2(n) - x_log2_x / n
+
+    def largest_bucket_scores(self, guess_ids: np.ndarray) -> np.ndarray:
+        # As scoring.largest_bucket_scores with every word a candidate.
+        sizes, rows = self._bucket_sizes(guess_ids)
+        return np.maximum.reduceat(sizes, rows[:-1])
+
+    def eliminated_weight_scores(
+        self, guess_ids: np.ndarray, weight: np.ndarray, chunk_size: int = 256
+    ) -> np.ndarray:
+        # As scoring.eliminated_weight_scores with every word a candidate,
+        # summed in float64 like it so both give the same scores.
+        n = self.ids.shape[1]
+        weight = np.asarray(weight, dtype=np.float64)
+        total_weight = weight.sum()
+        scores = np.empty(guess_ids.size)
+        for i in range(0, guess_ids.size, chunk_size):
+            chunk = guess_ids[i : i + chunk_size]
+            sizes, rows = self._bucket_sizes(chunk)
+            offsets = np.zeros(sizes.size, dtype=np.int64)
+            np.cumsum(sizes[:-1], out=offsets[1:])
+            sums = np.add.reduceat(weight[self.ids[chunk]].ravel(), offsets)
+            kept = np.add.reduceat(sizes * sums, rows[:-1])
+            scores[i : i + chunk.size] = n * total_weight - kept
+        return scores
+
+
+def id_dtype(n_words: int) -> np.dtype:
+    return np.dtype(np.uint16 if n_words <= 2**16 else np.uint32)
+
+
+def build_partition_index(
+    codes: np.ndarray, chunk_size: int = 256, out: Optional[np.ndarray] = None
+) -> PartitionIndex:
+    # Sorts each guess's row of codes, chunk_size rows at a time. Given out,
+    # e.g. a file mapped into memory, the ids are written straight to it.
+    n_guesses, n_candidates = codes.shape
+    ids = out
+    if ids is None:
+        ids = np.empty((n_guesses, n_candidates), dtype=id_dtype(n_candidates))
+    bucket_codes, bucket_starts, bucket_counts = [], [], []
+    for i in range(0, n_guesses, chunk_size):
+        order = np.argsort(codes[i : i + chunk_size], axis=1, kind="stable")
+        ids[i : i + chunk_size] = order
+        sorted_codes = np.take_along_axis(codes[i : i + chunk_size], order, axis=1)
+        starts = np.ones(sorted_codes.shape, dtype=bool)
+        starts[:, 1:] = sorted_codes[:, 1:] != sorted_codes[:, :-1]
+        rows, columns = np.nonzero(starts)
+        bucket_codes.append(sorted_codes[rows, columns])
+        bucket_starts.append(columns.astype(id_dtype(n_candidates)))
+        bucket_counts.append(np.bincount(rows, minlength=sorted_codes.shape[0]))
+    bucket_rows = np.zeros(n_guesses + 1, dtype=np.int64)
+    np.cumsum(np.concatenate(bucket_counts), out=bucket_rows[1:])
+    return PartitionIndex(
+        ids=ids,
+        bucket_rows=bucket_rows,
+        bucket_codes=np.concatenate(bucket_codes),
+        bucket_starts=np.concatenate(bucket_starts),
+    )
+
+
+def partition_index_paths(words: Sequence[str]) -> Tuple[Path, Path]:
+    from wordleiscious.pattern_table import TABLE_VERSION, words_digest
+
+    name = f"partition_index.v{INDEX_VERSION}.{TABLE_VERSION}.{words_digest(words)}"
+    directory = Path(resources.files(DATA_PACKAGE))
+    return directory / f"{name}.npy", directory / f"{name}.npz"
+
+
+def load_partition_index(words: Sequence[str], codes: np.ndarray) -> PartitionIndex:
+    # The ids are mapped from an .npy file and the much smaller buckets are
+    # read from an .npz next to it, both written the first time.
+    ids_path, buckets_path = partition_index_paths(words)
+    if not (ids_path.exists() and buckets_path.exists()):
+        tmp_ids_path = ids_path.with_suffix(f".ids.{os.getpid()}.tmp")
+        tmp_buckets_path = buckets_path.with_suffix(f".buckets.{os.getpid()}.tmp")
+        ids = np.lib.format.open_memmap(
+            tmp_ids_path, mode="w+", dtype=id_dtype(codes.shape[1]), shape=codes.shape
+        )
+        index = build_partition_index(codes=codes, out=ids)
+        ids.flush()
+        del ids
+        with open(tmp_buckets_path, "wb") as fp:
+            np.savez(
+                fp,
+                bucket_rows=index.bucket_rows,
+                bucket_codes=index.bucket_codes,
+                bucket_starts=index.bucket_starts,
+            )
+        os.replace(tmp_ids_path, ids_path)
+        os.replace(tmp_buckets_path, buckets_path)
+    with np.load(buckets_path) as buckets:
+        return PartitionIndex(ids=np.load(ids_path, mmap_mode="r"), **buckets)
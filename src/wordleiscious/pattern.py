@@ -0,0 +1,220 @@
+from functools import lru_cache
+from typing import Iterable, Optional
+
+import numpy as np
+
+# An outcome is coded as a base-3 integer with the first letter as the most
+# significant digit, so "⬛⬛⬛⬛⬛" is 0 and "🟩🟩🟩🟩🟩" is 3**5 - 1 = 242.
+BLACK, YELLOW, GREEN = 0, 1, 2
+SYMBOLS = ("⬛", "🟨", "🟩")
+DIGITS = {symbol: digit for digit, symbol in enumerate(SYMBOLS)}
+
+WORD_LENGTH = 5
+N_PATTERNS = 3**WORD_LENGTH
+ALL_GREEN = N_PATTERNS - 1
+
+
+def n_patterns(word_length: int) -> int:
+    return 3**word_length
+
+
+def code_dtype(word_length: int) -> np.dtype:
+    # The smallest unsigned integer holding every code: uint8 up to 5 letters,
+    # uint16 up to 10 and uint32 up to 20.
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if n_patterns(word_length) <= np.iinfo(dtype).max + 1:
+            return np.dtype(dtype)
+    raise ValueError(f"Words of {word_length} letters have too many outcomes")
+
+
+def encode(outcome: str) -> int:
+    code = 0
+    for symbol in outcome:
+        code = code * 3 + DIGITS[symbol]
+    return code
+
+
+def decode(code: int, n: int = WORD_LENGTH) -> str:
+    symbols = []
+    for _ in range(n):
+        code, digit = divmod(code, 3)
+        symbols.append(SYMBOLS[digit])
+    return "".join(reversed(symbols))
+
+
+def _from_digits(digits: np.ndarray) -> np.ndarray:
+    # Horner's rule, one letter at a time: reducing over a last axis of only
+    # a few letters is slow in numpy.
+    n = digits.shape[-1]
+    codes = np.zeros(digits.shape[:-1], dtype=code_dtype(n))
+    for i in range(n):
+        codes *= 3
+        np.add(codes, digits[..., i], out=codes, casting="unsafe")
+    return codes
+
+
+@lru_cache(maxsize=None)
+def outcomes(word_length: int = WORD_LENGTH) -> np.ndarray:
+    # Every outcome string by code. Up to 8 letters only, as there are 3**n of
+    # them; longer codes are decoded one at a time.
+    if word_length > 8:
+        raise ValueError(f"Too many outcomes to list for {word_length} letters")
+    return np.array(
+        [decode(code, n=word_length) for code in range(n_patterns(word_length))],
+        dtype=object,
+    )
+
+
+OUTCOMES = outcomes()
+
+
+def encode_all(outcomes: Iterable[str]) -> np.ndarray:
+    symbols = _as_code_points(outcomes)
+    digits = (symbols == ord(SYMBOLS[YELLOW])).view(np.uint8)
+    np.putmask(digits, symbols == ord(SYMBOLS[GREEN]), GREEN)
+    return _from_digits(digits)
+
+
+def decode_all(codes: np.ndarray, n: int = WORD_LENGTH) -> np.ndarray:
+    if n <= 8:
+        return outcomes(n)[codes]
+    codes = np.asarray(codes)
+    decoded = [decode(int(code), n=n) for code in codes.ravel()]
+    return np.array(decoded, dtype=object).reshape(codes.shape)
+
+
+def _joined_code_points(strings) -> Optional[np.ndarray]:
+    # Python strings joined and encoded in one go, several times faster than
+    # a fixed width unicode array, and one byte a letter when they are all
+    # ASCII. The separators only all line up when the strings have the same
+    # length; otherwise None.
+    if isinstance(strings, np.ndarray):
+        strings = strings.tolist()
+    try:
+        joined = "\0".join(strings) + "\0"
+    except TypeError:
+        return None
+    try:
+        code_points = np.frombuffer(joined.encode("ascii"), dtype=np.uint8)
+    except UnicodeEncodeError:
+        code_points = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32)
+    n = len(strings[0])
+    if code_points.size != len(strings) * (n + 1) or np.any(code_points[n :: n + 1]):
+        return None
+    return code_points.reshape(len(strings), n + 1)[:, :n]
+
+
+def _arrow_code_points(strings) -> Optional[np.ndarray]:
+    # Arrow backed strings of the same length, read straight from their
+    # buffer of utf-8 bytes, which are the code points when every string is
+    # ASCII; otherwise None.
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    array = pa.array(strings)
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    if array.null_count or not (
+        pa.types.is_string(array.type) or pa.types.is_large_string(array.type)
+    ):
+        return None
+    lengths = pc.min_max(pc.utf8_length(array))
+    n = lengths["min"].as_py()
+    if n != lengths["max"].as_py():
+        return None
+    offset_dtype = np.int64 if pa.types.is_large_string(array.type) else np.int32
+    offsets = np.frombuffer(array.buffers()[1], dtype=offset_dtype)
+    first, last = offsets[array.offset], offsets[array.offset + len(array)]
+    data = np.frombuffer(array.buffers()[2], dtype=np.uint8)[first:last]
+    if data.size == len(array) * n:
+        return data.reshape(len(array), n)
+    code_points = np.frombuffer(
+        data.tobytes().decode("utf-8").encode("utf-32-le"), dtype=np.uint32
+    )
+    return code_points.reshape(len(array), n)
+
+
+def _as_code_points(strings: Iterable[str]) -> np.ndarray:
+    if not hasattr(strings, "__len__"):
+        strings = list(strings)
+    code_points = None
+    if len(strings) > 0:
+        if (
+            isinstance(strings, (list, tuple))
+            or getattr(strings, "dtype", None) == object
+        ):
+            code_points = _joined_code_points(strings)
+        elif hasattr(strings, "__arrow_array__"):
+            code_points = _arrow_code_points(strings)
+    if code_points is not None:
+        return code_points
+    # Going through a fixed width unicode array keeps this vectorized for
+    # strings of different lengths.
+    strings = np.asarray(strings, dtype=str)
+    n = strings.dtype.itemsize // 4
+    return strings.view(np.uint32).reshape(len(strings), n)
+
+
+def pack(words: Iterable[str]) -> np.ndarray:
+    return (_as_code_points(words) - ord("a")).astype(np.uint8, copy=False)
+
+
+# Pairs pattern_codes scores at a time, few enough for the arrays it works
+# on to stay in cache.
+PATTERN_CHUNK_SIZE = 2**14
+
+
+def pattern_codes(guess: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+    # guess and candidate are packed letter arrays (..., n) that broadcast
+    # against each other, e.g. guess[:, None, :] and candidate[None, :, :] for
+    # the full guess x candidate table.
+    shape = np.broadcast_shapes(guess.shape, candidate.shape)
+    if len(shape) == 1:
+        return pattern_codes(guess=guess[None], candidate=candidate[None])[0]
+
+    def rows(letters: np.ndarray, chunk: slice) -> np.ndarray:
+        # The chunk's rows, letter-major, unless letters broadcast along them.
+        if letters.ndim == len(shape) and letters.shape[0] > 1:
+            letters = letters[chunk]
+        return np.ascontiguousarray(np.moveaxis(letters, -1, 0))
+
+    codes = np.empty(shape[:-1], dtype=code_dtype(shape[-1]))
+    n_rows = max(1, PATTERN_CHUNK_SIZE // max(1, int(np.prod(shape[1:-1]))))
+    for i in range(0, shape[0], n_rows):
+        chunk = slice(i, i + n_rows)
+        codes[chunk] = _letter_major_codes(
+            guess=rows(guess, chunk), candidate=rows(candidate, chunk)
+        )
+    return codes
+
+
+def _letter_major_codes(guess: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+    # As pattern_codes with the letters on the first axis, so every step is
+    # a whole-array operation on contiguous rows.
+    n = guess.shape[0]
+    green = guess == candidate
+
+    # A guessed letter that isn't green is yellow when it occurs at a position
+    # of the candidate that isn't green either.
+    letter_bits = np.left_shift((~green).view(np.uint8), candidate, dtype=np.uint32)
+    not_green_letters = letter_bits[0]
+    for i in range(1, n):
+        not_green_letters |= letter_bits[i]
+    digits = np.right_shift(not_green_letters, guess, dtype=np.uint32)
+    digits = digits.astype(np.uint8)
+    digits &= 1
+    # Green takes the place of whatever the letter would be otherwise.
+    digits |= green.view(np.uint8) << 1
+    np.minimum(digits, GREEN, out=digits)
+
+    codes = digits[0].astype(code_dtype(n))
+    for i in range(1, n):
+        codes *= 3
+        codes += digits[i]
+    return codes
+
+
+def remaining_mask(
+    candidate: np.ndarray, guess: np.ndarray, code: np.ndarray
+) -> np.ndarray:
+    return pattern_codes(guess=guess, candidate=candidate) == code
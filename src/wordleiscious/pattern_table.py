@@ -0,0 +1,176 @@
+import hashlib
+import os
+from functools import cached_property, lru_cache
+from importlib import resources
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Sequence, Union
+
+import numpy as np
+
+from wordleiscious.bitset import Bitset
+from wordleiscious.hard_mode import legal_guess_mask
+from wordleiscious.instrument import stage
+from wordleiscious.pattern import (
+    WORD_LENGTH,
+    code_dtype,
+    n_patterns,
+    pack,
+    pattern_codes,
+)
+from wordleiscious.vocabulary import Vocabulary, vocabulary
+from wordleiscious.words import DATA_PACKAGE
+
+if TYPE_CHECKING:
+    from wordleiscious.partition_index import PartitionIndex
+
+# Bump whenever the pattern coding or the table layout changes, so that stale
+# tables on disk are ignored rather than misread.
+TABLE_VERSION = 1
+
+
+class PatternTable:
+    def __init__(self, words: Union[Sequence[str], Vocabulary], codes: np.ndarray):
+        # codes[guess_id, candidate_id], ids being those of the vocabulary.
+        if not isinstance(words, Vocabulary):
+            words = Vocabulary(words=words)
+        self.vocabulary = words
+        self.words = words.words
+        self.index = words.index
+        self.codes = codes
+        # Outcome codes run from 0 to all_green, see wordleiscious.pattern.
+        self.word_length = words.word_length
+        self.n_patterns = n_patterns(self.word_length)
+        self.all_green = self.n_patterns - 1
+        self.consistent = lru_cache(maxsize=2**14)(self._consistent)
+        self.hard_mode_guesses = lru_cache(maxsize=2**14)(self._hard_mode_guesses)
+
+    @classmethod
+    def from_words(cls, words: Sequence[str]) -> "PatternTable":
+        return cls(words=words, codes=build_pattern_table(words=words))
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __reduce__(self):
+        # Tables backed by a file on disk are sent to other processes by path,
+        # so workers share the pages instead of receiving a copy of the codes.
+        if isinstance(self.codes, np.memmap) and self.codes.filename:
+            return _open_pattern_table, (list(self.words), str(self.codes.filename))
+        return PatternTable, (list(self.words), np.asarray(self.codes))
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.index
+
+    def covers(self, words: Iterable[str]) -> bool:
+        return all(word in self.index for word in words)
+
+    def ids(self, words: Iterable[str]) -> np.ndarray:
+        return self.vocabulary.ids(words)
+
+    def lookup(self, guess_ids: np.ndarray, candidate_ids: np.ndarray) -> np.ndarray:
+        return self.codes[np.ix_(guess_ids, candidate_ids)]
+
+    @property
+    def letter_masks(self) -> np.ndarray:
+        return self.vocabulary.letter_masks
+
+    @cached_property
+    def partitions(self) -> "PartitionIndex":
+        # Built the first time it is needed, and kept on disk next to the
+        # table when the table is.
+        from wordleiscious.partition_index import (
+            build_partition_index,
+            load_partition_index,
+        )
+
+        if isinstance(self.codes, np.memmap) and self.codes.filename:
+            return load_partition_index(words=list(self.words), codes=self.codes)
+        return build_partition_index(codes=self.codes)
+
+    def _consistent(self, guess_id: int, code: int) -> Bitset:
+        # The words that would have given this outcome for this guess.
+        with stage("consistent"):
+            return Bitset.from_mask(mask=self.codes[guess_id] == code)
+
+    def _hard_mode_guesses(self, guess_id: int, code: int) -> Bitset:
+        # The words hard mode allows after this guess had this outcome.
+        with stage("hard_mode_guesses"):
+            return Bitset.from_mask(
+                mask=legal_guess_mask(
+                    vocabulary=self.vocabulary, guess_id=guess_id, code=code
+                )
+            )
+
+
+def build_pattern_table(
+    words: Sequence[str], chunk_size: int = 64, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    # Codes are as small as the word length allows. Given out, e.g. a file
+    # mapped into memory, only chunk_size rows at a time are built in memory.
+    from tqdm import tqdm
+
+    letters = pack(words)
+    codes = out
+    if codes is None:
+        codes = np.empty(
+            (len(letters), len(letters)), dtype=code_dtype(letters.shape[-1])
+        )
+    for i in tqdm(range(0, len(letters), chunk_size), leave=False):
+        codes[i : i + chunk_size] = pattern_codes(
+            guess=letters[i : i + chunk_size, None, :],
+            candidate=letters[None, :, :],
+        )
+    return codes
+
+
+def words_digest(words: Sequence[str]) -> str:
+    return hashlib.sha1("\n".join(words).encode("ascii")).hexdigest()[:12]
+
+
+def pattern_table_path(words: Sequence[str]) -> Path:
+    return Path(
+        resources.files(DATA_PACKAGE)
+        / f"pattern_table.v{TABLE_VERSION}.{words_digest(words)}.npy"
+    )
+
+
+def load_pattern_table(words: Union[Sequence[str], Vocabulary]) -> PatternTable:
+    word_list = list(words.words if isinstance(words, Vocabulary) else words)
+    path = pattern_table_path(word_list)
+    if not path.exists():
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        codes = np.lib.format.open_memmap(
+            tmp_path,
+            mode="w+",
+            dtype=code_dtype(len(word_list[0]) if word_list else WORD_LENGTH),
+            shape=(len(word_list), len(word_list)),
+        )
+        build_pattern_table(word_list, out=codes)
+        codes.flush()
+        del codes
+        os.replace(tmp_path, path)
+    return PatternTable(words=words, codes=np.load(path, mmap_mode="r"))
+
+
+_open_tables: Dict[str, PatternTable] = {}
+
+
+def _open_pattern_table(words: Sequence[str], filename: str) -> PatternTable:
+    if filename not in _open_tables:
+        _open_tables[filename] = PatternTable(
+            words=words, codes=np.load(filename, mmap_mode="r")
+        )
+    return _open_tables[filename]
+
+
+@lru_cache(maxsize=None)
+def pattern_table() -> PatternTable:
+    return load_pattern_table(words=vocabulary())
+
+
+def table_covering(words: Iterable[str]) -> PatternTable:
+    words = list(dict.fromkeys(words))
+    table = pattern_table()
+    if table.covers(words):
+        return table
+    return PatternTable.from_words(words=words)
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+import numpy as np
+
+# Room for a couple of thousand score arrays over the full word list.
+DEFAULT_MAXBYTES = 2**28
+
+
+class ScoreCache:
+    def __init__(self, maxbytes: int = DEFAULT_MAXBYTES):
+        # Least recently used scores are evicted once the arrays held add up
+        # to more than maxbytes.
+        self.maxbytes = maxbytes
+        self.entries: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        scores = self.entries.get(key)
+        if scores is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return scores
+
+    def put(self, key: Hashable, scores: np.ndarray):
+        # Handed out to every later caller, so it must not change.
+        scores.flags.writeable = False
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.nbytes -= previous.nbytes
+        self.entries[key] = scores
+        self.nbytes += scores.nbytes
+        while self.nbytes > self.maxbytes and self.entries:
+            _, evicted = self.entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+
+    def scores(self, key: Hashable, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        scores = self.get(key)
+        if scores is None:
+            scores = compute()
+            self.put(key, scores)
+        return scores
+
+    def clear(self):
+        self.entries.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+
+# Shared by every entropy and model solver. Keys start with what is being
+# scored and the table, followed by the candidate and allowed guess bitsets.
+SCORE_CACHE = ScoreCache()
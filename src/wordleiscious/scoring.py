@@ -0,0 +1,229 @@
+from typing import Callable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from wordleiscious.pattern import N_PATTERNS
+from wordleiscious.pattern_table import PatternTable
+
+# Upper bound on the (guess, candidate) cells looked at in one go, so peak
+# memory doesn't grow with the number of guesses being scored.
+DEFAULT_TILE_SIZE = 2**18
+
+# Histograms are small next to the codes until there are more than a few
+# letters: they only start to bound the tile size for longer words.
+HISTOGRAM_TILES = 16
+
+# Up to this many candidates, guesses are deduplicated before scoring.
+PRUNE_THRESHOLD = 16
+
+
+def tile_rows(table: PatternTable, n_candidates: int, tile_size: int) -> int:
+    # Each guess also gets a histogram of table.n_patterns buckets, bounded
+    # by HISTOGRAM_TILES times as many cells.
+    return max(
+        1,
+        min(
+            tile_size // max(1, n_candidates),
+            HISTOGRAM_TILES * tile_size // table.n_patterns,
+        ),
+    )
+
+
+def tile_weights(
+    table: PatternTable,
+    guess_ids: np.ndarray,
+    candidate_ids: np.ndarray,
+    weight: np.ndarray,
+    tile_size: int = DEFAULT_TILE_SIZE,
+) -> np.ndarray:
+    # The candidates' weights repeated for every row of the largest tile, so
+    # weighing a tile's codes takes a view rather than a fresh copy.
+    rows = min(guess_ids.size, tile_rows(table, candidate_ids.size, tile_size))
+    return np.tile(weight[candidate_ids].astype(np.float64), (rows, 1))
+
+
+def tiles(
+    table: PatternTable,
+    guess_ids: np.ndarray,
+    candidate_ids: np.ndarray,
+    tile_size: int = DEFAULT_TILE_SIZE,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    rows = tile_rows(table, candidate_ids.size, tile_size)
+    all_candidates = candidate_ids.size == table.codes.shape[1]
+    # Copying whole rows and then picking columns is faster unless only a
+    # few candidates are left, when gathering the cells directly wins.
+    few_candidates = candidate_ids.size * 32 < table.codes.shape[1]
+    for i in range(0, guess_ids.size, rows):
+        tile_guess_ids = guess_ids[i : i + rows]
+        if few_candidates:
+            codes = table.codes[np.ix_(tile_guess_ids, candidate_ids)]
+        else:
+            codes = table.codes[tile_guess_ids]
+            if not all_candidates:
+                codes = np.take(codes, candidate_ids, axis=1)
+        yield tile_guess_ids, codes
+
+
+def pattern_histograms(
+    codes: np.ndarray,
+    weights: Optional[np.ndarray] = None,
+    n_patterns: int = N_PATTERNS,
+) -> np.ndarray:
+    # One row of n_patterns bucket counts (or weight sums) per row of codes,
+    # done as a single bincount by giving each row its own range of bins.
+    n_rows = codes.shape[0]
+    bins = codes.astype(np.intp)
+    bins += (np.arange(n_rows, dtype=np.intp) * n_patterns)[:, None]
+    if weights is not None:
+        weights = np.broadcast_to(weights, codes.shape).ravel()
+    histograms = np.bincount(
+        bins.ravel(), weights=weights, minlength=n_rows * n_patterns
+    )
+    return histograms.reshape(n_rows, n_patterns)
+
+
+def _x_log2_x(x: np.ndarray) -> np.ndarray:
+    if np.issubdtype(x.dtype, np.integer):
+        # Counts are bounded by the number of candidates, so a lookup is
+        # cheaper than taking logs of every bucket.
+        n = np.arange(x.max(initial=0) + 1)
+        return (n * np.log2(np.maximum(n, 1)))[x]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(x > 0, x * np.log2(x), 0.0)
+
+
+def entropy(histograms: np.ndarray) -> np.ndarray:
+    # -sum(p log p) with p = n / total is log(total) - sum(n log n) / total.
+    total = histograms.sum(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(
+            total > 0,
+            np.log2(total) - _x_log2_x(histograms).sum(axis=-1) / total,
+            0.0,
+        )
+
+
+def entropy_scores(
+    table: PatternTable,
+    guess_ids: np.ndarray,
+    candidate_ids: np.ndarray,
+    tile_size: int = DEFAULT_TILE_SIZE,
+    weight: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Given weight, indexed by word id, candidates are that likely instead
+    # of equally likely: the buckets are summed weights rather than counts,
+    # from the same single bincount.
+    weights = None
+    if weight is not None:
+        weights = tile_weights(
+            table=table,
+            guess_ids=guess_ids,
+            candidate_ids=candidate_ids,
+            weight=weight,
+            tile_size=tile_size,
+        )
+    scores = np.empty(guess_ids.size)
+    i = 0
+    for tile_guess_ids, codes in tiles(
+        table=table,
+        guess_ids=guess_ids,
+        candidate_ids=candidate_ids,
+        tile_size=tile_size,
+    ):
+        scores[i : i + tile_guess_ids.size] = entropy(
+            pattern_histograms(
+                codes=codes,
+                weights=None if weights is None else weights[: codes.shape[0]],
+                n_patterns=table.n_patterns,
+            )
+        )
+        i += tile_guess_ids.size
+    return scores
+
+
+def eliminated_weight(counts: np.ndarray, weight_sums: np.ndarray) -> np.ndarray:
+    # For every bucket of n candidates sharing an outcome, each of them
+    # eliminates all the weight outside the bucket: sum(n * (W - W_p)).
+    total_weight = weight_sums.sum(axis=-1)
+    return counts.sum(axis=-1) * total_weight - (counts * weight_sums).sum(axis=-1)
+
+
+def eliminated_weight_scores(
+    table: PatternTable,
+    guess_ids: np.ndarray,
+    candidate_ids: np.ndarray,
+    weight: np.ndarray,
+    tile_size: int = DEFAULT_TILE_SIZE,
+) -> np.ndarray:
+    weights = tile_weights(
+        table=table,
+        guess_ids=guess_ids,
+        candidate_ids=candidate_ids,
+        weight=weight,
+        tile_size=tile_size,
+    )
+    scores = np.empty(guess_ids.size)
+    i = 0
+    for tile_guess_ids, codes in tiles(
+        table=table,
+        guess_ids=guess_ids,
+        candidate_ids=candidate_ids,
+        tile_size=tile_size,
+    ):
+        scores[i : i + tile_guess_ids.size] = eliminated_weight(
+            counts=pattern_histograms(codes=codes, n_patterns=table.n_patterns),
+            weight_sums=pattern_histograms(
+                codes=codes,
+                weights=weights[: codes.shape[0]],
+                n_patterns=table.n_patterns,
+            ),
+        )
+        i += tile_guess_ids.size
+    return scores
+
+
+def largest_bucket_scores(
+    table: PatternTable,
+    guess_ids: np.ndarray,
+    candidate_ids: np.ndarray,
+    tile_size: int = DEFAULT_TILE_SIZE,
+) -> np.ndarray:
+    # How many candidates are left at worst after each guess.
+    scores = np.empty(guess_ids.size, dtype=np.int64)
+    i = 0
+    for tile_guess_ids, codes in tiles(
+        table=table,
+        guess_ids=guess_ids,
+        candidate_ids=candidate_ids,
+        tile_size=tile_size,
+    ):
+        scores[i : i + tile_guess_ids.size] = pattern_histograms(
+            codes=codes, n_patterns=table.n_patterns
+        ).max(axis=-1, initial=0)
+        i += tile_guess_ids.size
+    return scores
+
+
+def pruned_scores(
+    evaluate: Callable[..., np.ndarray],
+    table: PatternTable,
+    guess_ids: np.ndarray,
+    candidate_ids: np.ndarray,
+    **kwargs,
+) -> np.ndarray:
+    # Exactly what evaluate gives every guess, but evaluating only one guess
+    # per distinct column of outcomes on the candidates, since scores only
+    # depend on that column. Guesses sharing no letter with any candidate
+    # are all ⬛ and aren't even looked up.
+    candidate_letters = np.bitwise_or.reduce(table.letter_masks[candidate_ids])
+    informative = np.flatnonzero(table.letter_masks[guess_ids] & candidate_letters)
+    codes = np.zeros((guess_ids.size, candidate_ids.size), dtype=table.codes.dtype)
+    codes[informative] = table.lookup(guess_ids[informative], candidate_ids)
+    # Each row viewed as one opaque value sorts much faster than axis=0.
+    row_dtype = np.dtype((np.void, codes.itemsize * candidate_ids.size))
+    rows = codes.view(row_dtype).ravel()
+    _, first, inverse = np.unique(rows, return_index=True, return_inverse=True)
+    scores = evaluate(
+        table=table, guess_ids=guess_ids[first], candidate_ids=candidate_ids, **kwargs
+    )
+    return scores[inverse.ravel()]
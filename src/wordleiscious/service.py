@@ -0,0 +1,203 @@
+import argparse
+import asyncio
+import json
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+from wordleiscious.opening_book import History
+
+# How long the first request of a batch waits for others to join it.
+DEFAULT_BATCH_WINDOW = 0.005
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found"}
+
+
+class SolverService:
+    def __init__(
+        self,
+        solver,
+        hard_mode: bool = False,
+        first_guess: Optional[str] = None,
+        batch_window: float = DEFAULT_BATCH_WINDOW,
+        executor: Optional[Executor] = None,
+    ):
+        # solver is the state before the first guess and, with its pattern
+        # table and the score cache, is shared by every request. Solving runs
+        # on a single worker thread by default since neither is thread safe.
+        self.solver = solver
+        self.hard_mode = hard_mode
+        self.first_guess = first_guess
+        self.batch_window = batch_window
+        self.executor = executor or ThreadPoolExecutor(max_workers=1)
+        self.pending: List[Tuple[History, asyncio.Future]] = []
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+        self.requests = 0
+        self.batches = 0
+        self.states = 0
+
+    async def next_guess(self, history: History) -> str:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((history, future))
+        self.requests += 1
+        if self.flush_handle is None:
+            self.flush_handle = loop.call_later(
+                self.batch_window, lambda: asyncio.ensure_future(self.flush())
+            )
+        return await future
+
+    async def flush(self):
+        self.flush_handle = None
+        pending, self.pending = self.pending, []
+        self.batches += 1
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self.executor, self.solve, [history for history, _ in pending]
+            )
+        except Exception as e:
+            results = [e] * len(pending)
+        for (_, future), result in zip(pending, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def solve(self, histories: Sequence[History]) -> List:
+        # Histories that lead to the same state are answered by one guess.
+        guesses: Dict[Hashable, str] = {}
+        results = []
+        for history in histories:
+            try:
+                solver = self.replay(history=history)
+            except (KeyError, ValueError) as e:
+                results.append(ValueError(f"Invalid history: {e}"))
+                continue
+            if not history and self.first_guess is not None:
+                results.append(self.first_guess)
+                continue
+            if len(solver.candidate) == 0:
+                results.append(ValueError("No word fits this history"))
+                continue
+            key = (solver.candidate, solver.allowed_guess if self.hard_mode else None)
+            if key not in guesses:
+                guesses[key] = solver.guess()
+                self.states += 1
+            results.append(guesses[key])
+        return results
+
+    def replay(self, history: History):
+        solver = self.solver
+        for guess, outcome in history:
+            if len(outcome) != len(guess):
+                raise ValueError(f"{outcome} is not an outcome of {guess}")
+            solver = solver.with_guess(
+                guess=guess, outcome=outcome, hard_mode=self.hard_mode
+            )
+        return solver
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        # Just enough HTTP for POST /guess with {"history": [[guess, outcome]]}
+        # in and {"guess": ...} or {"error": ...} out, one request per
+        # connection.
+        try:
+            request_line = await reader.readline()
+            if not request_line:
+                return
+            try:
+                method, path, body = await _read_request(request_line, reader)
+            except (ValueError, asyncio.IncompleteReadError) as e:
+                status, response = 400, {"error": f"Malformed request: {e}"}
+            else:
+                status, response = await self.route(method, path, body)
+
+            payload = json.dumps(response, ensure_ascii=False).encode()
+            writer.write(
+                f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                "Connection: close\r\n\r\n".encode() + payload
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def route(self, method: str, path: str, body: bytes) -> Tuple[int, dict]:
+        if (method, path) != ("POST", "/guess"):
+            return 404, {"error": f"No route for {method} {path}"}
+        try:
+            history = [
+                (guess, outcome)
+                for guess, outcome in json.loads(body or b"{}")["history"]
+            ]
+            return 200, {"guess": await self.next_guess(history)}
+        except (KeyError, TypeError, ValueError) as e:
+            return 400, {"error": str(e)}
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8000):
+        return await asyncio.start_server(self.handle, host=host, port=port)
+
+
+async def _read_request(
+    request_line: bytes, reader: asyncio.StreamReader
+) -> Tuple[str, str, bytes]:
+    # The method, path and body. A request line, header or Content-Length
+    # that doesn't parse raises ValueError, a body cut short
+    # IncompleteReadError.
+    method, path, _ = request_line.decode().split(" ", 2)
+    headers = {}
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, _, value = line.decode().partition(":")
+        headers[name.strip().lower()] = value.strip()
+    body = await reader.readexactly(int(headers.get("content-length", 0)))
+    return method, path, body
+
+
+async def request_guess(
+    history: History, host: str = "127.0.0.1", port: int = 8000
+) -> Tuple[int, dict]:
+    reader, writer = await asyncio.open_connection(host=host, port=port)
+    body = json.dumps({"history": [list(turn) for turn in history]}).encode()
+    writer.write(
+        f"POST /guess HTTP/1.1\r\nHost: {host}\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+        + body
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    response = await reader.read()
+    writer.close()
+    return status, json.loads(response.partition(b"\r\n\r\n")[2])
+
+
+def main():
+    from wordleiscious.benchmark import STRATEGIES, make_solver
+
+    parser = argparse.ArgumentParser(description="Serve next guesses over HTTP.")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="entropy")
+    parser.add_argument("--hard-mode", action="store_true")
+    parser.add_argument("--first-guess", default="tares")
+    parser.add_argument("--batch-window", type=float, default=DEFAULT_BATCH_WINDOW)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    service = SolverService(
+        solver=make_solver(strategy=args.strategy, hard_mode=args.hard_mode),
+        hard_mode=args.hard_mode,
+        first_guess=args.first_guess,
+        batch_window=args.batch_window,
+    )
+
+    async def serve_forever():
+        server = await service.serve(host=args.host, port=args.port)
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(serve_forever())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+from typing import Dict, Hashable, Iterable, Optional
+
+import numpy as np
+
+from wordleiscious.instrument import stage
+
+
+def simulate(
+    solver,
+    solutions: Iterable[str],
+    first_guess: str,
+    hard_mode: bool = False,
+    second_guess: Optional[str] = None,
+) -> np.ndarray:
+    # Plays every solution from solver together, one turn at a time, and
+    # returns how many guesses each took. Games in the same state share one
+    # solver and one guess, and a state reached again is not re-evaluated:
+    # as in decision_tree, only the candidates (and in hard mode the allowed
+    # guesses) decide the solver's choice. second_guess, if given, is played
+    # next wherever more than one candidate is left and it is allowed.
+    table = solver.table
+    solution_ids = table.ids(solutions)
+    n_guesses = np.zeros(solution_ids.size, dtype=np.int32)
+    guess_ids: Dict[Hashable, int] = {}
+
+    states = [solver]
+    state_guess_id = np.array([table.index[first_guess]], dtype=np.intp)
+    game = np.arange(solution_ids.size)
+    game_state = np.zeros(solution_ids.size, dtype=np.intp)
+
+    for turn in range(1, len(table) + 1):
+        codes = table.codes[state_guess_id[game_state], solution_ids[game]]
+        solved = codes == table.all_green
+        n_guesses[game[solved]] = turn
+        game, game_state, codes = game[~solved], game_state[~solved], codes[~solved]
+        if game.size == 0:
+            return n_guesses
+
+        with stage("simulate_turn", games=game.size):
+            # Each (state, outcome) pair left over becomes a state of the next turn.
+            pairs, game_state = np.unique(
+                game_state * table.n_patterns + codes, return_inverse=True
+            )
+            next_states = []
+            next_guess_id = np.empty(pairs.size, dtype=np.intp)
+            for i, pair in enumerate(pairs.tolist()):
+                state, code = divmod(pair, table.n_patterns)
+                child = states[state].with_guess_id(
+                    guess_id=state_guess_id[state], code=code, hard_mode=hard_mode
+                )
+                key = (child.candidate, child.allowed_guess if hard_mode else None)
+                if (
+                    turn == 1
+                    and second_guess is not None
+                    and len(child.candidate) > 1
+                    and table.index[second_guess] in child.allowed_guess
+                ):
+                    next_guess_id[i] = table.index[second_guess]
+                else:
+                    if key not in guess_ids:
+                        guess_ids[key] = child.guess_id()
+                    next_guess_id[i] = guess_ids[key]
+                next_states.append(child)
+            states, state_guess_id = next_states, next_guess_id
+
+    raise RuntimeError(f"{solution_ids.size} games were never solved")
@@ -0,0 +1,183 @@
+import copy
+import hashlib
+from typing import TYPE_CHECKING, Iterable, Optional
+
+import numpy as np
+
+from wordleiscious.bitset import Bitset
+from wordleiscious.instrument import stage
+from wordleiscious.kernels import kernel
+from wordleiscious.parallel import map_guess_chunks
+from wordleiscious.pattern import encode
+from wordleiscious.pattern_table import PatternTable, table_covering
+from wordleiscious.score_cache import SCORE_CACHE
+from wordleiscious.scoring import (
+    DEFAULT_TILE_SIZE,
+    PRUNE_THRESHOLD,
+    pruned_scores,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class BaseSolver:
+    # Each strategy names the kernel function scoring its guesses over the
+    # candidates, the partition index method scoring them when every word is
+    # a candidate, the tag its scores are cached under and the name they go
+    # by, and says whether lower scores are better.
+    kernel_scores: str
+    index_scores: str
+    cache_tag: str
+    score_name: str
+    lower_is_better = False
+    # Whether index_scores takes the weight. Gathering the weights into the
+    # buckets beats scanning tiles of codes, but not the numba kernel.
+    weighted_index = False
+
+    def __init__(
+        self,
+        candidate: Bitset,
+        allowed_guess: Bitset,
+        table: PatternTable,
+        weight: Optional[np.ndarray] = None,
+        weight_digest: Optional[str] = None,
+    ):
+        self.candidate = candidate
+        self.allowed_guess = allowed_guess
+        self.table = table
+        # Without weight, every candidate is equally likely.
+        self.weight = weight  # Aligned with the table's word ids, shared by all states
+        if weight is not None and weight_digest is None:
+            weight_digest = hashlib.sha1(np.ascontiguousarray(weight)).hexdigest()
+        self.weight_digest = weight_digest
+
+    @classmethod
+    def from_candidates_and_guesses(
+        cls,
+        candidates: Iterable[str],
+        allowed_guesses: Iterable[str],
+        table: Optional[PatternTable] = None,
+        **kwargs,
+    ):
+        # kwargs go to the strategy's constructor, e.g. entropy's lookahead.
+        candidates = list(candidates)
+        allowed_guesses = list(allowed_guesses)
+        if table is None:
+            table = table_covering(words=candidates + allowed_guesses)
+        return cls(
+            candidate=Bitset.from_ids(ids=table.ids(candidates), size=len(table)),
+            allowed_guess=Bitset.from_ids(
+                ids=table.ids(allowed_guesses), size=len(table)
+            ),
+            table=table,
+            **kwargs,
+        )
+
+    def with_guess(self, guess: str, outcome: str, hard_mode: bool = False):
+        return self.with_guess_id(
+            guess_id=self.table.index[guess],
+            code=encode(outcome),
+            hard_mode=hard_mode,
+        )
+
+    def with_guess_id(self, guess_id: int, code: int, hard_mode: bool = False):
+        # Plain ints, so numpy scalars hit the same cache entries.
+        guess_id, code = int(guess_id), int(code)
+        with stage("with_guess", solver=self):
+            candidate = self.candidate & self.table.consistent(guess_id, code)
+            allowed_guess = self.allowed_guess.without(guess_id)
+            if hard_mode:
+                allowed_guess &= self.table.hard_mode_guesses(guess_id, code)
+
+        # Everything else, the table, weight and any lookahead, is shared.
+        child = copy.copy(self)
+        child.candidate = candidate
+        child.allowed_guess = allowed_guess
+        return child
+
+    def scores(
+        self,
+        tile_size: int = DEFAULT_TILE_SIZE,
+        workers: Optional[int] = None,
+        prune: bool = True,
+    ) -> np.ndarray:
+        # The score of every allowed guess, in allowed_guess.ids() order.
+        weight = {} if self.weight is None else {"weight": self.weight}
+
+        def compute() -> np.ndarray:
+            candidate_ids = self.candidate.ids()
+            pruned = prune and candidate_ids.size <= PRUNE_THRESHOLD
+            # Every word is a candidate, so the partition index has every
+            # bucket already, and their sizes alone beat scanning codes.
+            indexed = candidate_ids.size == len(self.table) and (
+                self.weight is None
+                or (self.weighted_index and kernel() is kernel("numpy"))
+            )
+            evaluate = getattr(kernel(), self.kernel_scores)
+            with stage("evaluate", solver=self, pruned=pruned):
+                if indexed:
+                    return getattr(self.table.partitions, self.index_scores)(
+                        guess_ids=self.allowed_guess.ids(), **weight
+                    )
+                if pruned:
+                    return pruned_scores(
+                        evaluate=evaluate,
+                        table=self.table,
+                        guess_ids=self.allowed_guess.ids(),
+                        candidate_ids=candidate_ids,
+                        tile_size=tile_size,
+                        **weight,
+                    )
+                return np.concatenate(
+                    map_guess_chunks(
+                        evaluate=evaluate,
+                        table=self.table,
+                        guess_ids=self.allowed_guess.ids(),
+                        n_candidates=candidate_ids.size,
+                        workers=workers,
+                        candidate_ids=candidate_ids,
+                        tile_size=tile_size,
+                        **weight,
+                    )
+                )
+
+        with stage("scores", solver=self):
+            return SCORE_CACHE.scores(
+                key=(
+                    self.cache_tag,
+                    self.weight_digest,
+                    self.table,
+                    self.candidate,
+                    self.allowed_guess,
+                ),
+                compute=compute,
+            )
+
+    def evaluate_guesses(
+        self,
+        tile_size: int = DEFAULT_TILE_SIZE,
+        workers: Optional[int] = None,
+        prune: bool = True,
+    ) -> "pd.Series":
+        import pandas as pd
+
+        return pd.Series(
+            name=self.score_name,
+            index=pd.Index(
+                name="guess", data=self.table.words[self.allowed_guess.ids()]
+            ),
+            data=self.scores(tile_size=tile_size, workers=workers, prune=prune),
+        )
+
+    def best_guesses(self) -> "pd.DataFrame":
+        guess_scores = self.evaluate_guesses()
+        best = guess_scores.min() if self.lower_is_better else guess_scores.max()
+        guess_scores_df = guess_scores.reset_index()
+        return guess_scores_df[guess_scores_df[self.score_name] == best]
+
+    def guess(self) -> str:
+        return self.table.words[self.guess_id()]
+
+    def guess_id(self) -> int:
+        raise NotImplementedError
@@ -0,0 +1,76 @@
+import json
+import os
+from typing import Dict, List, Sequence, Tuple
+
+# Playing from a strategy file only needs the standard library, so this module
+# must not import numpy or pandas (nor anything of ours that does). Outcomes
+# are coded the same way as in wordleiscious.pattern.
+DIGITS = {"⬛": 0, "🟨": 1, "🟩": 2}
+
+STRATEGY_VERSION = 1
+
+
+def encode(outcome: str) -> int:
+    code = 0
+    for symbol in outcome:
+        code = code * 3 + DIGITS[symbol]
+    return code
+
+
+class Strategy:
+    def __init__(
+        self,
+        guesses: List[str],
+        children: List[Dict[int, int]],
+        hard_mode: bool = False,
+    ):
+        # Node 0 is the first guess. children[node] maps the outcome code of
+        # that node's guess to the node to play next.
+        self.guesses = guesses
+        self.children = children
+        self.hard_mode = hard_mode
+
+    def node(self, history: Sequence[Tuple[str, str]]) -> int:
+        node = 0
+        for guess, outcome in history:
+            if guess != self.guesses[node]:
+                raise ValueError(
+                    f"{guess} is off the strategy, expected {self.guesses[node]}"
+                )
+            try:
+                node = self.children[node][encode(outcome)]
+            except KeyError:
+                raise ValueError(f"{outcome} is not a possible outcome of {guess}")
+        return node
+
+    def guess(self, history: Sequence[Tuple[str, str]]) -> str:
+        return self.guesses[self.node(history=history)]
+
+    def to_json(self) -> dict:
+        return {
+            "version": STRATEGY_VERSION,
+            "hard_mode": self.hard_mode,
+            "nodes": [
+                [guess, [[code, child] for code, child in sorted(children.items())]]
+                for guess, children in zip(self.guesses, self.children)
+            ],
+        }
+
+    @classmethod
+    def from_json(cls, stored: dict) -> "Strategy":
+        if stored.get("version") != STRATEGY_VERSION:
+            raise ValueError(f"Unsupported strategy version {stored.get('version')}")
+        return cls(
+            guesses=[guess for guess, _ in stored["nodes"]],
+            children=[dict(children) for _, children in stored["nodes"]],
+            hard_mode=stored["hard_mode"],
+        )
+
+    def save(self, path: os.PathLike):
+        with open(path, "w") as fp:
+            json.dump(self.to_json(), fp, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: os.PathLike) -> "Strategy":
+        with open(path) as fp:
+            return cls.from_json(json.load(fp))
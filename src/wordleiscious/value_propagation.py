@@ -1,81 +1,172 @@
-import pandas as pd
+import argparse
+import json
+import sys
+import time
+from typing import Optional
 
-from wordleiscious.words import candidate_weights
-from outcome import outcome_after_guess, remaining
-from tqdm.auto import tqdm
-import swifter
 import numpy as np
 
-tqdm.pandas()
-
-
-def main():
-
-    word_weights_df = (
-        pd.DataFrame.from_dict(candidate_weights(), orient="index")
-        .reset_index()
-        .rename(columns={"index": "word", 0: "weight"})
-        .sample(n=100)
-        .reset_index(drop=True)
+from wordleiscious.bitset import POPCOUNT
+from wordleiscious.parallel import executor, resolve_workers
+from wordleiscious.pattern_table import PatternTable, pattern_table
+from wordleiscious.words import word_weights
+
+# Answers whose rows are compared in one go: each guess then looks at
+# DEFAULT_BLOCK_SIZE * len(candidates) cells, about 13M for all the words.
+DEFAULT_BLOCK_SIZE = 1024
+
+
+class ImpactMatrix:
+    def __init__(self, bits: np.ndarray, candidate_ids: np.ndarray):
+        # Bit j of row i, little endian as in Bitset, is set when playing the
+        # guesses against answer candidate_ids[i] eliminates candidate_ids[j].
+        self.bits = bits
+        self.candidate_ids = candidate_ids
+
+    def __len__(self) -> int:
+        return self.candidate_ids.size
+
+    @property
+    def nbytes(self) -> int:
+        return self.bits.nbytes
+
+    def mask(self, rows: slice = slice(None)) -> np.ndarray:
+        return np.unpackbits(
+            self.bits[rows], axis=1, count=len(self), bitorder="little"
+        ).view(bool)
+
+    def eliminated_ids(self, answer_id: int) -> np.ndarray:
+        i = np.searchsorted(self.candidate_ids, answer_id)
+        if i == len(self) or self.candidate_ids[i] != answer_id:
+            raise KeyError(answer_id)
+        return self.candidate_ids[self.mask(rows=slice(i, i + 1))[0]]
+
+    def counts(self) -> np.ndarray:
+        # How many candidates each answer eliminates.
+        return POPCOUNT[self.bits].sum(axis=1, dtype=np.int64)
+
+    def propagate(
+        self, weight: np.ndarray, block_size: int = DEFAULT_BLOCK_SIZE
+    ) -> np.ndarray:
+        # The weight each answer eliminates, weight being indexed by word id.
+        candidate_weight = weight[self.candidate_ids]
+        eliminated = np.empty(len(self))
+        for start in range(0, len(self), block_size):
+            rows = slice(start, start + block_size)
+            eliminated[rows] = self.mask(rows=rows) @ candidate_weight
+        return eliminated
+
+    def expected_eliminated_weight(
+        self, weight: np.ndarray, block_size: int = DEFAULT_BLOCK_SIZE
+    ) -> float:
+        # With answers drawn in proportion to weight.
+        p = weight[self.candidate_ids] / weight[self.candidate_ids].sum()
+        return float(p @ self.propagate(weight=weight, block_size=block_size))
+
+
+def _impact_rows(
+    table: PatternTable,
+    guess_ids: np.ndarray,
+    candidate_ids: np.ndarray,
+    rows: np.ndarray,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> np.ndarray:
+    # The packed rows of the answers candidate_ids[rows]. An answer
+    # eliminates every candidate some guess gives a different outcome.
+    codes = table.lookup(guess_ids=guess_ids, candidate_ids=candidate_ids)
+    bits = np.empty((rows.size, (candidate_ids.size + 7) // 8), dtype=np.uint8)
+    for start in range(0, rows.size, block_size):
+        block = rows[start : start + block_size]
+        eliminated = np.zeros((block.size, candidate_ids.size), dtype=bool)
+        for guess_codes in codes:
+            eliminated |= guess_codes[block, None] != guess_codes[None, :]
+        bits[start : start + block.size] = np.packbits(
+            eliminated, axis=1, bitorder="little"
+        )
+    return bits
+
+
+def impact_matrix(
+    table: PatternTable,
+    guess_ids: np.ndarray,
+    candidate_ids: np.ndarray,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    workers: Optional[int] = None,
+) -> ImpactMatrix:
+    # Which candidates every candidate answer eliminates once all of
+    # guess_ids have been played, computed by blocks of answers, spread over
+    # workers the same way map_guess_chunks spreads guesses.
+    candidate_ids = np.sort(np.asarray(candidate_ids))
+    rows = np.arange(candidate_ids.size)
+    workers = resolve_workers(
+        workers=workers, cells=guess_ids.size * candidate_ids.size**2
     )
-
-    candidate_weights_df = word_weights_df.rename(columns={"word": "candidate"})
-    guess = candidate_weights_df.candidate.rename("guess")
-    other_candidate_weights_df = word_weights_df.rename(
-        columns={"word": "other_candidate"}
+    kwargs = dict(
+        table=table,
+        guess_ids=guess_ids,
+        candidate_ids=candidate_ids,
+        block_size=block_size,
     )
-
-    def find_impacted_candidates(c):
-
-        if not isinstance(c, str):
-            return
-
-        outcome_df = outcome_after_guess(
-            candidate=pd.Series(data=c, name="candidate"),
-            guess=guess,
+    if workers == 1 or rows.size < 2:
+        return ImpactMatrix(
+            bits=_impact_rows(rows=rows, **kwargs), candidate_ids=candidate_ids
         )
 
-        remaing_df = outcome_df.merge(other_candidate_weights_df, how="cross")
-
-        remaing_df["eliminated"] = ~remaining(
-            candidate=remaing_df.other_candidate,
-            outcome=remaing_df.outcome,
-            guess=remaing_df.guess,
+    processes = isinstance(table.codes, np.memmap)
+    futures = [
+        executor(workers=workers, processes=processes).submit(
+            _impact_rows, rows=chunk, **kwargs
         )
+        for chunk in np.array_split(rows, min(workers, rows.size))
+    ]
+    return ImpactMatrix(
+        bits=np.concatenate([future.result() for future in futures]),
+        candidate_ids=candidate_ids,
+    )
+
 
-        return outcome_df.outcome.value_counts()
-
-    _find_impacted_candidates = np.vectorize(find_impacted_candidates)
-
-    # outcomes_df = outcome_after_guess(
-    #     candidate=c,
-    #     guess=guess,
-    # )
-    # return outcomes_df.outcome
-
-    os = candidate_weights_df.candidate.swifter.apply(find_impacted_candidates)
-
-    pass
-
-    # other_candidates = candidate_weights_df.word.rename("other_candidate")
-    #
-    # def _(guess_df: pd.DataFrame):
-    #
-    #     unique_outcome_df = guess_df.groupby("outcome").candidate.unique()
-    #
-    #     df = other_candidates.reset_index().merge(unique_outcome_df, how="cross")
-    #
-    #     r = remaining(candidate=df.other_candidate, guess=df.guess, outcome=df.outcome)
-    #
-    #     surviving = r.mean()
-    #
-    #     remaining_df = df[r]
-    #
-    #     return None
-    #
-    # outcomes = all_outcomes_df.groupby("guess").apply(_)
-
-    pass
+def main():
+    parser = argparse.ArgumentParser(
+        description="The weight each answer eliminates after a set of guesses."
+    )
+    parser.add_argument("guesses", nargs="*", default=["tares"])
+    parser.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    table = pattern_table()
+    weight = word_weights()
+
+    start = time.perf_counter()
+    matrix = impact_matrix(
+        table=table,
+        guess_ids=table.ids(args.guesses),
+        candidate_ids=np.arange(len(table)),
+        block_size=args.block_size,
+        workers=args.workers,
+    )
+    eliminated = matrix.propagate(weight=weight, block_size=args.block_size)
+    seconds = time.perf_counter() - start
+
+    p = weight / weight.sum()
+    top = np.argsort(-eliminated, kind="stable")[: args.top]
+    json.dump(
+        {
+            "guesses": args.guesses,
+            "candidates": len(matrix),
+            "nbytes": matrix.nbytes,
+            "seconds": seconds,
+            "expected_eliminated": float(p @ matrix.counts()),
+            "expected_eliminated_weight": float(p @ eliminated),
+            "most_eliminating": {
+                table.words[matrix.candidate_ids[i]]: eliminated[i] for i in top
+            },
+        },
+        sys.stdout,
+        indent=2,
+    )
+    print()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+from functools import cached_property, lru_cache
+from typing import Dict, Iterable, Optional, Sequence
+
+import numpy as np
+
+from wordleiscious.pattern import WORD_LENGTH, pack
+from wordleiscious.words import all_words
+
+N_LETTERS = 26
+
+
+class Vocabulary:
+    def __init__(self, words: Sequence[str], letters: Optional[np.ndarray] = None):
+        # A word's id is its position in words. Everything below is computed
+        # on first use and indexed by id.
+        self.words = np.array(words, dtype=object)
+        self.index: Dict[str, int] = {word: i for i, word in enumerate(self.words)}
+        lengths = {len(word) for word in self.index}
+        if len(lengths) > 1:
+            raise ValueError(f"Words of more than one length: {sorted(lengths)}")
+        self.word_length = lengths.pop() if lengths else WORD_LENGTH
+        if letters is not None:
+            self.__dict__["letters"] = letters
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.index
+
+    def ids(self, words: Iterable[str]) -> np.ndarray:
+        return np.fromiter((self.index[word] for word in words), dtype=np.int32)
+
+    @cached_property
+    def letters(self) -> np.ndarray:
+        # (N, word_length) uint8, 0 for "a".
+        return pack(self.words)
+
+    @cached_property
+    def letter_counts(self) -> np.ndarray:
+        # (N, 26) uint8, how often each letter occurs in each word.
+        counts = np.zeros((len(self), N_LETTERS), dtype=np.uint8)
+        rows = np.arange(len(self))
+        for position in range(self.letters.shape[1]):
+            counts[rows, self.letters[:, position]] += 1
+        return counts
+
+    @cached_property
+    def letter_masks(self) -> np.ndarray:
+        # (N,) uint32, bit i set when the word has letter chr(ord("a") + i).
+        bits = np.left_shift(np.uint32(1), self.letters, dtype=np.uint32)
+        return np.bitwise_or.reduce(bits, axis=1)
+
+    @cached_property
+    def position_masks(self) -> np.ndarray:
+        # (word_length, 26, N) bool, whether a word has a letter at a position.
+        return (
+            self.letters.T[:, None, :]
+            == np.arange(N_LETTERS, dtype=np.uint8)[None, :, None]
+        )
+
+
+@lru_cache(maxsize=None)
+def vocabulary() -> Vocabulary:
+    # all_words() with its letters mapped from the vocabulary bundle.
+    from wordleiscious.bundle import vocabulary_bundle
+
+    return Vocabulary(words=list(all_words()), letters=vocabulary_bundle()["letters"])
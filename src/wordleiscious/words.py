@@ -1,19 +1,39 @@
-from typing import Iterable, Dict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Dict, List, Optional, Tuple
 from importlib import resources
+import hashlib
 import json
-import pandas as pd
+import os
+import re
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
 DATA_PACKAGE = __package__ + ".data"
 
+# Everything the solvers derive from, so caches built from them can tell when
+# they are out of date.
+DATA_FILES = (
+    "answers.json",
+    "allowed_guesses.json",
+    "weights.json.gzip",
+    "word_frequency.feather",
+)
+
+
+@lru_cache(maxsize=None)
+def _word_list(name: str) -> Tuple[str, ...]:
+    with resources.open_text(DATA_PACKAGE, name) as fp:
+        return tuple(json.load(fp=fp))
+
 
 def answers() -> Iterable[str]:
-    with resources.open_text(DATA_PACKAGE, "answers.json") as fp:
-        yield from json.load(fp=fp)
+    yield from _word_list("answers.json")
 
 
 def allowed_guesses() -> Iterable[str]:
-    with resources.open_text(DATA_PACKAGE, "allowed_guesses.json") as fp:
-        yield from json.load(fp=fp)
+    yield from _word_list("allowed_guesses.json")
 
 
 def all_words() -> Iterable[str]:
@@ -21,11 +41,37 @@ def all_words() -> Iterable[str]:
     yield from allowed_guesses()
 
 
-def word_frequency() -> pd.DataFrame:
-    return pd.read_feather(path=resources.path(DATA_PACKAGE, "word_frequency.feather"))
+def read_word_list(path: os.PathLike, word_length: Optional[int] = None) -> List[str]:
+    # A word list for another game: a json list or one word per line. Words
+    # are lower cased and deduplicated, anything but a-z is dropped, and so
+    # is every word not of word_length letters if it is given.
+    with open(path) as fp:
+        if str(path).endswith(".json"):
+            words = json.load(fp=fp)
+        else:
+            words = fp.read().split()
+    words = [
+        word
+        for word in dict.fromkeys(word.strip().lower() for word in words)
+        if re.fullmatch("[a-z]+", word)
+        and (word_length is None or len(word) == word_length)
+    ]
+    lengths = {len(word) for word in words}
+    if len(lengths) > 1:
+        raise ValueError(f"{path} has words of lengths {sorted(lengths)}")
+    return words
+
+
+def word_frequency() -> "pd.DataFrame":
+    import pandas as pd
+
+    with resources.path(DATA_PACKAGE, "word_frequency.feather") as path:
+        return pd.read_feather(path=path)
 
 
 def process_frequency_file():
+    import pandas as pd
+
     with resources.open_text(DATA_PACKAGE, "unigram_freq.csv") as filepath_or_buffer:
         unigram_freq_df = pd.read_csv(filepath_or_buffer=filepath_or_buffer)
     unigram_freq_df = unigram_freq_df[unigram_freq_df.word.str.len() == 5].reset_index(
@@ -36,7 +82,10 @@ def process_frequency_file():
     )
 
 
-def candidate_weights() -> Dict[str, float]:
+def frequency_weights() -> "np.ndarray":
+    import numpy as np
+    import pandas as pd
+
     frequency_df = word_frequency().set_index("word")
     word_index = pd.Index(data=list(all_words()))
 
@@ -47,7 +96,29 @@ def candidate_weights() -> Dict[str, float]:
     )
     weighted_candidate_df["weight"] /= weighted_candidate_df["weight"].sum()
 
-    return weighted_candidate_df.weight.to_dict()
+    return weighted_candidate_df.weight.to_numpy(dtype=np.float32)
+
+
+def word_weights() -> "np.ndarray":
+    # The weight of every word of all_words(), by id, so also by the ids of
+    # pattern_table(). A read-only view of the bundle: nothing is copied.
+    import numpy as np
+
+    from wordleiscious.bundle import vocabulary_bundle
+
+    return np.asarray(vocabulary_bundle()["weight"])
+
+
+def candidate_weights() -> Dict[str, float]:
+    return dict(zip(all_words(), word_weights().tolist()))
+
+
+@lru_cache(maxsize=None)
+def data_fingerprint() -> str:
+    digest = hashlib.sha1()
+    for name in DATA_FILES:
+        digest.update((resources.files(DATA_PACKAGE) / name).read_bytes())
+    return digest.hexdigest()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,104 @@
+import time
+from typing import Dict, Hashable, Iterable, List, Optional
+
+import numpy as np
+
+from wordleiscious.instrument import stage
+
+
+class WorstCase:
+    def __init__(self, solver, hard_mode: bool = False):
+        # Finds the answers a solver needs the most guesses for. Playing the
+        # solver is depth first, largest buckets first to find long games
+        # early, and skips any bucket that can't beat the longest so far.
+        # That bound relies on every guess leaving fewer candidates, as
+        # the solvers do whenever they may guess the candidates themselves.
+        self.solver = solver
+        self.hard_mode = hard_mode
+        self.guess_ids: Dict[Hashable, int] = {}
+        self.max_guesses = 0
+        self.answer_ids: List[int] = []
+        self.states = 0
+        self.pruned = 0
+        self.seconds = 0.0
+
+    def run(self, solutions: Iterable[str], first_guess: Optional[str] = None):
+        table = self.solver.table
+        start = time.perf_counter()
+        try:
+            self.visit(
+                solver=self.solver,
+                solution_ids=table.ids(solutions),
+                guess_id=(
+                    self.solver.guess_id()
+                    if first_guess is None
+                    else table.index[first_guess]
+                ),
+                turn=1,
+            )
+        finally:
+            self.seconds += time.perf_counter() - start
+        return self
+
+    def visit(self, solver, solution_ids: np.ndarray, guess_id: int, turn: int):
+        # Plays guess_id as guess number turn against every solution left.
+        table = solver.table
+        self.states += 1
+        codes = table.codes[guess_id, solution_ids]
+        if np.any(codes == table.all_green):
+            self.record(turn=turn, answer_ids=[guess_id])
+
+        codes, inverse, counts = np.unique(
+            codes, return_inverse=True, return_counts=True
+        )
+        for i in np.argsort(-counts, kind="stable"):
+            code = int(codes[i])
+            if code == table.all_green:
+                continue
+            child = solver.with_guess_id(
+                guess_id=guess_id, code=code, hard_mode=self.hard_mode
+            )
+            # Each guess rules out at least one candidate, so none of these
+            # answers takes more than one guess per candidate left.
+            if turn + len(child.candidate) < self.max_guesses:
+                self.pruned += 1
+                continue
+            key = (child.candidate, child.allowed_guess if self.hard_mode else None)
+            if key not in self.guess_ids:
+                with stage("worst_case", solver=child):
+                    self.guess_ids[key] = child.guess_id()
+            self.visit(
+                solver=child,
+                solution_ids=solution_ids[inverse.ravel() == i],
+                guess_id=self.guess_ids[key],
+                turn=turn + 1,
+            )
+
+    def record(self, turn: int, answer_ids: List[int]):
+        if turn > self.max_guesses:
+            self.max_guesses, self.answer_ids = turn, []
+        if turn == self.max_guesses:
+            self.answer_ids.extend(answer_ids)
+
+    def report(self) -> dict:
+        table = self.solver.table
+        return {
+            "max_guesses": self.max_guesses,
+            "answers": sorted(table.words[self.answer_ids].tolist()),
+            "states": self.states,
+            "pruned": self.pruned,
+            "seconds": self.seconds,
+        }
+
+
+def worst_case(
+    solver,
+    solutions: Iterable[str],
+    first_guess: Optional[str] = None,
+    hard_mode: bool = False,
+) -> dict:
+    return (
+        WorstCase(solver=solver, hard_mode=hard_mode)
+        .run(solutions=solutions, first_guess=first_guess)
+        .report()
+    )
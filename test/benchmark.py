@@ -0,0 +1,67 @@
+from typing import List
+
+import numpy as np
+import pytest
+from wordleiscious import benchmark
+from wordleiscious.entropy import Solver
+from wordleiscious.pattern_table import PatternTable
+
+
+@pytest.fixture(scope="module")
+def words(sample_answers) -> List[str]:
+    return sample_answers(size=60, seed=6)
+
+
+@pytest.fixture
+def small_strategy(words, monkeypatch):
+    # The benchmark's answers and solver, over a few words only, breaking
+    # ties between guesses the same way every time.
+    table = PatternTable.from_words(words=words + ["tares"])
+    monkeypatch.setattr(benchmark, "answers", lambda: words)
+    monkeypatch.setitem(
+        benchmark.STRATEGIES,
+        "small",
+        lambda: Solver.from_candidates_and_guesses(
+            candidates=words, allowed_guesses=words + ["tares"], table=table
+        ),
+    )
+    monkeypatch.setattr(np.random, "choice", lambda a: a[0])
+    return "small"
+
+
+def test_run_and_run_batch_agree(small_strategy: str):
+    report = benchmark.run(strategy=small_strategy, sample=20, seed=1)
+    batch = benchmark.run_batch(strategy=small_strategy, sample=20, seed=1)
+
+    assert report["guesses"] == batch["guesses"]
+    assert report["per_answer"][0]["answer"] == batch["per_answer"][0]["answer"]
+    assert [a["guesses"] for a in report["per_answer"]] == [
+        a["guesses"] for a in batch["per_answer"]
+    ]
+
+    guesses = report["guesses"]
+    assert report["answers"] == 20
+    assert sum(guesses["distribution"].values()) == 20
+    assert max(guesses["distribution"]) == guesses["max"]
+    assert 0 <= guesses["failure_rate"] <= 1
+    for name in ("per_answer", "per_turn"):
+        seconds = report["seconds"][name]
+        assert 0 <= seconds["p50"] <= seconds["p99"] <= seconds["max"]
+    # A guess is picked for every turn after the first.
+    assert report["seconds"]["stages"]["guess"]["calls"] == sum(
+        a["guesses"] - 1 for a in report["per_answer"]
+    )
+    assert report["book"] is None
+    assert report["peak_rss_mb"] > 0
+
+
+def test_worst_case_matches_run(small_strategy: str):
+    report = benchmark.run(strategy=small_strategy)
+    worst = benchmark.run_worst_case(strategy=small_strategy)["worst_case"]
+
+    assert worst["max_guesses"] == report["guesses"]["max"]
+    assert sorted(worst["answers"]) == sorted(
+        a["answer"]
+        for a in report["per_answer"]
+        if a["guesses"] == report["guesses"]["max"]
+    )
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+from wordleiscious.bitset import Bitset
+
+
+@pytest.mark.parametrize(argnames="size", argvalues=[1, 8, 13, 64, 12972])
+def test_ids_round_trip(size: int):
+    ids = np.random.default_rng(size).choice(size, size=(size + 1) // 2, replace=False)
+    bitset = Bitset.from_ids(ids=ids, size=size)
+
+    np.testing.assert_array_equal(bitset.ids(), np.sort(ids))
+    assert len(bitset) == ids.size
+    assert all(id in bitset for id in ids)
+
+
+def test_set_operations():
+    a = Bitset.from_ids(ids=[0, 3, 9, 10], size=11)
+    b = Bitset.from_ids(ids=[3, 4, 10], size=11)
+
+    assert (a & b).ids().tolist() == [3, 10]
+    assert (a | b).ids().tolist() == [0, 3, 4, 9, 10]
+    assert a.without(9).ids().tolist() == [0, 3, 10]
+    assert a.ids().tolist() == [0, 3, 9, 10]
+
+
+def test_hashable():
+    a = Bitset.from_ids(ids=[1, 2], size=20)
+    b = Bitset.from_ids(ids=[2, 1], size=20)
+
+    assert a == b
+    assert len({a, b, a.without(1)}) == 2
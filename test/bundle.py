@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+import numpy as np
+from wordleiscious.bundle import vocabulary_bundle
+from wordleiscious.pattern import pack
+from wordleiscious.words import (
+    all_words,
+    candidate_weights,
+    frequency_weights,
+    word_weights,
+)
+
+
+def test_vocabulary_bundle_matches_word_files():
+    bundle = vocabulary_bundle()
+    words = list(all_words())
+    assert len(bundle) == len(words)
+    np.testing.assert_array_equal(bundle["letters"], pack(words))
+    np.testing.assert_array_equal(bundle["weight"], frequency_weights())
+    assert list(candidate_weights()) == words
+    assert vocabulary_bundle() is bundle
+
+
+def test_word_weights_are_a_view_of_the_bundle():
+    weight = word_weights()
+    assert weight.dtype == np.float32
+    assert np.shares_memory(weight, vocabulary_bundle())
+    assert not weight.flags.writeable
+    assert list(candidate_weights().values()) == weight.tolist()
+
+
+def test_solvers_import_without_pandas():
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, wordleiscious.entropy, wordleiscious.model;"
+            "assert not {'pandas', 'tqdm', 'colorama'} & set(sys.modules)",
+        ],
+        check=True,
+    )
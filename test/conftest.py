@@ -0,0 +1,38 @@
+from typing import Callable, List
+
+import numpy as np
+import pytest
+from wordleiscious.words import answers
+
+# Few enough to check against brute force, with anagrams, repeated letters and
+# words that differ in a single letter.
+WORDS = [
+    "stare",
+    "tares",
+    "black",
+    "lacks",
+    "zills",
+    "fills",
+    "field",
+    "loser",
+    "eerie",
+    "there",
+    "lolly",
+]
+
+
+@pytest.fixture(scope="module")
+def words() -> List[str]:
+    return list(WORDS)
+
+
+@pytest.fixture(scope="session")
+def sample_answers() -> Callable[[int, int], List[str]]:
+    # sample(size, seed) draws size distinct answers, the same ones for the
+    # same seed. Modules needing more words override words with one.
+    pool = list(answers())
+
+    def sample(size: int, seed: int) -> List[str]:
+        return list(np.random.default_rng(seed).choice(pool, size=size, replace=False))
+
+    return sample
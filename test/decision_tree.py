@@ -0,0 +1,51 @@
+import subprocess
+import sys
+from typing import List
+
+import pytest
+from wordleiscious.decision_tree import build_tree, guesses_needed
+from wordleiscious.entropy import Solver
+from wordleiscious.outcome import scalar_outcome_after_guess
+from wordleiscious.pattern_table import PatternTable
+from wordleiscious.strategy import Strategy
+
+
+@pytest.fixture(scope="module")
+def words(sample_answers) -> List[str]:
+    return sample_answers(size=150, seed=1)
+
+
+def test_strategy_round_trip_plays_every_word(words, tmp_path):
+    table = PatternTable.from_words(words=words)
+    strategy = build_tree(
+        solver=Solver.from_candidates_and_guesses(
+            candidates=words, allowed_guesses=words, table=table
+        ),
+        first_guess=words[0],
+    )
+    strategy.save(path=tmp_path / "strategy.json")
+    loaded = Strategy.load(path=tmp_path / "strategy.json")
+
+    for solution in words:
+        history = []
+        guess = loaded.guess(history=history)
+        while guess != solution:
+            history.append(
+                (guess, scalar_outcome_after_guess(candidate=solution, guess=guess))
+            )
+            guess = loaded.guess(history=history)
+        assert len(history) + 1 == guesses_needed(
+            strategy=strategy, table=table, solution=solution
+        )
+
+
+def test_strategy_module_is_standalone():
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, wordleiscious.strategy;"
+            "assert not {'numpy', 'pandas'} & set(sys.modules)",
+        ],
+        check=True,
+    )
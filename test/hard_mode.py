@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from wordleiscious.entropy import Solver
+from wordleiscious.outcome import scalar_outcome_after_guess
+from wordleiscious.pattern_table import PatternTable
+from wordleiscious.words import all_words
+
+tricky = ["eerie", "there", "geese", "sheep", "lolly", "llama"]
+words = list(
+    np.random.default_rng(7).choice(list(all_words()), size=400, replace=False)
+)
+words = list(dict.fromkeys(words + tricky))
+
+
+def _legal(word: str, guess: str, outcome: str) -> bool:
+    # Brute force over strings: every green letter in place, and for every
+    # letter at least its greens, plus one if it was also yellow.
+    for position, (letter, symbol) in enumerate(zip(guess, outcome)):
+        if symbol == "🟩" and word[position] != letter:
+            return False
+    for letter in set(guess):
+        marks = [symbol for g, symbol in zip(guess, outcome) if g == letter]
+        needed = marks.count("🟩") + ("🟨" in marks)
+        if word.count(letter) < needed:
+            return False
+    return True
+
+
+@pytest.fixture(scope="module")
+def solver() -> Solver:
+    return Solver.from_candidates_and_guesses(
+        candidates=words, allowed_guesses=words, table=PatternTable.from_words(words)
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_brute_force(solver: Solver, seed: int):
+    rng = np.random.default_rng(seed)
+    answer = tricky[seed] if seed % 2 else rng.choice(words)
+    s = solver
+    for guess in rng.choice(words, size=3, replace=False):
+        outcome = scalar_outcome_after_guess(candidate=answer, guess=guess)
+        expected = [
+            word
+            for word in solver.table.words[s.allowed_guess.ids()]
+            if word != guess and _legal(word, guess, outcome)
+        ]
+        s = s.with_guess(guess=guess, outcome=outcome, hard_mode=True)
+        assert solver.table.words[s.allowed_guess.ids()].tolist() == expected
+        # The answer, and anything else still possible, can always be played.
+        assert len(s.candidate & s.allowed_guess) == len(s.candidate)
+        assert answer in solver.table.words[s.allowed_guess.ids()] or answer == guess
@@ -0,0 +1,55 @@
+import json
+import pstats
+from typing import List
+
+import pytest
+from wordleiscious.entropy import Solver
+from wordleiscious.instrument import Recorder, instrument, stage
+from wordleiscious.pattern_table import PatternTable
+from wordleiscious.score_cache import SCORE_CACHE
+
+
+@pytest.fixture(scope="module")
+def words(sample_answers) -> List[str]:
+    return sample_answers(size=80, seed=6)
+
+
+def test_disabled_stages_record_nothing():
+    recorder = Recorder()
+    with stage("outside"):
+        pass
+    assert stage("outside") is stage("elsewhere")
+    assert recorder.events == []
+
+
+def test_records_solver_stages(words, tmp_path):
+    SCORE_CACHE.clear()
+    solver = Solver.from_candidates_and_guesses(
+        candidates=words, allowed_guesses=words, table=PatternTable.from_words(words)
+    )
+    seen = []
+    recorder = Recorder(track_memory=True, callbacks=[seen.append])
+    with instrument(
+        recorder=recorder,
+        trace_path=tmp_path / "trace.json",
+        profile_path=tmp_path / "profile.pstats",
+    ):
+        solver.with_guess(guess=words[0], outcome="⬛⬛⬛⬛⬛").guess()
+
+    assert seen == recorder.events
+    names = [event["name"] for event in recorder.events]
+    assert names.index("consistent") < names.index("with_guess") < names.index("scores")
+    with_guess = recorder.events[names.index("with_guess")]
+    assert (with_guess["candidates"], with_guess["guesses"]) == (80, 80)
+    evaluate = recorder.events[names.index("evaluate")]
+    scores = recorder.events[names.index("scores")]
+    assert evaluate["guesses"] == 79
+    assert scores["seconds"] >= evaluate["seconds"]
+    assert scores["allocated_bytes"] >= evaluate["allocated_bytes"] > 0
+    assert recorder.summary()["scores"]["calls"] == 1
+
+    with open(tmp_path / "trace.json") as fp:
+        trace = json.load(fp)["traceEvents"]
+    assert [event["name"] for event in trace] == names
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in trace)
+    assert pstats.Stats(str(tmp_path / "profile.pstats")).total_calls > 0
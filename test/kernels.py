@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+from wordleiscious import scoring
+from wordleiscious.kernels import KERNEL_ENV, available_kernels, kernel
+from wordleiscious.pattern_table import PatternTable
+
+
+@pytest.fixture(autouse=True)
+def clear_kernel_cache():
+    kernel.cache_clear()
+    yield
+    kernel.cache_clear()
+
+
+def test_kernel_selection(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(KERNEL_ENV, raising=False)
+    assert kernel("numpy") is scoring
+    assert "numpy" in available_kernels()
+    assert kernel().__name__.endswith(
+        "numba_kernel" if "numba" in available_kernels() else "scoring"
+    )
+    with pytest.raises(ValueError):
+        kernel("fortran")
+
+
+def test_kernel_from_environment(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv(KERNEL_ENV, "numpy")
+    assert kernel() is scoring
+
+
+def test_numba_kernel_matches_numpy(words):
+    pytest.importorskip("numba")
+    numba_kernel = kernel("numba")
+    table = PatternTable.from_words(words=words)
+    guess_ids = table.ids(words)
+    weight = np.linspace(0.5, 2.0, len(words))
+    for candidate_ids in (table.ids(words), table.ids(["black", "fills"])):
+        np.testing.assert_allclose(
+            numba_kernel.entropy_scores(
+                table=table, guess_ids=guess_ids, candidate_ids=candidate_ids
+            ),
+            scoring.entropy_scores(
+                table=table, guess_ids=guess_ids, candidate_ids=candidate_ids
+            ),
+        )
+        np.testing.assert_array_equal(
+            numba_kernel.largest_bucket_scores(
+                table=table, guess_ids=guess_ids, candidate_ids=candidate_ids
+            ),
+            scoring.largest_bucket_scores(
+                table=table, guess_ids=guess_ids, candidate_ids=candidate_ids
+            ),
+        )
+        np.testing.assert_allclose(
+            numba_kernel.eliminated_weight_scores(
+                table=table,
+                guess_ids=guess_ids,
+                candidate_ids=candidate_ids,
+                weight=weight,
+            ),
+            scoring.eliminated_weight_scores(
+                table=table,
+                guess_ids=guess_ids,
+                candidate_ids=candidate_ids,
+                weight=weight,
+            ),
+        )
+        np.testing.assert_allclose(
+            numba_kernel.entropy_scores(
+                table=table,
+                guess_ids=guess_ids,
+                candidate_ids=candidate_ids,
+                weight=weight,
+            ),
+            scoring.entropy_scores(
+                table=table,
+                guess_ids=guess_ids,
+                candidate_ids=candidate_ids,
+                weight=weight,
+            ),
+        )
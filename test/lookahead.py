@@ -0,0 +1,78 @@
+from typing import List
+
+import numpy as np
+import pytest
+from wordleiscious.entropy import Lookahead, Solver
+from wordleiscious.pattern import N_PATTERNS, decode
+from wordleiscious.pattern_table import PatternTable
+
+
+@pytest.fixture(scope="module")
+def words(sample_answers) -> List[str]:
+    return sample_answers(size=120, seed=3)
+
+
+def _information(solver: Solver, guess_id: int, depth: int) -> float:
+    # Exhaustive: every guess at every depth, no pruning.
+    table = solver.table
+    counts = np.bincount(
+        table.codes[guess_id, solver.candidate.ids()], minlength=N_PATTERNS
+    )
+    p = counts[counts > 0] / counts.sum()
+    information = -(p * np.log2(p)).sum()
+    if depth == 1:
+        return information
+    for code in np.flatnonzero(counts > 1):
+        child = solver.with_guess(guess=table.words[guess_id], outcome=decode(code))
+        information += (
+            counts[code]
+            / counts.sum()
+            * max(
+                _information(child, reply_id, depth - 1)
+                for reply_id in child.allowed_guess.ids()
+            )
+        )
+    return information
+
+
+@pytest.fixture(scope="module")
+def solver(words) -> Solver:
+    table = PatternTable.from_words(words=words)
+    solver = Solver.from_candidates_and_guesses(
+        candidates=words, allowed_guesses=words, table=table
+    )
+    return solver.with_guess(guess=words[0], outcome="⬛⬛⬛⬛⬛")
+
+
+@pytest.mark.parametrize("top_k", [3, 20])
+def test_pruned_ranking_matches_exhaustive(solver: Solver, top_k: int):
+    lookahead = Lookahead(depth=2, top_k=top_k)
+    guess_ids, information = lookahead.rank(solver=solver, depth=2)
+    exhaustive = np.array(
+        [_information(solver, guess_id, depth=2) for guess_id in guess_ids]
+    )
+
+    # Pruned guesses report an upper bound below the best, the rest are exact.
+    best = exhaustive.max()
+    assert information.max() == pytest.approx(best)
+    kept = information >= best - 1e-9
+    np.testing.assert_allclose(information[kept], exhaustive[kept])
+    assert np.all(information[~kept] >= exhaustive[~kept] - 1e-9)
+    assert lookahead.states > 1
+
+
+def test_depth_one_is_greedy(solver: Solver):
+    scores = solver.scores()
+    greedy = set(solver.allowed_guess.ids()[scores == scores.max()].tolist())
+    lookahead = Lookahead(depth=1)
+    assert set(lookahead.best_guess_ids(solver=solver).tolist()) == greedy
+
+    lookahead = Lookahead(depth=2, top_k=5)
+    looking_ahead = Solver(
+        candidate=solver.candidate,
+        allowed_guess=solver.allowed_guess,
+        table=solver.table,
+        lookahead=lookahead,
+    )
+    best = set(lookahead.best_guess_ids(solver=looking_ahead).tolist())
+    assert solver.table.index[looking_ahead.guess()] in best
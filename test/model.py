@@ -0,0 +1,159 @@
+import numpy as np
+import pandas as pd
+import pytest
+from wordleiscious.kernels import KERNEL_ENV, kernel
+from wordleiscious.model import Solver
+from wordleiscious.outcome import outcome_after_guess, remaining
+from wordleiscious.partition_index import PartitionIndex
+from wordleiscious.pattern_table import PatternTable
+from wordleiscious.scoring import eliminated_weight_scores
+from wordleiscious.words import all_words
+
+
+def _cross_merge_scores(candidate_weight: pd.Series, guess: pd.Series) -> pd.Series:
+    # The original expected-eliminated-weight scoring, kept as the reference.
+    outcome_df = outcome_after_guess(
+        candidate=candidate_weight.index.to_series().rename("candidate"),
+        guess=guess,
+    )
+
+    unique_candidate_and_outcome_counts_df = (
+        outcome_df.groupby(["guess", "outcome"]).size().rename("count").reset_index()
+    )
+
+    c_df = candidate_weight.reset_index().rename(columns={"index": "candidate"})
+
+    weighted_outcome_df = unique_candidate_and_outcome_counts_df.merge(
+        c_df, how="cross"
+    )
+
+    weighted_outcome_df["remaining"] = remaining(
+        candidate=weighted_outcome_df.candidate,
+        outcome=weighted_outcome_df.outcome,
+        guess=weighted_outcome_df.guess,
+    )
+
+    weighted_outcome_df["guess_score_contribution"] = (
+        weighted_outcome_df["count"]
+        * weighted_outcome_df.weight
+        * (1 - weighted_outcome_df.remaining.astype(float))
+    )
+
+    return (
+        weighted_outcome_df.groupby("guess")
+        .guess_score_contribution.sum()
+        .rename("score")
+    )
+
+
+@pytest.mark.parametrize(argnames="seed", argvalues=[0, 1, 2])
+def test_scores_match_cross_merge(seed: int):
+    rng = np.random.default_rng(seed)
+    words = list(rng.choice(list(all_words()), size=120, replace=False))
+    candidate_weights = dict(zip(words[:60], rng.random(60) / 60))
+
+    s = Solver.from_weights_and_guesses(
+        candidate_weights=candidate_weights,
+        allowed_guesses=words,
+        table=PatternTable.from_words(words=words),
+    )
+
+    expected = _cross_merge_scores(
+        candidate_weight=pd.Series(name="weight", data=candidate_weights),
+        guess=pd.Series(name="guess", data=words),
+    )
+
+    pd.testing.assert_series_equal(
+        s.evaluate_guesses().sort_index(),
+        expected.sort_index(),
+        check_index_type=False,
+    )
+
+
+def test_two_candidates_guess_one_of_them():
+    rng = np.random.default_rng(3)
+    words = list(rng.choice(list(all_words()), size=120, replace=False))
+    s = Solver.from_weights_and_guesses(
+        candidate_weights={words[7]: 0.3, words[50]: 0.7},
+        allowed_guesses=words,
+        table=PatternTable.from_words(words=words),
+    )
+
+    scores = s.evaluate_guesses(prune=False)
+    guess = s.guess()
+    assert guess in (words[7], words[50])
+    assert scores[guess] == scores.max()
+
+
+def test_word_weights_are_used_as_is():
+    rng = np.random.default_rng(4)
+    words = list(rng.choice(list(all_words()), size=120, replace=False))
+    table = PatternTable.from_words(words=words)
+    weight = np.zeros(len(table), dtype=np.float32)
+    weight[:60] = rng.random(60)
+
+    s = Solver.from_word_weights(weight=weight, allowed_guesses=words, table=table)
+    expected = Solver.from_weights_and_guesses(
+        candidate_weights=dict(zip(words[:60], weight[:60])),
+        allowed_guesses=words,
+        table=table,
+    )
+    assert s.weight is weight
+    assert s.with_guess(guess=words[0], outcome="⬛⬛⬛⬛⬛").weight is weight
+    assert s.candidate == expected.candidate
+    np.testing.assert_array_equal(s.scores(), expected.scores())
+    with pytest.raises(ValueError):
+        Solver.from_word_weights(weight=weight[:-1], allowed_guesses=words, table=table)
+
+
+def test_evaluate_matches_cross_merge():
+    rng = np.random.default_rng(5)
+    words = list(rng.choice(list(all_words()), size=120, replace=False))
+    candidate_weight = pd.Series(
+        name="weight", index=words[:60], data=rng.random(60) / 60
+    )
+    guess = pd.Series(name="guess", data=words)
+    expected = _cross_merge_scores(candidate_weight=candidate_weight, guess=guess)
+
+    for evaluated in (
+        Solver.evaluate(candidate_weight=candidate_weight, guess=guess),
+        Solver.evaluate(
+            candidate_weight=candidate_weight,
+            guess=guess,
+            table=PatternTable.from_words(words=words),
+        ),
+    ):
+        pd.testing.assert_series_equal(evaluated, expected, check_index_type=False)
+
+
+def test_every_word_a_candidate_scores_from_the_index(monkeypatch: pytest.MonkeyPatch):
+    rng = np.random.default_rng(6)
+    words = list(rng.choice(list(all_words()), size=120, replace=False))
+    table = PatternTable.from_words(words=words)
+    weight = rng.random(len(table)).astype(np.float32) + 0.01
+    s = Solver.from_word_weights(weight=weight, allowed_guesses=words, table=table)
+
+    calls = []
+    index_scores = PartitionIndex.eliminated_weight_scores
+    monkeypatch.setattr(
+        PartitionIndex,
+        "eliminated_weight_scores",
+        lambda self, **kwargs: calls.append(kwargs) or index_scores(self, **kwargs),
+    )
+    monkeypatch.setenv(KERNEL_ENV, "numpy")
+    kernel.cache_clear()
+    try:
+        scores = s.scores()
+    finally:
+        kernel.cache_clear()
+
+    assert len(calls) == 1
+    np.testing.assert_array_equal(
+        scores,
+        eliminated_weight_scores(
+            table=table,
+            guess_ids=s.allowed_guess.ids(),
+            candidate_ids=s.candidate.ids(),
+            weight=weight,
+        ),
+    )
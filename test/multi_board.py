@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from wordleiscious.entropy import Solver
+from wordleiscious.multi_board import MultiBoardSolver
+from wordleiscious.outcome import scalar_outcome_after_guess
+from wordleiscious.scoring import entropy
+
+
+def test_joint_entropy(words):
+    single = Solver.from_candidates_and_guesses(candidates=words, allowed_guesses=words)
+    solver = MultiBoardSolver(boards=[single, single], table=single.table).with_guess(
+        guess="stare", outcomes=["⬛🟨⬛🟩🟩", "🟨⬛⬛⬛⬛"]
+    )
+    table = solver.table
+    first, second = (board.candidate.ids() for board in solver.boards)
+    guess_ids = solver.boards[0].allowed_guess.ids()
+    # Every pair of answers, and the pair of outcomes each guess gets on them.
+    joint = (
+        table.codes[guess_ids][:, first, None].astype(int) * table.n_patterns
+        + table.codes[guess_ids][:, None, second]
+    ).reshape(guess_ids.size, -1)
+    histograms = np.stack(
+        [np.bincount(row, minlength=table.n_patterns**2) for row in joint]
+    )
+    np.testing.assert_allclose(solver.scores(), entropy(histograms))
+
+
+def test_solves_every_board(words):
+    np.random.seed(0)
+    solver = MultiBoardSolver.from_candidates_and_guesses(
+        candidates=words, allowed_guesses=words, n_boards=4
+    )
+    solutions = ["fills", "there", "lolly", "tares"]
+    for _ in range(len(words)):
+        guess = solver.guess()
+        solver = solver.with_guess(
+            guess=guess,
+            outcomes=[
+                (
+                    None
+                    if board is None
+                    else scalar_outcome_after_guess(candidate=solution, guess=guess)
+                )
+                for board, solution in zip(solver.boards, solutions)
+            ],
+        )
+        if solver.solved:
+            break
+    assert solver.solved
+
+
+def test_unsolved_board_without_an_outcome(words):
+    single = Solver.from_candidates_and_guesses(candidates=words, allowed_guesses=words)
+    solver = MultiBoardSolver(boards=[single, None, single], table=single.table)
+    with pytest.raises(ValueError, match="Board 2"):
+        solver.with_guess(guess="stare", outcomes=["⬛🟨⬛🟩🟩", None, None])
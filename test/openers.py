@@ -0,0 +1,150 @@
+import json
+from typing import List
+
+import numpy as np
+import pytest
+from wordleiscious import benchmark, openers
+from wordleiscious.entropy import Solver
+from wordleiscious.pattern_table import PatternTable
+from wordleiscious.simulate import simulate
+
+
+@pytest.fixture(scope="module")
+def words(sample_answers) -> List[str]:
+    return sample_answers(size=60, seed=3)
+
+
+def _small_strategy(words, monkeypatch):
+    monkeypatch.setitem(
+        benchmark.STRATEGIES,
+        "small",
+        lambda: Solver.from_candidates_and_guesses(
+            candidates=words,
+            allowed_guesses=words,
+            table=PatternTable.from_words(words=words),
+        ),
+    )
+    openers._solver.cache_clear()
+    monkeypatch.setattr(np.random, "choice", lambda a: a[0])
+
+
+def test_search_ranks_every_opening(words, monkeypatch, tmp_path):
+    _small_strategy(words, monkeypatch)
+    path = tmp_path / "openers.jsonl"
+    ranked = openers.search(
+        strategy="small", path=path, solutions=words, top_k=1, workers=1
+    )
+
+    assert len(ranked) == 2 * len(words)
+    assert [tuple(r["opening"]) for r in ranked] == [
+        tuple(r["opening"]) for r in openers.rank(ranked)
+    ]
+    best = min(r["mean"] for r in ranked if r["failures"] == 0)
+    assert ranked[0]["mean"] == best
+    single = [r for r in ranked if len(r["opening"]) == 1][0]
+    guesses = simulate(
+        solver=openers._solver("small", False),
+        solutions=words,
+        first_guess=single["opening"][0],
+    )
+    assert single["mean"] == guesses.mean()
+    assert sum(single["distribution"].values()) == len(words)
+
+
+def test_search_resumes_from_checkpoint(words, monkeypatch, tmp_path):
+    _small_strategy(words, monkeypatch)
+    path = tmp_path / "openers.jsonl"
+    first = openers.search(
+        strategy="small", path=path, solutions=words, limit=5, workers=1
+    )
+    # A run killed mid-write leaves half a record behind.
+    with open(path, "a") as fp:
+        fp.write('{"opening": ["')
+
+    evaluated = []
+    evaluate = openers.evaluate_opening
+    monkeypatch.setattr(
+        openers,
+        "evaluate_opening",
+        lambda opening, **kwargs: evaluated.append(opening)
+        or evaluate(opening=opening, **kwargs),
+    )
+    second = openers.search(
+        strategy="small", path=path, solutions=words, limit=8, workers=1
+    )
+
+    assert len(evaluated) == 3
+    assert {tuple(r["opening"]) for r in first} < {tuple(r["opening"]) for r in second}
+    assert len(second) == 8
+    fingerprint = json.loads(open(path).readline())["fingerprint"]
+    assert openers.load_results(path=path, fingerprint=fingerprint) == {
+        tuple(r["opening"]): r for r in second
+    }
+
+
+def test_search_resumes_pairs_in_the_workers(words, monkeypatch, tmp_path):
+    _small_strategy(words, monkeypatch)
+    path = tmp_path / "openers.jsonl"
+    first = openers.search(
+        strategy="small", path=path, solutions=words, limit=3, top_k=2, workers=1
+    )
+    # Lose the last pair of the last first guess written.
+    lines = open(path).readlines()
+    with open(path, "w") as fp:
+        fp.writelines(lines[:-1])
+
+    evaluated = []
+    evaluate = openers.evaluate_opening
+    monkeypatch.setattr(
+        openers,
+        "evaluate_opening",
+        lambda opening, **kwargs: evaluated.append(opening)
+        or evaluate(opening=opening, **kwargs),
+    )
+    second = openers.search(
+        strategy="small", path=path, solutions=words, limit=3, top_k=2, workers=1
+    )
+
+    assert len(first) == 9
+    assert evaluated == [tuple(json.loads(lines[-1])["opening"])]
+    assert [(r["opening"], r["mean"]) for r in second] == [
+        (r["opening"], r["mean"]) for r in first
+    ]
+
+
+def test_checkpoint_of_another_search_is_dropped(words, monkeypatch, tmp_path):
+    _small_strategy(words, monkeypatch)
+    path = tmp_path / "openers.jsonl"
+    openers.search(strategy="small", path=path, solutions=words, limit=2, workers=1)
+    ranked = openers.search(
+        strategy="small", path=path, solutions=words[:30], limit=1, workers=1
+    )
+
+    assert len(ranked) == 1
+    with open(path) as fp:
+        assert len(fp.readlines()) == 2
+    assert json.loads(open(path).readline())["fingerprint"]
+
+
+def test_best_opener_only_from_a_search_for_the_solver(words, monkeypatch, tmp_path):
+    _small_strategy(words, monkeypatch)
+    path = tmp_path / "openers.jsonl"
+    ranked = openers.search(
+        strategy="small", path=path, solutions=words, limit=3, workers=1
+    )
+    solver = openers._solver("small", False)
+
+    def best_opener(**kwargs) -> str:
+        return openers.best_opener(
+            strategy="small", path=path, solutions=words, default="none", **kwargs
+        )
+
+    assert best_opener(solver=solver) == ranked[0]["opening"][0]
+    assert best_opener(solver=solver, hard_mode=True) == "none"
+    assert best_opener(solver=solver.with_guess(words[0], "⬛⬛⬛⬛⬛")) == "none"
+    assert (
+        openers.best_opener(
+            solver=solver, strategy="small", path=tmp_path / "missing.jsonl"
+        )
+        == "tares"
+    )
@@ -0,0 +1,48 @@
+from typing import List
+
+import pytest
+from wordleiscious.entropy import Solver
+from wordleiscious.opening_book import OpeningBook
+from wordleiscious.outcome import scalar_outcome_after_guess
+from wordleiscious.pattern_table import PatternTable
+
+
+@pytest.fixture(scope="module")
+def words(sample_answers) -> List[str]:
+    return sample_answers(size=80, seed=0)
+
+
+def _solver(candidates, words) -> Solver:
+    return Solver.from_candidates_and_guesses(
+        candidates=candidates,
+        allowed_guesses=words,
+        table=PatternTable.from_words(words=words),
+    )
+
+
+def test_warmed_book_covers_every_game(words):
+    book = OpeningBook(solver=_solver(words, words))
+    book.warm(first_guess=words[0], depth=4)
+    book.hits = book.misses = 0
+
+    for solution in words:
+        s = book.solver
+        history = []
+        guess = book.guess(solver=s, history=history, hard_mode=False)
+        while guess != solution:
+            outcome = scalar_outcome_after_guess(candidate=solution, guess=guess)
+            s = s.with_guess(guess=guess, outcome=outcome)
+            history.append((guess, outcome))
+            guess = book.guess(solver=s, history=history, hard_mode=False)
+
+    assert book.misses == 0
+
+
+def test_saved_book_is_dropped_for_another_solver(words, tmp_path):
+    path = tmp_path / "book.json"
+    book = OpeningBook(solver=_solver(words, words), path=path)
+    book.warm(first_guess=words[0], depth=1)
+    book.save()
+
+    assert OpeningBook(solver=_solver(words, words), path=path).entries == book.entries
+    assert not OpeningBook(solver=_solver(words[:40], words), path=path).entries
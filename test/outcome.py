@@ -1,29 +1,57 @@
+import numpy as np
 import pandas as pd
 import pytest
 from wordleiscious.outcome import (
+    outcome_after_guess,
     scalar_outcome_after_guess,
     remaining,
     outcome,
 )
+from wordleiscious.pattern import (
+    _as_code_points,
+    encode,
+    encode_all,
+    pack,
+    pattern_codes,
+    remaining_mask,
+)
+from wordleiscious.pattern_table import PatternTable
+
+scalar_cases = [
+    ("tares", "stare", "🟨🟨🟨🟨🟨"),
+    ("black", "lacks", "⬛🟨🟨🟨🟨"),
+    ("lacks", "black", "🟨🟨🟨🟨⬛"),
+    ("fills", "zills", "⬛🟩🟩🟩🟩"),
+    ("field", "fills", "🟩🟩⬛🟩⬛"),
+    ("loser", "fills", "🟨⬛🟨⬛⬛"),
+    ("lills", "fills", "⬛🟩🟩🟩🟩"),
+    ("eerie", "there", "🟨🟨🟨⬛🟩"),
+]
 
 
 @pytest.mark.parametrize(
     argnames=["guess", "candidate", "expected_outcome"],
-    argvalues=[
-        ("tares", "stare", "🟨🟨🟨🟨🟨"),
-        ("black", "lacks", "⬛🟨🟨🟨🟨"),
-        ("lacks", "black", "🟨🟨🟨🟨⬛"),
-        ("fills", "zills", "⬛🟩🟩🟩🟩"),
-        ("field", "fills", "🟩🟩⬛🟩⬛"),
-        ("loser", "fills", "🟨⬛🟨⬛⬛"),
-        ("lills", "fills", "⬛🟩🟩🟩🟩"),
-    ],
+    argvalues=scalar_cases,
 )
 def test_scalar_outcome(guess: str, candidate: str, expected_outcome: str):
     outcome = scalar_outcome_after_guess(candidate=candidate, guess=guess)
     assert outcome == expected_outcome
 
 
+@pytest.mark.parametrize(
+    argnames=["guess", "candidate", "expected_outcome"],
+    argvalues=scalar_cases,
+)
+def test_pattern_codes(guess: str, candidate: str, expected_outcome: str):
+    code = pattern_codes(guess=pack([guess]), candidate=pack([candidate]))
+    assert code[0] == encode(expected_outcome)
+    assert remaining_mask(
+        candidate=pack([candidate, guess]),
+        guess=pack([guess]),
+        code=encode(expected_outcome),
+    ).tolist() == [True, expected_outcome == "🟩🟩🟩🟩🟩"]
+
+
 @pytest.mark.parametrize(
     argnames=["candidate_and_guess_df", "expected_outcome"],
     argvalues=[
@@ -91,6 +119,7 @@ def test_outcome(candidate_and_guess_df, expected_outcome: pd.Series):
                     "zills",
                     "fills",
                     "fills",
+                    "taser",
                 ],
             ),
             pd.Series(
@@ -110,6 +139,7 @@ def test_outcome(candidate_and_guess_df, expected_outcome: pd.Series):
                     "field",
                     "loser",
                     "lills",
+                    "tares",
                 ],
             ),
             pd.Series(
@@ -129,6 +159,7 @@ def test_outcome(candidate_and_guess_df, expected_outcome: pd.Series):
                     "🟩🟩⬛🟩⬛",
                     "🟨⬛🟨⬛⬛",
                     "⬛🟩🟩🟩🟩",
+                    "🟨🟨🟨🟨🟨",
                 ],
             ),
             pd.Series(
@@ -148,6 +179,7 @@ def test_outcome(candidate_and_guess_df, expected_outcome: pd.Series):
                     False,
                     True,
                     True,
+                    False,
                 ],
             ),
         )
@@ -161,3 +193,41 @@ def test_remaining(
 ):
     actual_remaining = remaining(candidate=candidate, guess=guess, outcome=outcome)
     pd.testing.assert_series_equal(actual_remaining, expected_remaining)
+
+
+def test_strings_pack_the_same_way():
+    words = [guess for guess, _, _ in scalar_cases]
+    expected = np.array([[ord(c) - ord("a") for c in word] for word in words])
+    for strings in (
+        words,
+        tuple(words),
+        np.array(words, dtype=object),
+        np.array(words),
+        pd.Series(words, dtype=object),
+        pd.Series(words, dtype="string[pyarrow]"),
+        pd.Series(words, dtype="string[pyarrow]").iloc[2:],
+    ):
+        values = strings.values if isinstance(strings, pd.Series) else strings
+        np.testing.assert_array_equal(pack(values), expected[-len(values) :])
+
+    outcomes = [outcome for _, _, outcome in scalar_cases]
+    for strings in (outcomes, pd.Series(outcomes, dtype="string[pyarrow]").values):
+        assert encode_all(strings).tolist() == [encode(o) for o in outcomes]
+    # Words of other lengths are padded as before.
+    np.testing.assert_array_equal(
+        _as_code_points(["ab", "abc"]), [[97, 98, 0], [97, 98, 99]]
+    )
+
+
+@pytest.mark.parametrize(argnames="dtype", argvalues=[object, "string[pyarrow]"])
+def test_outcome_after_guess_packs_each_word_once(dtype):
+    words = [guess for guess, _, _ in scalar_cases]
+    candidate = pd.Series(name="candidate", data=words, dtype=dtype)
+    guess = pd.Series(name="guess", data=words[:4], dtype=dtype)
+
+    expected = outcome(pd.merge(candidate, guess, how="cross"))
+    pd.testing.assert_frame_equal(outcome_after_guess(candidate, guess), expected)
+    pd.testing.assert_frame_equal(
+        outcome_after_guess(candidate, guess, table=PatternTable.from_words(words)),
+        expected,
+    )
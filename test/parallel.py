@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from wordleiscious.parallel import (
+    PARALLEL_THRESHOLD,
+    executor,
+    map_guess_chunks,
+    resolve_workers,
+)
+from wordleiscious.pattern_table import PatternTable
+from wordleiscious.scoring import entropy_scores
+
+
+@pytest.mark.parametrize(argnames="workers", argvalues=[2, 3, 20])
+def test_map_guess_chunks_keeps_guess_order(words, workers: int):
+    table = PatternTable.from_words(words=words)
+    guess_ids = np.arange(len(words))[::-1]
+    candidate_ids = np.arange(len(words))
+
+    np.testing.assert_array_equal(
+        np.concatenate(
+            map_guess_chunks(
+                evaluate=entropy_scores,
+                table=table,
+                guess_ids=guess_ids,
+                n_candidates=candidate_ids.size,
+                workers=workers,
+                candidate_ids=candidate_ids,
+            )
+        ),
+        entropy_scores(table=table, guess_ids=guess_ids, candidate_ids=candidate_ids),
+    )
+
+
+def test_small_problems_stay_serial():
+    assert resolve_workers(workers=None, cells=100) == 1
+    assert resolve_workers(workers=4, cells=100) == 4
+
+
+def _resolved_workers(cells: int) -> int:
+    return resolve_workers(workers=None, cells=cells)
+
+
+def test_pool_workers_stay_serial():
+    # Otherwise a worker would ask for a pool of its own, and if forked
+    # get back its parent's, which it can't use.
+    pool = executor(workers=2, processes=True)
+    cells = 2 * PARALLEL_THRESHOLD
+    assert pool.submit(_resolved_workers, cells).result(timeout=60) == 1
+    assert executor(workers=2, processes=True) is pool
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+from wordleiscious import partition_index
+from wordleiscious.bitset import Bitset
+from wordleiscious.pattern_table import PatternTable
+from wordleiscious.scoring import (
+    eliminated_weight_scores,
+    entropy_scores,
+    largest_bucket_scores,
+)
+
+
+@pytest.fixture
+def table(words) -> PatternTable:
+    return PatternTable.from_words(words=words)
+
+
+def test_buckets(words, table: PatternTable):
+    index = partition_index.build_partition_index(codes=table.codes, chunk_size=3)
+    candidate = Bitset.from_ids(ids=[0, 2, 3, 5, 9], size=len(table))
+    weight = np.linspace(1, 2, len(words))
+    for guess_id in range(len(table)):
+        row = table.codes[guess_id]
+        codes, sizes = index.bucket_sizes(guess_id)
+        np.testing.assert_array_equal(codes, np.unique(row))
+        np.testing.assert_array_equal(sizes, np.bincount(row)[codes])
+        _, sizes = index.bucket_sizes(guess_id, candidate=candidate)
+        np.testing.assert_array_equal(
+            sizes, np.bincount(row, weights=candidate.mask())[codes]
+        )
+        _, sums = index.bucket_sums(guess_id, weight=weight, candidate=candidate)
+        np.testing.assert_allclose(
+            sums, np.bincount(row, weights=weight * candidate.mask())[codes]
+        )
+        for code in range(table.n_patterns):
+            np.testing.assert_array_equal(
+                index.bucket(guess_id, code), np.flatnonzero(row == code)
+            )
+            assert index.surviving(
+                guess_id, code, candidate=candidate
+            ) == candidate & table.consistent(guess_id, code)
+
+
+def test_all_candidate_scores(words, table: PatternTable):
+    guess_ids = np.arange(len(table))[::-1]
+    candidate_ids = np.arange(len(table))
+    weight = np.linspace(1, 2, len(words))
+    np.testing.assert_allclose(
+        table.partitions.entropy_scores(guess_ids=guess_ids),
+        entropy_scores(table=table, guess_ids=guess_ids, candidate_ids=candidate_ids),
+    )
+    np.testing.assert_array_equal(
+        table.partitions.largest_bucket_scores(guess_ids=guess_ids),
+        largest_bucket_scores(
+            table=table, guess_ids=guess_ids, candidate_ids=candidate_ids
+        ),
+    )
+    np.testing.assert_allclose(
+        table.partitions.eliminated_weight_scores(
+            guess_ids=guess_ids, weight=weight, chunk_size=4
+        ),
+        eliminated_weight_scores(
+            table=table,
+            guess_ids=guess_ids,
+            candidate_ids=candidate_ids,
+            weight=weight,
+        ),
+    )
+
+
+def test_stored_index(
+    words, table: PatternTable, tmp_path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(
+        partition_index,
+        "partition_index_paths",
+        lambda words: (tmp_path / "index.npy", tmp_path / "index.npz"),
+    )
+    built = partition_index.load_partition_index(words=words, codes=table.codes)
+    loaded = partition_index.load_partition_index(words=words, codes=table.codes)
+    assert isinstance(np.load(tmp_path / "index.npy", mmap_mode="r"), np.memmap)
+    for name in ("ids", "bucket_rows", "bucket_codes", "bucket_starts"):
+        np.testing.assert_array_equal(getattr(built, name), getattr(loaded, name))
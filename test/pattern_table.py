@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+from wordleiscious.outcome import outcome_after_guess, remaining
+from wordleiscious.pattern import code_dtype, decode, decode_all, encode
+from wordleiscious.pattern_table import PatternTable, build_pattern_table
+
+
+@pytest.fixture
+def table(words) -> PatternTable:
+    return PatternTable(words=words, codes=build_pattern_table(words=words))
+
+
+@pytest.mark.parametrize(
+    argnames="outcome",
+    argvalues=["⬛⬛⬛⬛⬛", "🟩🟩🟩🟩🟩", "🟨⬛🟨⬛⬛", "⬛🟩🟩🟩🟩"],
+)
+def test_encode_decode(outcome: str):
+    assert decode(encode(outcome)) == outcome
+
+
+def test_outcome_lookup(words, table: PatternTable):
+    candidate = pd.Series(name="candidate", data=words)
+    guess = pd.Series(name="guess", data=words[::-1])
+
+    pd.testing.assert_frame_equal(
+        outcome_after_guess(candidate=candidate, guess=guess, table=table),
+        outcome_after_guess(candidate=candidate, guess=guess),
+    )
+
+
+def test_remaining_lookup(words, table: PatternTable):
+    cross_df = outcome_after_guess(
+        candidate=pd.Series(name="candidate", data=words),
+        guess=pd.Series(name="guess", data=words),
+    )
+    candidate = cross_df.candidate.sample(frac=1, random_state=0)
+    candidate.index = cross_df.index
+
+    pd.testing.assert_series_equal(
+        remaining(
+            candidate=candidate,
+            guess=cross_df.guess,
+            outcome=cross_df.outcome,
+            table=table,
+        ),
+        remaining(
+            candidate=candidate,
+            guess=cross_df.guess,
+            outcome=cross_df.outcome,
+        ),
+    )
+
+
+def _reference_outcome(guess: str, candidate: str) -> str:
+    not_green = {c for g, c in zip(guess, candidate) if g != c}
+    return "".join(
+        "🟩" if g == c else "🟨" if g in not_green else "⬛"
+        for g, c in zip(guess, candidate)
+    )
+
+
+@pytest.mark.parametrize(argnames="word_length", argvalues=[4, 6, 8])
+def test_other_word_lengths(word_length: int):
+    rng = np.random.default_rng(word_length)
+    other_words = list(
+        dict.fromkeys(
+            "".join(rng.choice(list("aeilnorst"), size=word_length)) for _ in range(40)
+        )
+    )
+    table = PatternTable.from_words(words=other_words)
+    assert table.codes.dtype == code_dtype(word_length)
+    assert table.all_green == 3**word_length - 1
+    assert (np.diag(table.codes) == table.all_green).all()
+    for i, guess in enumerate(other_words):
+        expected = [_reference_outcome(guess, candidate) for candidate in other_words]
+        assert decode_all(table.codes[i], n=word_length).tolist() == expected
+        assert [encode(outcome) for outcome in expected] == table.codes[i].tolist()
@@ -0,0 +1,77 @@
+from typing import List
+
+import numpy as np
+import pytest
+from wordleiscious import entropy, model
+from wordleiscious.pattern_table import PatternTable
+from wordleiscious.score_cache import SCORE_CACHE, ScoreCache
+
+
+@pytest.fixture(scope="module")
+def words(sample_answers) -> List[str]:
+    return sample_answers(size=100, seed=4)
+
+
+def test_evicts_least_recently_used_by_size():
+    cache = ScoreCache(maxbytes=3 * 8 * 10)
+    for key in "abc":
+        cache.put(key, np.zeros(10))
+    assert cache.get("a") is not None
+    cache.put("d", np.zeros(10))
+    assert list(cache.entries) == ["c", "a", "d"]
+    assert cache.nbytes == 3 * 8 * 10
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    computed = []
+    scores = cache.scores("e", compute=lambda: computed.append(1) or np.ones(10))
+    assert not scores.flags.writeable
+    assert cache.scores("e", compute=lambda: computed.append(1)) is scores
+    assert len(computed) == 1
+
+
+def test_shared_across_solver_instances(words):
+    SCORE_CACHE.clear()
+    table = PatternTable.from_words(words=words)
+    guess, outcome = words[0], "⬛⬛⬛⬛⬛"
+
+    def entropy_solver():
+        return entropy.Solver.from_candidates_and_guesses(
+            candidates=words, allowed_guesses=words, table=table
+        ).with_guess(guess=guess, outcome=outcome)
+
+    def model_solver(weight: float):
+        return model.Solver.from_weights_and_guesses(
+            candidate_weights={word: weight for word in words},
+            allowed_guesses=words,
+            table=table,
+        ).with_guess(guess=guess, outcome=outcome)
+
+    scores = entropy_solver().scores()
+    assert entropy_solver().scores() is scores
+    assert (SCORE_CACHE.hits, SCORE_CACHE.misses) == (1, 1)
+
+    model_solver(weight=1.0).scores()
+    model_solver(weight=1.0).scores()
+    model_solver(weight=2.0).scores()
+    assert (SCORE_CACHE.hits, SCORE_CACHE.misses) == (2, 3)
+
+
+def test_weighted_entropy_cached_apart(words):
+    SCORE_CACHE.clear()
+    table = PatternTable.from_words(words=words)
+
+    def entropy_solver(weight: float):
+        return entropy.Solver.from_word_weights(
+            weight=np.full(len(table), weight, dtype=np.float32),
+            allowed_guesses=words,
+            table=table,
+        ).with_guess(guess=words[0], outcome="⬛⬛⬛⬛⬛")
+
+    uniform = entropy.Solver.from_candidates_and_guesses(
+        candidates=words, allowed_guesses=words, table=table
+    ).with_guess(guess=words[0], outcome="⬛⬛⬛⬛⬛")
+    np.testing.assert_allclose(entropy_solver(weight=1.0).scores(), uniform.scores())
+    entropy_solver(weight=1.0).scores()
+    entropy_solver(weight=2.0).scores()
+    assert (SCORE_CACHE.hits, SCORE_CACHE.misses) == (1, 3)
@@ -0,0 +1,188 @@
+import numpy as np
+import pandas as pd
+import pytest
+from wordleiscious.entropy import Solver
+from wordleiscious.outcome import outcome_after_guess
+from wordleiscious.pattern_table import PatternTable
+from wordleiscious.scoring import (
+    eliminated_weight_scores,
+    entropy_scores,
+    largest_bucket_scores,
+    pattern_histograms,
+    pruned_scores,
+)
+
+
+@pytest.fixture
+def table(words) -> PatternTable:
+    return PatternTable.from_words(words=words)
+
+
+def _ensemble_entropy(outcome: pd.Series) -> float:
+    outcome_prob = outcome.value_counts()
+    outcome_prob /= outcome_prob.sum()
+    return (-outcome_prob * np.log2(outcome_prob)).sum()
+
+
+@pytest.mark.parametrize(argnames="tile_size", argvalues=[1, 7, 2**18])
+def test_entropy_scores(words, table: PatternTable, tile_size: int):
+    candidate_ids = np.array([0, 2, 3, 5, 6, 9, 10])
+    guess_ids = np.arange(len(words))
+
+    expected = (
+        outcome_after_guess(
+            candidate=pd.Series(name="candidate", data=table.words[candidate_ids]),
+            guess=pd.Series(name="guess", data=words),
+        )
+        .groupby("guess", sort=False)
+        .outcome.apply(_ensemble_entropy)
+    )
+
+    np.testing.assert_allclose(
+        entropy_scores(
+            table=table,
+            guess_ids=guess_ids,
+            candidate_ids=candidate_ids,
+            tile_size=tile_size,
+        ),
+        expected.values,
+    )
+
+
+@pytest.mark.parametrize(argnames="tile_size", argvalues=[1, 7, 2**18])
+def test_weighted_entropy_scores(words, table: PatternTable, tile_size: int):
+    candidate_ids = np.array([0, 2, 3, 5, 6, 9, 10])
+    guess_ids = np.arange(len(words))
+    weight = np.linspace(1, 3, len(words), dtype=np.float32)
+
+    expected = []
+    for guess_id in guess_ids:
+        codes = table.codes[guess_id, candidate_ids]
+        p = np.bincount(codes, weights=weight[candidate_ids])
+        p = p[p > 0] / p.sum()
+        expected.append(-(p * np.log2(p)).sum())
+
+    np.testing.assert_allclose(
+        entropy_scores(
+            table=table,
+            guess_ids=guess_ids,
+            candidate_ids=candidate_ids,
+            tile_size=tile_size,
+            weight=weight,
+        ),
+        expected,
+    )
+    # Equal weights are the same as none.
+    np.testing.assert_allclose(
+        entropy_scores(
+            table=table,
+            guess_ids=guess_ids,
+            candidate_ids=candidate_ids,
+            weight=np.full(len(words), 0.25),
+        ),
+        entropy_scores(table=table, guess_ids=guess_ids, candidate_ids=candidate_ids),
+    )
+
+
+@pytest.mark.parametrize(argnames="tile_size", argvalues=[1, 7, 2**18])
+def test_largest_bucket_scores(words, table: PatternTable, tile_size: int):
+    candidate_ids = np.array([0, 2, 3, 5, 6, 9, 10])
+    guess_ids = np.arange(len(words))
+
+    expected = (
+        outcome_after_guess(
+            candidate=pd.Series(name="candidate", data=table.words[candidate_ids]),
+            guess=pd.Series(name="guess", data=words),
+        )
+        .groupby("guess", sort=False)
+        .outcome.apply(lambda outcome: outcome.value_counts().max())
+    )
+
+    np.testing.assert_array_equal(
+        largest_bucket_scores(
+            table=table,
+            guess_ids=guess_ids,
+            candidate_ids=candidate_ids,
+            tile_size=tile_size,
+        ),
+        expected.values,
+    )
+
+
+def test_weighted_histograms():
+    codes = np.array([[0, 0, 242, 5], [1, 2, 1, 1]], dtype=np.uint8)
+    histograms = pattern_histograms(codes=codes, weights=np.array([1, 2, 3, 4.0]))
+
+    assert histograms.shape == (2, 243)
+    assert histograms[0, [0, 5, 242]].tolist() == [3, 4, 3]
+    assert histograms[1, [1, 2]].tolist() == [8, 2]
+
+
+@pytest.mark.parametrize(
+    argnames="candidate_ids", argvalues=[[2], [4, 5], [0, 1, 7], [8, 9, 10]]
+)
+def test_pruned_scores_match_full_scan(words, table: PatternTable, candidate_ids):
+    # "black" and "lolly" share no letter with "zills"/"fills" and so on,
+    # "stare" and "tares" often have identical columns.
+    candidate_ids = np.array(candidate_ids)
+    guess_ids = np.arange(len(words))
+    weight = np.linspace(1, 2, len(words))
+
+    np.testing.assert_array_equal(
+        pruned_scores(
+            evaluate=entropy_scores,
+            table=table,
+            guess_ids=guess_ids,
+            candidate_ids=candidate_ids,
+        ),
+        entropy_scores(table=table, guess_ids=guess_ids, candidate_ids=candidate_ids),
+    )
+    np.testing.assert_array_equal(
+        pruned_scores(
+            evaluate=eliminated_weight_scores,
+            table=table,
+            guess_ids=guess_ids,
+            candidate_ids=candidate_ids,
+            weight=weight,
+        ),
+        eliminated_weight_scores(
+            table=table,
+            guess_ids=guess_ids,
+            candidate_ids=candidate_ids,
+            weight=weight,
+        ),
+    )
+
+
+def test_pruned_scores_with_wide_codes():
+    # Seven letters take two bytes per code.
+    long_words = ["quordle", "octordl", "sedecor", "quartet", "dordles", "tordles"]
+    table = PatternTable.from_words(words=long_words)
+    guess_ids = np.arange(len(long_words))
+    candidate_ids = np.array([1, 4, 5])
+    np.testing.assert_array_equal(
+        pruned_scores(
+            evaluate=entropy_scores,
+            table=table,
+            guess_ids=guess_ids,
+            candidate_ids=candidate_ids,
+        ),
+        entropy_scores(table=table, guess_ids=guess_ids, candidate_ids=candidate_ids),
+    )
+
+
+def test_entropy_solver_evaluate(words, table: PatternTable):
+    candidate = pd.Series(name="candidate", data=words[:7])
+    guess = pd.Series(name="guess", data=words)
+    expected = (
+        outcome_after_guess(candidate=candidate, guess=guess)
+        .groupby("guess")
+        .outcome.apply(_ensemble_entropy)
+        .rename("entropy")
+    )
+
+    for evaluated in (
+        Solver.evaluate(candidate=candidate, guess=guess),
+        Solver.evaluate(candidate=candidate, guess=guess, table=table),
+    ):
+        pd.testing.assert_series_equal(evaluated, expected, check_index_type=False)
@@ -0,0 +1,84 @@
+import asyncio
+import json
+from typing import List
+
+import pytest
+from wordleiscious.entropy import Solver
+from wordleiscious.outcome import scalar_outcome_after_guess
+from wordleiscious.pattern_table import PatternTable
+from wordleiscious.service import SolverService, request_guess
+
+
+@pytest.fixture(scope="module")
+def words(sample_answers) -> List[str]:
+    return sample_answers(size=150, seed=5)
+
+
+def test_concurrent_requests_share_a_batch(words):
+    solver = Solver.from_candidates_and_guesses(
+        candidates=words, allowed_guesses=words, table=PatternTable.from_words(words)
+    )
+    service = SolverService(solver=solver, first_guess=words[0], batch_window=0.05)
+    histories = [
+        [(words[0], scalar_outcome_after_guess(candidate=solution, guess=words[0]))]
+        for solution in words[1:41]
+    ]
+
+    async def run():
+        server = await service.serve(port=0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await asyncio.gather(
+                request_guess(history=[], port=port),
+                *(request_guess(history=history, port=port) for history in histories),
+                request_guess(history=[["zzzzz", "⬛⬛⬛⬛⬛"]], port=port),
+                request_guess(history=[[words[0], "🟩"]], port=port),
+            )
+
+    first, *responses, unknown_word, short_outcome = asyncio.run(run())
+
+    assert first == (200, {"guess": words[0]})
+    for history, (status, response) in zip(histories, responses):
+        s = solver.with_guess(*history[0])
+        scores = s.evaluate_guesses()
+        assert status == 200
+        assert scores[response["guess"]] == scores.max() or len(s.candidate) <= 2
+    assert unknown_word[0] == 400 and short_outcome[0] == 400
+
+    assert service.requests == len(histories) + 3
+    assert service.batches == 1
+    assert service.states == len({tuple(history) for history in histories})
+
+
+@pytest.mark.parametrize(
+    "request_bytes",
+    [
+        b"garbage\r\n\r\n",
+        b"POST /guess HTTP/1.1\r\nContent-Length: many\r\n\r\n",
+        b"POST /guess HTTP/1.1\r\nContent-Length: -1\r\n\r\n",
+        b"POST /guess HTTP/1.1\r\nContent-Length: 10\r\n\r\n{}",
+        b"\xff\xfe /guess HTTP/1.1\r\n\r\n",
+    ],
+)
+def test_malformed_request_is_a_bad_request(words, request_bytes):
+    solver = Solver.from_candidates_and_guesses(
+        candidates=words[:10], allowed_guesses=words[:10]
+    )
+    service = SolverService(solver=solver, first_guess=words[0])
+
+    async def run():
+        server = await service.serve(port=0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection(port=port)
+            writer.write(request_bytes)
+            if request_bytes.endswith(b"{}"):
+                writer.write_eof()
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            return response
+
+    status_line, _, body = asyncio.run(run()).partition(b"\r\n")
+    assert status_line == b"HTTP/1.1 400 Bad Request"
+    assert "Malformed request" in json.loads(body.partition(b"\r\n\r\n")[2])["error"]
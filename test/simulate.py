@@ -0,0 +1,64 @@
+from typing import List
+
+import numpy as np
+import pytest
+from wordleiscious.decision_tree import build_tree, guesses_needed
+from wordleiscious.entropy import Solver
+from wordleiscious.outcome import scalar_outcome_after_guess
+from wordleiscious.pattern_table import PatternTable
+from wordleiscious.simulate import simulate
+
+
+@pytest.fixture(scope="module")
+def words(sample_answers) -> List[str]:
+    return sample_answers(size=200, seed=2)
+
+
+@pytest.mark.parametrize("hard_mode", [False, True])
+def test_simulate_matches_decision_tree(words, monkeypatch, hard_mode: bool):
+    # Break ties the same way however often and in whichever order guesses
+    # are made, and count how many states are evaluated.
+    monkeypatch.setattr(np.random, "choice", lambda a: a[0])
+    evaluated = []
+    guess = Solver.guess
+    monkeypatch.setattr(Solver, "guess", lambda s: evaluated.append(s) or guess(s))
+
+    solver = Solver.from_candidates_and_guesses(
+        candidates=words,
+        allowed_guesses=words + ["tares"],
+        table=PatternTable.from_words(words + ["tares"]),
+    )
+    strategy = build_tree(solver=solver, first_guess="tares", hard_mode=hard_mode)
+    evaluated.clear()
+
+    n_guesses = simulate(
+        solver=solver, solutions=words, first_guess="tares", hard_mode=hard_mode
+    )
+    assert n_guesses.tolist() == [
+        guesses_needed(strategy=strategy, table=solver.table, solution=solution)
+        for solution in words
+    ]
+    assert len(evaluated) < len(strategy.guesses)
+
+
+def test_simulate_plays_the_second_guess(words, monkeypatch):
+    monkeypatch.setattr(np.random, "choice", lambda a: a[0])
+    solver = Solver.from_candidates_and_guesses(
+        candidates=words,
+        allowed_guesses=words + ["tares", "doily"],
+        table=PatternTable.from_words(words + ["tares", "doily"]),
+    )
+    n_guesses = simulate(
+        solver=solver, solutions=words, first_guess="tares", second_guess="doily"
+    )
+
+    expected = []
+    for solution in words:
+        s, guess, turn = solver, "tares", 1
+        while guess != solution:
+            outcome = scalar_outcome_after_guess(candidate=solution, guess=guess)
+            s = s.with_guess(guess=guess, outcome=outcome)
+            turn += 1
+            guess = "doily" if turn == 2 and len(s.candidate) > 1 else s.guess()
+        expected.append(turn)
+    assert n_guesses.tolist() == expected
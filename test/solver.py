@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from wordleiscious import entropy, minimax, model
+from wordleiscious.bitset import Bitset
+from wordleiscious.kernels import kernel
+from wordleiscious.outcome import scalar_outcome_after_guess
+from wordleiscious.pattern import encode
+from wordleiscious.pattern_table import PatternTable
+
+
+def _solvers(table: PatternTable):
+    everything = Bitset.from_ids(ids=np.arange(len(table)), size=len(table))
+    weight = np.linspace(1.0, 2.0, len(table))
+    return [
+        entropy.Solver(candidate=everything, allowed_guess=everything, table=table),
+        entropy.Solver(
+            candidate=everything, allowed_guess=everything, table=table, weight=weight
+        ),
+        model.Solver(
+            candidate=everything, allowed_guess=everything, weight=weight, table=table
+        ),
+        minimax.Solver(candidate=everything, allowed_guess=everything, table=table),
+    ]
+
+
+@pytest.mark.parametrize("i", range(4))
+def test_every_word_a_candidate_scores_as_the_kernel(words, i):
+    table = PatternTable.from_words(words)
+    solver = _solvers(table)[i]
+    ids = np.arange(len(table))
+    weight = {} if solver.weight is None else {"weight": solver.weight}
+    expected = getattr(kernel(), solver.kernel_scores)(
+        table=table, guess_ids=ids, candidate_ids=ids, **weight
+    )
+    np.testing.assert_allclose(solver.scores(), expected)
+
+
+def test_with_guess_id_keeps_the_strategy_and_what_it_shares(words):
+    table = PatternTable.from_words(words)
+    lookahead = entropy.Lookahead(depth=2, top_k=2)
+    solver = entropy.Solver.from_candidates_and_guesses(
+        candidates=words, allowed_guesses=words, table=table, lookahead=lookahead
+    )
+    child = solver.with_guess(
+        guess="stare",
+        outcome=scalar_outcome_after_guess(candidate="tares", guess="stare"),
+    )
+    assert type(child) is entropy.Solver
+    assert child.lookahead is lookahead and child.table is table
+    assert list(table.words[child.candidate.ids()]) == ["tares"]
+    assert len(solver.candidate) == len(words)
+
+    weighted = _solvers(table)[2].with_guess_id(
+        guess_id=np.int64(0), code=np.uint8(encode("⬛⬛⬛⬛⬛"))
+    )
+    assert type(weighted) is model.Solver
+    assert weighted.weight_digest == _solvers(table)[2].weight_digest
+
+
+def test_best_guesses_follow_the_direction_of_the_score(words):
+    table = PatternTable.from_words(words)
+    for solver in _solvers(table):
+        best = solver.best_guesses()
+        scores = solver.evaluate_guesses()
+        target = scores.min() if solver.lower_is_better else scores.max()
+        assert (best[solver.score_name] == target).all()
+        assert len(best) == (scores == target).sum()
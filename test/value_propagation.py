@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from wordleiscious.outcome import scalar_outcome_after_guess
+from wordleiscious.pattern_table import PatternTable
+from wordleiscious.value_propagation import impact_matrix
+
+
+@pytest.mark.parametrize(argnames="workers", argvalues=[1, 3])
+@pytest.mark.parametrize(argnames="guesses", argvalues=[["stare"], ["black", "eerie"]])
+def test_impact_matrix(words, guesses, workers: int):
+    table = PatternTable.from_words(words=words)
+    candidate_ids = table.ids(words[1:])[::-1]
+    matrix = impact_matrix(
+        table=table,
+        guess_ids=table.ids(guesses),
+        candidate_ids=candidate_ids,
+        block_size=4,
+        workers=workers,
+    )
+    weight = np.linspace(1, 2, len(words))
+
+    expected = np.array(
+        [
+            [
+                any(
+                    scalar_outcome_after_guess(candidate=answer, guess=guess)
+                    != scalar_outcome_after_guess(candidate=other, guess=guess)
+                    for guess in guesses
+                )
+                for other in table.words[matrix.candidate_ids]
+            ]
+            for answer in table.words[matrix.candidate_ids]
+        ]
+    )
+    np.testing.assert_array_equal(matrix.mask(), expected)
+    np.testing.assert_array_equal(matrix.counts(), expected.sum(axis=1))
+    np.testing.assert_allclose(
+        matrix.propagate(weight=weight, block_size=3),
+        expected @ weight[matrix.candidate_ids],
+    )
+    there = matrix.candidate_ids.tolist().index(table.index["there"])
+    np.testing.assert_array_equal(
+        matrix.eliminated_ids(table.index["there"]),
+        matrix.candidate_ids[expected[there]],
+    )
@@ -0,0 +1,54 @@
+import json
+
+import numpy as np
+import pytest
+from wordleiscious.pattern import pack
+from wordleiscious.pattern_table import pattern_table
+from wordleiscious.vocabulary import Vocabulary, vocabulary
+from wordleiscious.words import all_words, read_word_list
+
+words = ["eerie", "there", "lolly", "tares", "zills"]
+
+
+def test_precomputed_letters():
+    v = Vocabulary(words=words)
+    assert v.ids(["lolly", "eerie"]).tolist() == [2, 0]
+    assert v.words[v.ids(words)].tolist() == words
+    np.testing.assert_array_equal(v.letters, pack(words))
+
+    for i, word in enumerate(words):
+        for letter in range(26):
+            char = chr(ord("a") + letter)
+            assert v.letter_counts[i, letter] == word.count(char)
+            assert bool(v.letter_masks[i] >> letter & 1) == (char in word)
+            for position in range(5):
+                assert v.position_masks[position, letter, i] == (word[position] == char)
+
+    # Shifted in uint32 whatever numpy makes of uint32 << uint8.
+    assert v.letter_masks.dtype == np.uint32
+    assert v.letter_masks[words.index("zills")] & 1 << 25
+
+
+def test_shared_vocabulary():
+    v = vocabulary()
+    assert v.words.tolist() == list(all_words())
+    assert isinstance(v.letters, np.memmap)
+    assert pattern_table().vocabulary is v
+
+
+def test_word_length():
+    assert Vocabulary(words=["quordle", "octordl"]).word_length == 7
+    with pytest.raises(ValueError):
+        Vocabulary(words=["tares", "quordle"])
+
+
+def test_read_word_list(tmp_path):
+    text_path = tmp_path / "words.txt"
+    text_path.write_text("Quordle\noctordl\nquordle\ndon't\nshort\n")
+    assert read_word_list(text_path, word_length=7) == ["quordle", "octordl"]
+    with pytest.raises(ValueError):
+        read_word_list(text_path)
+
+    json_path = tmp_path / "words.json"
+    json_path.write_text(json.dumps(["tares", "STARE"]))
+    assert read_word_list(json_path) == ["tares", "stare"]
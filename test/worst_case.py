@@ -0,0 +1,61 @@
+from typing import List
+
+import numpy as np
+import pytest
+from wordleiscious import entropy, minimax
+from wordleiscious.outcome import scalar_outcome_after_guess
+from wordleiscious.worst_case import WorstCase
+
+
+@pytest.fixture(scope="module")
+def words(words) -> List[str]:
+    # More words ending in "ills", which take the most guesses to tell apart.
+    return words + ["hills", "pills", "kills", "lolls"]
+
+
+def _guesses_needed(words, analysis: WorstCase, solution: str, first_guess: str) -> int:
+    # Replays the analyzer's own choices. States it pruned are guessed
+    # afresh, which may differ, but can't take as many guesses either way.
+    solver, guess = analysis.solver, first_guess
+    for turn in range(1, len(words) + 1):
+        outcome = scalar_outcome_after_guess(candidate=solution, guess=guess)
+        if outcome == "🟩🟩🟩🟩🟩":
+            return turn
+        solver = solver.with_guess(guess=guess, outcome=outcome)
+        guess_id = analysis.guess_ids.get((solver.candidate, None))
+        guess = solver.table.words[solver.guess_id() if guess_id is None else guess_id]
+    raise RuntimeError(f"{solution} was never solved")
+
+
+def test_minimax_guess(words):
+    solver = minimax.Solver.from_candidates_and_guesses(
+        candidates=words, allowed_guesses=words
+    )
+    scores = solver.scores(prune=False)
+    assert solver.table.words[solver.guess_id()] in words
+    assert (
+        scores.min()
+        == solver.scores()[solver.allowed_guess.ids().tolist().index(solver.guess_id())]
+    )
+
+
+@pytest.mark.parametrize(argnames="module", argvalues=[entropy, minimax])
+def test_worst_case_answers(words, module):
+    np.random.seed(0)
+    solver = module.Solver.from_candidates_and_guesses(
+        candidates=words, allowed_guesses=words
+    )
+    analysis = WorstCase(solver=solver).run(solutions=words, first_guess="stare")
+    report = analysis.report()
+    assert report["pruned"] > 0
+
+    counts = {
+        solution: _guesses_needed(
+            words=words, analysis=analysis, solution=solution, first_guess="stare"
+        )
+        for solution in words
+    }
+    assert report["max_guesses"] == max(counts.values())
+    assert report["answers"] == sorted(
+        solution for solution, n in counts.items() if n == report["max_guesses"]
+    )